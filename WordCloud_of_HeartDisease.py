@@ -1,21 +1,22 @@
-import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 from wordcloud import WordCloud
-from PIL import Image
 
-pubmed_title = pd.read_csv("pubmed_title.csv")
-pubmed_title.head()
+from wordcloud_render import prepare_mask    # 💡 이진화된 마스크 (.npy 캐시)
+from pubmed_titles import count_title_tokens, read_pubmed_chunks    # 💡 스트리밍 제목 토큰화
+
+# 💡 str(list(...))로 거대한 문자열을 만드는 대신, 필요한 컬럼만 청크 단위로 읽어 단어 빈도를 바로 누적
+title_counts = count_title_tokens(read_pubmed_chunks("pubmed_title.csv"))
+print(f"제목 {title_counts.n_titles}개, 고유 단어 {len(title_counts.total)}개")
 
 plt.figure(figsize=(10, 5))
 
-text = str(list(pubmed_title['Title']))
-mask = np.array(Image.open('image.jpg'))
+mask = prepare_mask('image.jpg')
 cmap = plt.matplotlib.colors.LinearSegmentedColormap.from_list("", ['#000066','#003399', '#00FFFF'])
 
 
 wordcloud = WordCloud(background_color = 'white', width = 2500,  height = 1400,
-                      max_words = 170, mask = mask, colormap=cmap).generate(text)
+                      max_words = 170, mask = mask, colormap=cmap).generate_from_frequencies(
+                          title_counts.frequencies())
 
 
 plt.imshow(wordcloud)
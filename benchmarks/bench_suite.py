@@ -0,0 +1,251 @@
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+# 💡 benchmarks/ 폴더에서 실행해도 상위 폴더의 모듈을 불러올 수 있도록 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import numpy as np
+import pandas as pd
+
+import keyword_index
+from count_cube import CountCube, HEART_CUBE_DIMS, TARGET_COLUMN
+from data_quality import HEART_COLUMN_SENTINELS, profile_csv
+from netflix_analysis import CUSTOM_STOP_WORDS, analyze_word_frequency, engineer_korea_features, load_and_filter_data
+from pubmed_titles import JOURNAL_COLUMN, YEAR_COLUMN, count_title_tokens, read_pubmed_chunks
+from synthetic_data import DATA_DIR, synthetic_csv, synthetic_rows
+from table_schema import load_heart
+from wordcloud_render import LAYOUT_CACHE_DIR, prepare_mask
+
+# --- 상수 정의 ---
+DEFAULT_SCALES = [1, 10]    # 100, 1000배는 --scales로 명시 (1000배 넷플릭스 ≈ 880만 행)
+REPEAT = 3
+THRESHOLD = 0.2    # --compare 시 20% 이상 느려진 단계를 회귀로 표시
+MASK_FILE = os.path.join(ROOT_DIR, 'netflix_logo.jpg')
+WORDCLOUD_SCRIPT = os.path.join(ROOT_DIR, 'netflix_wordcloud(6장).py')
+FILTER_KEYWORD = 'Korea'
+FILTER_COLUMNS = ['description', 'title', 'listed_in']
+
+
+def _load_script(path: str, name: str):
+    """파일 이름에 괄호·한글이 있는 스크립트를 모듈로 불러옵니다. (__main__ 블록은 실행되지 않음)"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(func, repeat: int = REPEAT, setup=None) -> tuple[dict, object]:
+    """
+    func를 repeat번 실행해 (최소/중앙값 소요 시간, tracemalloc 메모리 peak)와 마지막 결과를 반환합니다.
+    시간은 tracemalloc 없이 재고, 메모리는 별도의 한 번 실행에서 잽니다. (tracemalloc 자체의 오버헤드 제외)
+    setup은 매 실행 전에 호출됩니다. (예: 캐시 삭제)
+    """
+    seconds = []
+    result = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        seconds.append(time.perf_counter() - start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = {
+        'repeat': repeat,
+        'seconds_min': round(min(seconds), 6),
+        'seconds_median': round(statistics.median(seconds), 6),
+        'peak_mb': round(peak / 1024 ** 2, 3),
+    }
+    return stats, result
+
+
+def _clear_netflix_caches(csv_path: str) -> None:
+    """Parquet 사이드카·키워드 색인 파일과 프로세스 내 색인 메모를 지워 '처음 실행' 상태로 만듭니다."""
+    for suffix in ('.parquet', '.meta.json', '.kwindex.npz'):
+        if os.path.exists(csv_path + suffix):
+            os.remove(csv_path + suffix)
+    keyword_index._INDEX_MEMO.clear()
+
+
+def _clear_layout_cache() -> None:
+    shutil.rmtree(LAYOUT_CACHE_DIR, ignore_errors=True)
+
+
+def bench_netflix(scale: int, repeat: int, data_dir: str) -> list[dict]:
+    path = synthetic_csv('netflix', scale, data_dir)
+    script = _load_script(WORDCLOUD_SCRIPT, 'netflix_wordcloud_6')
+    stages = []
+
+    def load():
+        return load_and_filter_data(path, FILTER_KEYWORD, FILTER_COLUMNS)
+
+    stats, _ = measure(load, 1, setup=lambda: _clear_netflix_caches(path))
+    stages.append({'stage': 'load_and_filter_data (cold cache)', **stats})
+    stats, filtered = measure(load, repeat)
+    stages.append({'stage': 'load_and_filter_data (warm cache)', 'rows_out': len(filtered), **stats})
+
+    stats, _ = measure(lambda: engineer_korea_features(filtered.copy(), 'description', 'listed_in'), repeat)
+    stages.append({'stage': 'engineer_korea_features', **stats})
+
+    stats, text = measure(
+        lambda: script.preprocess_text_for_wordcloud(filtered, 'description', script.DEFAULT_STOPWORDS), repeat
+    )
+    stages.append({'stage': 'preprocess_text_for_wordcloud', **stats})
+
+    stats, (word_df, _) = measure(lambda: analyze_word_frequency(filtered, 'description', CUSTOM_STOP_WORDS), repeat)
+    stages.append({'stage': 'analyze_word_frequency', 'vocab_size': len(word_df), **stats})
+
+    # 워드 클라우드 배치는 배치 캐시를 매번 지워 실제 계산 비용을 잼 (빈도 상위 170단어라 규모와 거의 무관)
+    mask = prepare_mask(MASK_FILE) if os.path.exists(MASK_FILE) else None
+    stats, _ = measure(
+        lambda: script.generate_wordcloud_object(text, mask, script.DEFAULT_STOPWORDS), 1, setup=_clear_layout_cache
+    )
+    stages.append({'stage': 'generate_wordcloud_object (no layout cache)', **stats})
+    return stages
+
+
+def bench_pubmed(scale: int, repeat: int, data_dir: str) -> list[dict]:
+    path = synthetic_csv('pubmed', scale, data_dir)
+    stats, counts = measure(
+        lambda: count_title_tokens(read_pubmed_chunks(path), group_cols=[YEAR_COLUMN, JOURNAL_COLUMN]), repeat
+    )
+    return [{'stage': 'count_title_tokens (year, journal)', 'vocab_size': len(counts.total), **stats}]
+
+
+def _groupby_proportions(heart: pd.DataFrame) -> dict[str, pd.Series]:
+    """기존 방식: 차원마다 groupby().size() → groupby(level=0).apply(lambda)"""
+    return {
+        dim: heart.groupby([TARGET_COLUMN, dim]).size().groupby(level=0).apply(lambda x: x / x.sum() * 100)
+        for dim in HEART_CUBE_DIMS if dim != TARGET_COLUMN
+    }
+
+
+def bench_heart(scale: int, repeat: int, data_dir: str) -> list[dict]:
+    path = synthetic_csv('heart', scale, data_dir)
+    stages = []
+    stats, raw = measure(lambda: pd.read_csv(path), repeat)
+    stages.append({'stage': 'read_csv (default dtypes)', **stats})
+    stats, typed = measure(lambda: load_heart(path), repeat)
+    stages.append({'stage': 'load_heart (schema dtypes)', **stats})
+    stats, _ = measure(lambda: profile_csv(path, column_sentinels=HEART_COLUMN_SENTINELS), repeat)
+    stages.append({'stage': 'profile_csv', **stats})
+    stats, _ = measure(lambda: _groupby_proportions(raw), repeat)
+    stages.append({'stage': 'groupby/apply proportions (all dims)', **stats})
+    stats, _ = measure(lambda: CountCube.build(typed).pairwise(), repeat)
+    stages.append({'stage': 'count cube build + pairwise', **stats})
+    return stages
+
+
+BENCHMARKS = {'netflix': bench_netflix, 'pubmed': bench_pubmed, 'heart': bench_heart}
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(datasets: list[str], scales: list[int], repeat: int = REPEAT, data_dir: str = DATA_DIR) -> dict:
+    """데이터셋 × 규모별로 단계를 측정해 JSON으로 저장할 수 있는 보고서 딕셔너리를 반환합니다."""
+    data_dir = os.path.abspath(data_dir)
+    results = []
+    workdir = tempfile.mkdtemp(prefix='bench_')
+    cwd = os.getcwd()
+    os.chdir(workdir)    # 💡 워드 클라우드 배치 캐시 등 상대 경로 캐시가 저장소를 더럽히지 않도록
+    try:
+        for scale in scales:
+            for name in datasets:
+                print(f"--- {name} ×{scale} ---")
+                rows = synthetic_rows(name, scale)
+                for stage in BENCHMARKS[name](scale, repeat, data_dir):
+                    record = {'dataset': name, 'scale': scale, 'rows': rows, **stage}
+                    results.append(record)
+                    print(f"{stage['stage']:<45} {stage['seconds_min']:10.4f}초  peak {stage['peak_mb']:9.1f} MB")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'git_commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float = THRESHOLD) -> list[dict]:
+    """두 보고서의 같은 (데이터셋, 규모, 단계) 최소 시간을 비교해, threshold 이상 느려진 단계 목록을 반환합니다."""
+    def key(record: dict) -> tuple:
+        return record['dataset'], record['scale'], record['stage']
+
+    old = {key(record): record for record in baseline['results']}
+    regressions = []
+    for record in current['results']:
+        before = old.get(key(record))
+        if before is None or before['seconds_min'] == 0:
+            continue
+        ratio = record['seconds_min'] / before['seconds_min']
+        marker = '🚨' if ratio > 1 + threshold else '  '
+        print(f"{marker} {record['dataset']:<8} ×{record['scale']:<5} {record['stage']:<45} "
+              f"{before['seconds_min']:9.4f} → {record['seconds_min']:9.4f}초 ({ratio:5.2f}배)")
+        if ratio > 1 + threshold:
+            regressions.append({**record, 'baseline_seconds_min': before['seconds_min'], 'ratio': round(ratio, 3)})
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='합성 데이터 규모별 단계 벤치마크 (JSON 보고서)')
+    parser.add_argument('--datasets', nargs='+', default=list(BENCHMARKS), choices=list(BENCHMARKS))
+    parser.add_argument('--scales', nargs='+', type=int, default=DEFAULT_SCALES, help='예: 1 10 100 1000')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--data-dir', default=DATA_DIR, help='합성 CSV 저장 폴더 (재사용)')
+    parser.add_argument('--output', default='bench_report.json', help='JSON 보고서 경로')
+    parser.add_argument('--compare', default=None, help='비교할 이전 JSON 보고서 (회귀 시 종료 코드 1)')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.datasets, args.scales, args.repeat, args.data_dir)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"✅ 보고서 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, args.threshold)
+        if regressions:
+            print(f"🚨 {len(regressions)}개 단계가 {args.threshold:.0%} 이상 느려졌습니다.")
+            return 1
+        print("✅ 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+from collections import Counter
+
+# 💡 benchmarks/ 폴더에서 실행해도 상위 폴더의 모듈을 불러올 수 있도록 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import pandas as pd
+from sklearn.feature_extraction.text import CountVectorizer
+
+from fast_tokenizer import count_tokens, tokenize
+from text_resources import CLEAN_REGEX, TOKEN_PATTERN, get_stopword_list
+
+# --- 상수 정의 ---
+CSV_FILE = os.path.join(ROOT_DIR, 'netflix_preprocessed.csv')
+TEXT_COLUMN = 'description'
+CUSTOM_STOP_WORDS = {'series', 'film', 'movie', 'show', 'story', 'life', 'new', 'world', 'us', 'korean', 'korea', 'drama', 'kdrama'}
+REPEAT = 5
+
+
+def old_analyze_counts(texts: list[str], custom_stopwords: set[str]) -> Counter:
+    """기존 analyze_word_frequency: 정규식 치환 → lower() → CountVectorizer"""
+    text_clean = CLEAN_REGEX.sub(' ', ' '.join(texts)).lower()
+    vectorizer = CountVectorizer(stop_words=get_stopword_list(custom_stopwords), token_pattern=TOKEN_PATTERN)
+    try:
+        matrix = vectorizer.fit_transform([text_clean])
+    except ValueError:    # 빈 어휘 (모든 단어가 불용어이거나 텍스트가 비어 있음)
+        return Counter()
+    return Counter(dict(zip(vectorizer.get_feature_names_out(), matrix.toarray()[0].tolist())))
+
+
+def old_wordcloud_words(texts: list[str], stopwords: set[str]) -> list[str]:
+    """기존 preprocess_text_for_wordcloud: 정규식 삭제 → lower() → split() → 불용어 필터"""
+    combined_text = CLEAN_REGEX.sub('', ' '.join(texts)).lower()
+    return [word for word in combined_text.split() if word not in stopwords and len(word) > 1]
+
+
+def best_of(func, *args) -> float:
+    """함수를 REPEAT번 실행하여 최소 소요 시간(초)을 반환합니다."""
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    # 💡 결과 동등성은 tests/test_fast_tokenizer.py에서 확인 (여기서는 시간만 측정)
+    print("--- 단일 순회 토크나이저 벤치마크 ---")
+
+    descriptions = pd.read_csv(CSV_FILE, usecols=[TEXT_COLUMN])[TEXT_COLUMN].dropna().tolist()
+
+    for scale in (1, 10):
+        texts = descriptions * scale
+        print(f"\n[description {len(texts)}개]")
+        cases = [
+            ('analyze_word_frequency (regex + CountVectorizer)', old_analyze_counts, texts, CUSTOM_STOP_WORDS),
+            ('count_tokens (translate + Counter)', count_tokens, texts, CUSTOM_STOP_WORDS),
+            ('preprocess_text_for_wordcloud (regex + split)', old_wordcloud_words, texts, CUSTOM_STOP_WORDS),
+            ('tokenize(delete=True)', lambda t, s: tokenize(t, s, delete=True), texts, CUSTOM_STOP_WORDS),
+        ]
+        for name, func, *args in cases:
+            print(f"{name:<50} {best_of(func, *args):8.3f}초")
+
+    print("\n--- 벤치마크 완료 ---")
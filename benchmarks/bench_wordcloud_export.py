@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# 💡 benchmarks/ 폴더에서 실행해도 상위 폴더의 모듈을 불러올 수 있도록 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import pandas as pd
+from wordcloud import WordCloud
+
+from word_frequency import analyze_word_frequency_stream
+from wordcloud_render import export_wordcloud_image, prepare_mask, render_wordcloud_figure
+
+# --- 상수 정의 ---
+CSV_FILE = os.path.join(ROOT_DIR, 'netflix_preprocessed.csv')
+MASK_FILE = os.path.join(ROOT_DIR, 'netflix_logo.jpg')
+TITLE = 'Keywords in KOREAN Netflix Content Descriptions'
+REPEAT = 3
+
+
+def measure(func, *args, **kwargs) -> tuple[float, float]:
+    """함수를 REPEAT번 실행하여 (최소 소요 시간 초, 최대 Python 메모리 peak MB)를 반환합니다."""
+    best_seconds, peak_mb = float('inf'), 0.0
+    for _ in range(REPEAT):
+        tracemalloc.start()
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        best_seconds = min(best_seconds, elapsed)
+        peak_mb = max(peak_mb, peak / 1024 ** 2)
+    return best_seconds, peak_mb
+
+
+if __name__ == "__main__":
+    print("--- 워드 클라우드 저장 경로 벤치마크 (matplotlib savefig vs 직접 PNG/WebP) ---")
+
+    word_df, _ = analyze_word_frequency_stream(
+        pd.read_csv(CSV_FILE, chunksize=2000), 'description', {'series', 'film', 'movie', 'show'}
+    )
+    frequencies = dict(zip(word_df['word'], word_df['freq']))
+
+    for label, options in [
+        ('1400x1400', {'width': 1400, 'height': 1400}),
+        ('2500x676 (mask)', {'mask': prepare_mask(MASK_FILE)}),
+    ]:
+        wordcloud = WordCloud(
+            background_color='white', max_words=170, random_state=42, **options
+        ).generate_from_frequencies(frequencies)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cases = [
+                ('matplotlib savefig(dpi=300)', render_wordcloud_figure, 'mpl.png', {}),
+                ('direct PNG (compress_level=1)', export_wordcloud_image, 'direct_1.png', {'compress_level': 1}),
+                ('direct PNG (compress_level=6)', export_wordcloud_image, 'direct_6.png', {'compress_level': 6}),
+                ('direct WebP (lossless, method=4)', export_wordcloud_image, 'direct.webp', {'compress_level': 4}),
+            ]
+            print(f"\n[{label}]")
+            for name, func, filename, kwargs in cases:
+                path = os.path.join(tmp_dir, filename)
+                seconds, peak_mb = measure(func, wordcloud, TITLE, path, **kwargs)
+                size_kb = os.path.getsize(path) / 1024
+                print(f"{name:<36} {seconds:8.3f}초  peak {peak_mb:8.1f} MB  파일 {size_kb:8.1f} KB")
+
+    print("\n--- 벤치마크 완료 ---")
@@ -0,0 +1,106 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# --- 상수 정의 ---
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.data')
+NETFLIX_SOURCE = os.path.join(ROOT_DIR, 'netflix_preprocessed.csv')
+PUBMED_SOURCE = os.path.join(ROOT_DIR, 'pubmed_title.csv')
+HEART_SOURCE = os.path.join(ROOT_DIR, 'heart.csv')
+RARE_WORD_RATE = 0.3    # 설명/제목 중 희귀 합성 단어가 섞이는 비율 (규모에 따라 어휘 수도 늘어나도록)
+SEED = 42
+
+
+def _rare_words(rng: np.random.Generator, n: int, vocab_size: int) -> np.ndarray:
+    """영문 소문자로만 된 합성 단어 (숫자는 정제 단계에서 제거되므로 사용하지 않음)"""
+    ids = rng.integers(0, vocab_size, n)
+    words = np.full(n, 'zq', dtype=object)
+    while ids.any():
+        words = words + np.array([chr(97 + d) for d in range(26)], dtype=object)[ids % 26]
+        ids //= 26
+    return words
+
+
+def _inject_rare_words(rng: np.random.Generator, texts: pd.Series, vocab_size: int) -> pd.Series:
+    """일부 텍스트 끝에 희귀 합성 단어를 덧붙입니다. (어휘 수가 행 수에 비례해 커지는 실제 코퍼스를 흉내)"""
+    texts = texts.copy()
+    picked = np.flatnonzero(rng.random(len(texts)) < RARE_WORD_RATE)
+    values = texts.to_numpy(dtype=object)
+    values[picked] = values[picked] + ' ' + _rare_words(rng, len(picked), vocab_size)
+    return pd.Series(values, index=texts.index, name=texts.name)
+
+
+def bootstrap_columns(source: pd.DataFrame, n_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    """
+    원본과 같은 스키마(컬럼, dtype, 결측 비율)를 유지하도록 컬럼별로 값을 복원 추출합니다.
+    컬럼 간 상관은 유지하지 않지만, 값 분포·문자열 길이·결측 패턴은 원본과 같습니다.
+    """
+    return pd.DataFrame({
+        col: source[col].to_numpy()[rng.integers(0, len(source), n_rows)] for col in source.columns
+    })
+
+
+def make_netflix(scale: int, seed: int = SEED) -> pd.DataFrame:
+    """netflix_preprocessed.csv와 같은 스키마의 합성 데이터 (행 수 = 원본 × scale, show_id는 고유)"""
+    source = pd.read_csv(NETFLIX_SOURCE)
+    rng = np.random.default_rng(seed)
+    df = bootstrap_columns(source, len(source) * scale, rng)
+    df['show_id'] = [f's{i}' for i in range(1, len(df) + 1)]
+    df['description'] = _inject_rare_words(rng, df['description'].fillna(''), vocab_size=len(df))
+    return df
+
+
+def make_pubmed(scale: int, seed: int = SEED) -> pd.DataFrame:
+    """pubmed_title.csv와 같은 스키마의 합성 데이터 (PMID는 고유)"""
+    source = pd.read_csv(PUBMED_SOURCE, encoding='utf-8-sig')
+    rng = np.random.default_rng(seed)
+    df = bootstrap_columns(source, len(source) * scale, rng)
+    df['PMID'] = np.arange(30_000_000, 30_000_000 + len(df))
+    df['Title'] = _inject_rare_words(rng, df['Title'].fillna(''), vocab_size=len(df))
+    return df
+
+
+def make_heart(scale: int, seed: int = SEED) -> pd.DataFrame:
+    """heart.csv와 같은 스키마(정수·범주 컬럼, 결측 포함)의 합성 데이터"""
+    source = pd.read_csv(HEART_SOURCE)
+    return bootstrap_columns(source, len(source) * scale, np.random.default_rng(seed))
+
+
+# 💡 원본 CSV 경로와 읽기 옵션 (합성 데이터의 행 수 = 원본 행 수 × scale)
+SOURCES = {
+    'netflix': (NETFLIX_SOURCE, {}),
+    'pubmed': (PUBMED_SOURCE, {'encoding': 'utf-8-sig'}),
+    'heart': (HEART_SOURCE, {}),
+}
+
+DATASETS = {
+    'netflix': (make_netflix, {'index': False}),
+    'pubmed': (make_pubmed, {'index': False, 'encoding': 'utf-8-sig'}),    # 원본처럼 BOM 포함
+    'heart': (make_heart, {'index': False}),
+}
+
+
+def synthetic_csv(name: str, scale: int, data_dir: str = DATA_DIR, seed: int = SEED) -> str:
+    """
+    합성 CSV 경로를 반환합니다. 같은 (데이터셋, 규모, 시드) 파일이 이미 있으면 다시 만들지 않습니다.
+    """
+    make, to_csv_kwargs = DATASETS[name]
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f'{name}_x{scale}_seed{seed}.csv')
+    if not os.path.exists(path):
+        tmp_path = path + '.tmp'
+        make(scale, seed).to_csv(tmp_path, **to_csv_kwargs)
+        os.replace(tmp_path, path)
+        print(f"✅ 합성 데이터 생성: {os.path.basename(path)}")
+    return path
+
+
+def synthetic_rows(name: str, scale: int) -> int:
+    """
+    합성 CSV의 데이터 행 수. 원본을 CSV 파서로 세므로 따옴표 안 줄바꿈이 있어도 정확하며,
+    큰 합성 파일을 다시 읽지 않습니다.
+    """
+    path, read_kwargs = SOURCES[name]
+    return len(pd.read_csv(path, usecols=[0], **read_kwargs)) * scale
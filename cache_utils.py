@@ -0,0 +1,10 @@
+import os
+
+
+def file_fingerprint(file_path: str) -> dict[str, int]:
+    """
+    파일의 수정 시각(mtime)과 크기로 캐시 키를 만듭니다. 파일이 없으면 FileNotFoundError.
+    Parquet 사이드카, 키워드 색인, 문서-단어 행렬, 마스크, 큐브 메모 등 입력 파일에서 파생된 캐시가 공유합니다.
+    """
+    stat = os.stat(file_path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
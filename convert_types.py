@@ -1,10 +1,13 @@
 import pandas as pd
 import numpy as np
 
+from table_schema import MARKETING_SCHEMA, apply_schema, load_marketing    # 💡 스키마 기반 dtype 로더
+
 file_path = 'marketing_campaign_data.csv'
 
 try:
-    df = pd.read_csv(file_path, encoding='utf-8')
+    # 💡 읽은 뒤 변환하지 않고, 스키마의 dtype(int8/boolean/datetime 등)을 read_csv에 바로 전달
+    df = load_marketing(file_path, report=True)
 except FileNotFoundError:
     print(f"만약 {file_path}을 찾지 못한다면 생성된 data로 진행합니다.")
     
@@ -19,6 +22,8 @@ except FileNotFoundError:
     }
     df = pd.DataFrame(data)
     print(df)
+    # 💡 가상 데이터에도 같은 스키마를 한 번에 적용 (EnrollmentDate → datetime, Churn → boolean 등)
+    df = apply_schema(df, MARKETING_SCHEMA, report=True)
 
     columns_change ={
         'CustomerID':'customer_id',
@@ -33,13 +38,6 @@ except FileNotFoundError:
     print(df)
 
     print("="*50)
-    df['enrollment_date'].dtype
-    print(f"테이터 타입: {df['enrollment_date'].dtype}") 
-    df['enrollment_date'] = pd.to_datetime(df['enrollment_date'])
-    print(f"pd.datetime()사용후 데이터 타입 변화: {df['enrollment_date'].dtype}") 
-
-    print("="*50)
-    print("churn 컬럼 데이터 타입 변환 전: {df['churn'].dtype}")
-    df['churn'] = df['churn'].astype('int')
-    print(f".astype('int') 사용 후 데이터 타입 변화: {df['churn'].dtype}")
-    print('='*50)
\ No newline at end of file
+    print(f"enrollment_date 데이터 타입: {df['enrollment_date'].dtype}")
+    print(f"churn 데이터 타입: {df['churn'].dtype}")
+    print('='*50)
@@ -0,0 +1,123 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from cache_utils import file_fingerprint
+from table_schema import HEART_FILE, load_heart
+
+# --- 상수 정의 ---
+TARGET_COLUMN = 'HeartDisease'
+# 💡 HeartDisease + heart.csv의 모든 범주형 컬럼 (Age 등 다른 컬럼은 dims로 추가 가능)
+HEART_CUBE_DIMS = [TARGET_COLUMN, 'Sex', 'ChestPainType', 'FastingBS', 'RestingECG', 'ExerciseAngina']
+MAX_CELLS = 50_000_000    # 큐브 칸 수 상한 (차원 곱이 너무 크면 밀집 배열 대신 groupby를 사용해야 함)
+
+# 💡 같은 프로세스에서는 (파일, 차원) 조합별로 큐브를 한 번만 만들도록 메모리에 보관
+_CUBE_MEMO: dict[str, 'CountCube'] = {}
+
+
+class CountCube:
+    """
+    여러 범주형 컬럼의 결합 빈도를 담은 밀집 N차원 배열.
+    각 축의 마지막 칸은 결측값 자리이며, 조회 결과에서는 제외됩니다. (groupby의 dropna=True와 동일)
+    어떤 두 컬럼의 빈도표·그룹 내 비율표도 나머지 축을 합산하는 NumPy 연산으로 바로 얻습니다.
+    """
+
+    def __init__(self, counts: np.ndarray, dims: list[str], levels: list[pd.Index]):
+        self.counts = counts
+        self.dims = list(dims)
+        self.levels = levels
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, dims: list[str] = HEART_CUBE_DIMS) -> 'CountCube':
+        """
+        컬럼별 범주 코드를 하나의 평탄화된 칸 번호로 합친 뒤 np.bincount 한 번으로 모든 칸의 빈도를 셉니다.
+        category dtype 컬럼은 기존 코드와 범주 순서를 그대로 사용합니다.
+        """
+        codes, levels, shape = [], [], []
+        for col in dims:
+            categorical = df[col].array if isinstance(df[col].dtype, pd.CategoricalDtype) else pd.Categorical(df[col])
+            n_levels = len(categorical.categories)
+            # 결측(코드 -1)은 축의 마지막 칸(n_levels)으로 보냄
+            codes.append(np.where(categorical.codes < 0, n_levels, categorical.codes))
+            levels.append(pd.Index(categorical.categories, name=col))
+            shape.append(n_levels + 1)
+
+        n_cells = int(np.prod(shape, dtype=np.int64))
+        if n_cells > MAX_CELLS:
+            raise ValueError(f"큐브 칸 수({n_cells:,})가 상한({MAX_CELLS:,})을 넘습니다. 차원({dims})을 줄여주세요.")
+
+        flat = np.ravel_multi_index(codes, shape) if len(df) else np.zeros(0, dtype=np.intp)
+        counts = np.bincount(flat, minlength=n_cells).reshape(shape)
+        return cls(counts, dims, levels)
+
+    def _axis(self, dim: str) -> int:
+        try:
+            return self.dims.index(dim)
+        except ValueError:
+            raise KeyError(f"큐브에 '{dim}' 차원이 없습니다. (차원: {self.dims})") from None
+
+    def marginal(self, *dims: str) -> np.ndarray:
+        """지정한 차원만 남기고 나머지 축을 합산한 배열 (결측 칸 제외, 인자 순서대로 축 정렬)"""
+        axes = [self._axis(dim) for dim in dims]
+        other = tuple(axis for axis in range(self.counts.ndim) if axis not in axes)
+        summed = self.counts.sum(axis=other)
+        # 남은 축은 원래 순서이므로, 인자 순서로 재배치한 뒤 결측 칸(마지막)을 잘라냄
+        order = np.argsort(np.argsort(axes))
+        summed = np.transpose(summed, axes=order) if summed.ndim > 1 else summed
+        return summed[tuple(slice(0, -1) for _ in axes)]
+
+    def counts_table(self, row: str, col: str | None = None) -> pd.DataFrame | pd.Series:
+        """
+        빈도표. col을 주면 groupby([row, col]).size().unstack()과 같은 형태(행=row, 열=col, 빈 칸은 0),
+        생략하면 row의 value_counts(sort=False)와 같은 Series를 반환합니다.
+        """
+        if col is None:
+            return pd.Series(self.marginal(row), index=self.levels[self._axis(row)], name='count')
+        table = pd.DataFrame(
+            self.marginal(row, col), index=self.levels[self._axis(row)], columns=self.levels[self._axis(col)]
+        )
+        table.columns.name = None
+        return table
+
+    def proportions(self, row: str, col: str, percent: bool = True) -> pd.DataFrame:
+        """
+        row 그룹 내부에서 col 범주가 차지하는 비율표 (각 행의 합 = 100 또는 1).
+        groupby([row, col]).size().groupby(level=0).apply(lambda x: x / x.sum() * 100).unstack()과 같은 값이며,
+        누적 막대 그래프 입력으로 바로 사용할 수 있습니다. (관측이 없는 행은 NaN)
+        """
+        table = self.counts_table(row, col).astype(np.float64)
+        totals = table.sum(axis=1).to_numpy()[:, None]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            values = table.to_numpy() / totals * (100 if percent else 1)
+        return pd.DataFrame(values, index=table.index, columns=table.columns)
+
+    def pairwise(self, target: str = TARGET_COLUMN, percent: bool = True) -> dict[str, pd.DataFrame]:
+        """target × 나머지 모든 차원의 그룹 내 비율표 (대시보드의 모든 분해표를 한 번에)"""
+        return {dim: self.proportions(target, dim, percent) for dim in self.dims if dim != target}
+
+
+def load_count_cube(file_path: str = HEART_FILE, dims: list[str] = HEART_CUBE_DIMS) -> CountCube:
+    """
+    heart.csv(스키마 적용)로 큐브를 만들어 반환합니다.
+    CSV가 바뀌지 않았다면 같은 프로세스에서는 만들어 둔 큐브를 그대로 재사용합니다.
+    """
+    memo_key = json.dumps([os.path.abspath(file_path), file_fingerprint(file_path), list(dims)])
+    if memo_key not in _CUBE_MEMO:
+        _CUBE_MEMO[memo_key] = CountCube.build(load_heart(file_path, usecols=list(dims)), dims)
+    return _CUBE_MEMO[memo_key]
+
+
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        cube = load_count_cube(dims=[*HEART_CUBE_DIMS, 'Age'])
+    except FileNotFoundError:
+        print(f"🚨 {HEART_FILE} 파일을 찾을 수 없습니다. 경로를 확인해주세요.")
+    else:
+        print(f"✅ 큐브 생성 완료: 차원 {cube.dims}, 칸 수 {cube.counts.size:,}")
+        print("\n--- 심장병 유무에 따른 흉통 유형별 비율 (%) ---")
+        print(cube.proportions(TARGET_COLUMN, 'ChestPainType').round(1))
+        print("\n--- 나이별 심장병 여부 빈도 ---")
+        print(cube.counts_table('Age', TARGET_COLUMN).head())
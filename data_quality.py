@@ -0,0 +1,206 @@
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+# --- 상수 정의 ---
+HEART_FILE = 'heart.csv'
+DEFAULT_SENTINELS = (-1,)    # 모든 숫자 컬럼에서 확인할 플레이스 홀더 값
+# 💡 0이 생리학적으로 불가능한 값이라 플레이스 홀더로 쓰이는 컬럼
+HEART_COLUMN_SENTINELS = {'Cholesterol': (-1, 0), 'RestingBP': (-1, 0)}
+MAX_DISTINCT = 100_000    # 컬럼별 고유값 추적 상한 (넘으면 '이상'으로 표시하고 추적 중단)
+
+
+def _distinct_values(values: np.ndarray) -> np.ndarray:
+    """
+    NaN이 없는 숫자 배열의 고유값. 정수값이고 범위가 좁으면(임상 코드·측정값 등) 정렬 대신 np.bincount로 구합니다.
+    """
+    if len(values) == 0:
+        return values
+    low, high = values.min(), values.max()
+    if high - low <= max(len(values), 1 << 16):
+        as_int = values.astype(np.int64)
+        if np.array_equal(as_int, values):
+            return np.flatnonzero(np.bincount(as_int - int(low))) + low
+    return np.unique(values)
+
+
+class TableProfile:
+    """
+    데이터 품질 지표(결측 비율, 플레이스 홀더 비율, 최소/최대, 고유값 수)를 청크 단위로 누적합니다.
+    컬럼의 종류(숫자/그 외)는 값이 처음 나온 청크의 dtype으로 정합니다. (전부 결측인 청크는 float64로 읽히므로 판단에서 제외)
+    숫자 컬럼은 청크마다 하나의 2차원 NumPy 배열로 모아 컬럼 전체를 한 번에 집계하므로,
+    컬럼 × 플레이스 홀더 값마다 check_placeholder_rate를 호출하며 전체를 다시 읽지 않습니다.
+    """
+
+    def __init__(
+        self,
+        sentinels: Iterable[float] = DEFAULT_SENTINELS,
+        column_sentinels: dict[str, Iterable[float]] | None = None,
+        max_distinct: int = MAX_DISTINCT
+    ):
+        self.sentinels = tuple(sentinels)
+        self.column_sentinels = {col: tuple(values) for col, values in (column_sentinels or {}).items()}
+        self.max_distinct = max_distinct
+        self.columns: list[str] = []
+        self.n_rows = 0
+        self.missing = np.zeros(0, dtype=np.int64)
+        self.minimum = np.zeros(0, dtype=np.float64)
+        self.maximum = np.zeros(0, dtype=np.float64)
+        self.sentinel_counts: dict[float, np.ndarray] = {}
+        self.distinct: list[set | None] = []    # None: max_distinct 초과로 추적 중단
+        self.numeric = np.zeros(0, dtype=bool)
+        self.kind_known = np.zeros(0, dtype=bool)    # 값이 있는 청크를 만나 숫자 여부가 정해졌는지
+
+    def _all_sentinels(self) -> list[float]:
+        values = list(self.sentinels)
+        for col_values in self.column_sentinels.values():
+            values.extend(value for value in col_values if value not in values)
+        return values
+
+    def _register_columns(self, columns: pd.Index) -> np.ndarray:
+        """처음 보는 컬럼을 누적 배열에 추가하고, 청크 컬럼 → 누적 배열 위치를 반환합니다."""
+        new_cols = [col for col in columns if col not in self.columns]
+        if new_cols:
+            n_new = len(new_cols)
+            self.columns.extend(new_cols)
+            # 나중에 나타난 컬럼은 이전 청크 행들을 결측으로 간주
+            self.missing = np.concatenate([self.missing, np.full(n_new, self.n_rows, dtype=np.int64)])
+            self.minimum = np.concatenate([self.minimum, np.full(n_new, np.nan)])
+            self.maximum = np.concatenate([self.maximum, np.full(n_new, np.nan)])
+            self.numeric = np.concatenate([self.numeric, np.zeros(n_new, dtype=bool)])
+            self.kind_known = np.concatenate([self.kind_known, np.zeros(n_new, dtype=bool)])
+            for value in self._all_sentinels():
+                counts = self.sentinel_counts.get(value, np.zeros(0, dtype=np.int64))
+                self.sentinel_counts[value] = np.concatenate([counts, np.zeros(n_new, dtype=np.int64)])
+            self.distinct.extend(set() for _ in new_cols)
+        position = {col: i for i, col in enumerate(self.columns)}
+        return np.array([position[col] for col in columns], dtype=np.intp)
+
+    def _resolve_kinds(self, positions: np.ndarray, chunk: pd.DataFrame) -> np.ndarray:
+        """
+        청크의 각 컬럼을 숫자 블록으로 집계할지 결정합니다.
+        - 아직 종류를 모르는 컬럼: 값이 있는 첫 청크의 dtype으로 종류를 고정 (전부 결측이면 결측 수만 집계)
+        - 숫자로 고정된 컬럼에 숫자가 아닌 값이 나오면: 전체를 한 번에 읽을 때처럼 문자열(object) 컬럼으로 전환
+        """
+        chunk_numeric = np.array([pd.api.types.is_numeric_dtype(dtype) for dtype in chunk.dtypes], dtype=bool)
+        has_values = chunk.notna().any(axis=0).to_numpy()
+
+        new_kind = ~self.kind_known[positions] & has_values
+        self.numeric[positions[new_kind]] = chunk_numeric[new_kind]
+        self.kind_known[positions[new_kind]] = True
+
+        demote = positions[self.numeric[positions] & ~chunk_numeric & has_values]
+        if len(demote):
+            self.numeric[demote] = False
+            self.minimum[demote] = np.nan
+            self.maximum[demote] = np.nan
+            for counts in self.sentinel_counts.values():
+                counts[demote] = 0
+        return self.numeric[positions]
+
+    def _update_distinct(self, pos: int, values: np.ndarray) -> None:
+        seen = self.distinct[pos]
+        if seen is None:
+            return
+        seen.update(values.tolist())
+        if len(seen) > self.max_distinct:
+            self.distinct[pos] = None
+
+    def update(self, chunk: pd.DataFrame) -> 'TableProfile':
+        """청크 하나를 누적합니다."""
+        positions = self._register_columns(chunk.columns)
+        numeric_mask = self._resolve_kinds(positions, chunk)
+
+        # 1. 숫자 블록: float64 2차원 배열 하나로 모아 컬럼 방향(axis=0)으로 한 번에 집계 (결측은 NaN)
+        if numeric_mask.any():
+            num_pos = positions[numeric_mask]
+            block = chunk.iloc[:, np.flatnonzero(numeric_mask)].to_numpy(dtype=np.float64, na_value=np.nan)
+            nan_mask = np.isnan(block)
+            nan_counts = nan_mask.sum(axis=0)
+            self.missing[num_pos] += nan_counts
+            if len(block):
+                # fmin/fmax는 NaN을 무시 (컬럼 전체가 NaN이면 NaN 유지)
+                self.minimum[num_pos] = np.fmin(self.minimum[num_pos], np.fmin.reduce(block, axis=0))
+                self.maximum[num_pos] = np.fmax(self.maximum[num_pos], np.fmax.reduce(block, axis=0))
+            for value, counts in self.sentinel_counts.items():
+                counts[num_pos] += (block == value).sum(axis=0)
+            for i, pos in enumerate(num_pos):
+                if self.distinct[pos] is not None:
+                    # 결측이 없는 컬럼은 불리언 인덱싱(복사) 없이 그대로 사용
+                    values = block[~nan_mask[:, i], i] if nan_counts[i] else block[:, i]
+                    self._update_distinct(pos, _distinct_values(values))
+
+        # 2. 그 외(문자열 등) 컬럼: 결측 수와 고유값만 집계
+        if (~numeric_mask).any():
+            other = chunk.iloc[:, np.flatnonzero(~numeric_mask)]
+            other_pos = positions[~numeric_mask]
+            self.missing[other_pos] += other.isna().to_numpy().sum(axis=0)
+            for pos, (_, series) in zip(other_pos, other.items()):
+                if self.distinct[pos] is not None:
+                    self._update_distinct(pos, series.dropna().unique())
+
+        # 3. 이번 청크에 없는 컬럼은 결측으로 간주
+        absent = np.setdiff1d(np.arange(len(self.columns)), positions)
+        self.missing[absent] += len(chunk)
+        self.n_rows += len(chunk)
+        return self
+
+    def result(self) -> pd.DataFrame:
+        """
+        컬럼별 품질 지표 표를 반환합니다. (비율은 % 단위, 소수 둘째 자리)
+        rate_<값> 컬럼은 해당 플레이스 홀더를 확인하는 숫자 컬럼에만 값이 있고 나머지는 NaN입니다.
+        """
+        n_rows = max(self.n_rows, 1)
+        report = pd.DataFrame(index=pd.Index(self.columns, name='column'))
+        report['missing_rate'] = (self.missing / n_rows * 100).round(2)
+        for value, counts in self.sentinel_counts.items():
+            applies = np.array([
+                self.numeric[i] and value in self.column_sentinels.get(col, self.sentinels)
+                for i, col in enumerate(self.columns)
+            ], dtype=bool)
+            report[f'rate_{value:g}'] = np.where(applies, (counts / n_rows * 100).round(2), np.nan)
+        report['min'] = self.minimum
+        report['max'] = self.maximum
+        report['n_distinct'] = [len(seen) if seen is not None else self.max_distinct for seen in self.distinct]
+        report['distinct_capped'] = [seen is None for seen in self.distinct]
+        return report
+
+
+def profile_frame(
+    df: pd.DataFrame,
+    sentinels: Iterable[float] = DEFAULT_SENTINELS,
+    column_sentinels: dict[str, Iterable[float]] | None = None
+) -> pd.DataFrame:
+    """메모리에 있는 DataFrame의 품질 지표 표를 반환합니다."""
+    return TableProfile(sentinels, column_sentinels).update(df).result()
+
+
+def profile_csv(
+    file_path: str,
+    chunksize: int = 100_000,
+    sentinels: Iterable[float] = DEFAULT_SENTINELS,
+    column_sentinels: dict[str, Iterable[float]] | None = None,
+    **read_csv_kwargs
+) -> pd.DataFrame | None:
+    """
+    메모리에 다 올릴 수 없는 CSV도 청크 단위로 한 번만 읽으면서 품질 지표 표를 만듭니다.
+    (read_csv_kwargs는 pd.read_csv에 그대로 전달: usecols, dtype 등)
+    """
+    try:
+        profile = TableProfile(sentinels, column_sentinels)
+        for chunk in pd.read_csv(file_path, chunksize=chunksize, **read_csv_kwargs):
+            profile.update(chunk)
+        return profile.result()
+    except FileNotFoundError:
+        print(f"🚨 오류: {file_path} 파일을 찾을 수 없습니다.")
+        return None
+
+
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    report = profile_csv(HEART_FILE, chunksize=200, column_sentinels=HEART_COLUMN_SENTINELS)
+
+    if report is not None:
+        print("\n--- 🚨 심부전 데이터셋 품질 프로파일 (결측·플레이스 홀더·범위·고유값) 🚨 ---")
+        print(report.to_string())
@@ -0,0 +1,80 @@
+from collections import Counter
+from typing import Iterable
+
+from text_resources import CLEAN_REGEX, get_stopwords
+
+# --- 상수 정의 ---
+MIN_TOKEN_LEN = 2    # CountVectorizer 기본 토큰 패턴(\w\w+)과 같은 최소 길이
+
+
+def _ascii_clean_table(replacement: str | None) -> dict[int, str | None]:
+    """
+    ASCII 문자용 str.translate 테이블: CLEAN_PATTERN([^가-힣a-zA-Z\\s]) 제거와 소문자 변환을 한 번에 처리합니다.
+    (영문자는 소문자로, 공백류는 그대로, 나머지는 replacement로)
+    """
+    table: dict[int, str | None] = {}
+    for code in range(128):
+        char = chr(code)
+        if char.isalpha():
+            table[code] = char.lower()
+        elif char.isspace():
+            table[code] = char
+        else:
+            table[code] = replacement
+    return table
+
+
+# 💡 analyze_word_frequency 방식(특수문자 → 공백)과 preprocess_text_for_wordcloud 방식(특수문자 삭제)
+SPACE_TABLE = _ascii_clean_table(' ')
+DELETE_TABLE = _ascii_clean_table(None)
+
+
+def clean_text(text: str, delete: bool = False) -> str:
+    """
+    CLEAN_REGEX.sub(' ' 또는 '', text).lower()와 같은 결과를 반환합니다. delete=True이면 특수문자를 공백 대신 삭제합니다.
+    ASCII 텍스트는 str.translate 한 번으로 처리하고(CPython의 ASCII 전용 고속 경로),
+    한글 등 비ASCII 문자가 섞인 텍스트만 기존 정규식 치환 + lower()를 사용합니다.
+    """
+    if text.isascii():
+        return text.translate(DELETE_TABLE if delete else SPACE_TABLE)
+    return CLEAN_REGEX.sub('' if delete else ' ', text).lower()
+
+
+def clean_texts(texts: Iterable[str], delete: bool = False) -> str:
+    """텍스트마다 clean_text를 적용한 뒤 공백으로 이어 붙입니다. (' '.join 후 정제한 결과와 같음)"""
+    return ' '.join([clean_text(text, delete) for text in texts])
+
+
+def filter_tokens(
+    words: Iterable[str],
+    stopwords: frozenset[str] | set[str] = frozenset(),
+    min_len: int = MIN_TOKEN_LEN
+) -> list[str]:
+    """정제된 단어 목록에서 min_len보다 짧은 단어와 불용어를 제외합니다."""
+    return [word for word in words if len(word) >= min_len and word not in stopwords]
+
+
+def tokenize(
+    texts: Iterable[str],
+    stopwords: frozenset[str] | set[str] = frozenset(),
+    delete: bool = False,
+    min_len: int = MIN_TOKEN_LEN
+) -> list[str]:
+    """
+    텍스트들을 정제·소문자화하여 공백으로 이어 붙인 뒤 분리하고, 짧은 단어와 불용어를 제외한 토큰 목록을 반환합니다.
+    정제 후에는 한글/영문/공백만 남으므로 split() 결과가 CountVectorizer 토큰 패턴의 결과와 같습니다.
+    """
+    return filter_tokens(clean_texts(texts, delete).split(), stopwords, min_len)
+
+
+def count_tokens(
+    texts: Iterable[str],
+    custom_stopwords: Iterable[str] = (),
+    base: str | None = 'english',
+    delete: bool = False
+) -> Counter:
+    """
+    CountVectorizer(stop_words=기본+사용자 불용어, token_pattern=TOKEN_PATTERN)와 같은 단어 빈도를 Counter로 셉니다.
+    (정규식 치환 → lower() → 재토큰화로 이어지는 여러 번의 전체 순회 대신, translate + split + Counter 한 번)
+    """
+    return Counter(tokenize(texts, get_stopwords(custom_stopwords, base), delete))
@@ -0,0 +1,178 @@
+import heapq
+import math
+from collections import Counter
+from typing import Iterable
+
+import pandas as pd
+
+from fast_tokenizer import clean_texts, filter_tokens
+from text_resources import get_stopwords
+
+# --- 상수 정의 ---
+# 💡 허용 오차 비율: 추정 빈도는 실제 빈도보다 최대 EPSILON × (전체 토큰 수)만큼 클 수 있음
+#    보관하는 단어 수 = ceil(1 / EPSILON) (1e-4 → 10,000개, 코퍼스 크기와 무관)
+EPSILON = 1e-4
+
+
+class SpaceSaving:
+    """
+    Space-Saving 요약: 최대 capacity개의 (단어, 추정 빈도, 오차)만 보관해 상위 빈도 단어를 근사합니다.
+    - 추정 빈도는 항상 실제 빈도 이상이며, 차이는 error 이하이고 error ≤ 전체 토큰 수 / capacity 입니다.
+    - 실제 빈도가 전체 토큰 수 / capacity보다 큰 단어는 반드시 요약에 남습니다.
+    - merge()로 청크·워커별 요약을 합쳐도 같은 오차 한계가 유지됩니다. (mergeable summary)
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"capacity는 1 이상이어야 합니다. (입력: {capacity})")
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.n_tokens = 0
+
+    @classmethod
+    def from_error(cls, epsilon: float = EPSILON) -> 'SpaceSaving':
+        """추정 빈도의 오차가 epsilon × 전체 토큰 수 이하가 되도록 capacity를 정합니다."""
+        if not 0 < epsilon < 1:
+            raise ValueError(f"epsilon은 0과 1 사이여야 합니다. (입력: {epsilon})")
+        return cls(math.ceil(1 / epsilon))
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @property
+    def min_count(self) -> int:
+        """요약에 없는 단어의 빈도 상한 (요약이 가득 차지 않았다면 0)"""
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    @property
+    def error_bound(self) -> float:
+        """모든 단어에 대해 보장되는 최대 과대 추정량 (전체 토큰 수 / capacity)"""
+        return self.n_tokens / self.capacity
+
+    def _absorb(
+        self,
+        counts: dict[str, int],
+        errors: dict[str, int],
+        own_min: int,
+        other_min: int,
+        n_tokens: int
+    ) -> None:
+        """
+        두 요약의 병합: 한쪽에 없는 단어는 그쪽의 min_count(빈도 상한)를 더해 과대 추정을 유지하고,
+        합친 뒤 추정 빈도 상위 capacity개만 남깁니다. (동점은 단어 사전순으로 결정적으로 선택)
+        own_min은 병합 전 상태(capacity 변경 전)의 min_count여야 합니다.
+        """
+        merged_counts: dict[str, int] = {}
+        merged_errors: dict[str, int] = {}
+        for word in self.counts.keys() | counts.keys():
+            merged_counts[word] = self.counts.get(word, own_min) + counts.get(word, other_min)
+            merged_errors[word] = self.errors.get(word, own_min) + errors.get(word, other_min)
+
+        if len(merged_counts) > self.capacity:
+            kept = heapq.nsmallest(self.capacity, merged_counts, key=lambda word: (-merged_counts[word], word))
+            merged_counts = {word: merged_counts[word] for word in kept}
+            merged_errors = {word: merged_errors[word] for word in kept}
+        self.counts, self.errors = merged_counts, merged_errors
+        self.n_tokens += n_tokens
+
+    def update_counts(self, counts: Counter | dict[str, int]) -> 'SpaceSaving':
+        """
+        한 청크의 정확한 빈도(Counter)를 합칩니다. 청크 어휘가 capacity보다 많으면 상위 capacity개만 사용하며,
+        잘린 단어의 빈도는 남긴 단어의 최솟값 이하이므로 오차 한계가 그대로 유지됩니다.
+        """
+        n_tokens = sum(counts.values())
+        if len(counts) > self.capacity:
+            kept = heapq.nsmallest(self.capacity, counts, key=lambda word: (-counts[word], word))
+            counts = {word: counts[word] for word in kept}
+            other_min = min(counts.values())
+        else:
+            other_min = 0
+        # 💡 청크에 있는 단어의 빈도는 정확하므로 오차 0 (없는 단어만 other_min만큼 오차가 생김)
+        self._absorb(counts, dict.fromkeys(counts, 0), self.min_count, other_min, n_tokens)
+        return self
+
+    def update(self, tokens: Iterable[str]) -> 'SpaceSaving':
+        """토큰 목록(청크 하나)을 셉니다. 메모리는 청크 어휘 + capacity개로 제한됩니다."""
+        return self.update_counts(Counter(tokens))
+
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        """다른 요약(다른 청크·워커의 결과)을 이 요약에 합칩니다. capacity가 작은 쪽의 오차 한계를 따릅니다."""
+        # 💡 capacity를 줄이기 전에 min_count를 구해야, 가득 찬 적 없는 요약이 0이 아닌 상한을 쓰지 않음
+        own_min = self.min_count
+        self.capacity = min(self.capacity, other.capacity)
+        self._absorb(other.counts, other.errors, own_min, other.min_count, other.n_tokens)
+        return self
+
+    def top(self, n: int | None = None) -> pd.DataFrame:
+        """
+        추정 빈도 상위 n개(생략 시 요약 전체)를 analyze_word_frequency와 같은 형태(word, freq 내림차순)로 반환합니다.
+        error 열은 단어별 최대 과대 추정량이며, freq - error는 실제 빈도의 하한입니다.
+        """
+        n = len(self.counts) if n is None else n
+        words = heapq.nsmallest(n, self.counts, key=lambda word: (-self.counts[word], word))
+        return pd.DataFrame({
+            'word': words,
+            'freq': [self.counts[word] for word in words],
+            'error': [self.errors[word] for word in words],
+        })
+
+    def to_dict(self, n: int | None = None) -> dict[str, int]:
+        """WordCloud.generate_from_frequencies에 바로 넘길 수 있는 상위 n개 {단어: 추정 빈도} 딕셔너리"""
+        if n is None:
+            return dict(self.counts)
+        top = self.top(n)
+        return dict(zip(top['word'], top['freq']))
+
+
+def sketch_word_frequency(
+    chunks: Iterable[pd.DataFrame],
+    text_col: str,
+    custom_stopwords: set[str],
+    epsilon: float = EPSILON,
+    capacity: int | None = None
+) -> SpaceSaving:
+    """
+    analyze_word_frequency_stream과 같은 정제·불용어 규칙으로 청크를 세되, 전체 어휘 대신
+    Space-Saving 요약(capacity개, 생략 시 ceil(1/epsilon)개)만 유지합니다.
+    메모리는 코퍼스 크기와 관계없이 (청크 하나의 어휘 + capacity)로 제한됩니다.
+    """
+    stopwords = get_stopwords(custom_stopwords)
+    sketch = SpaceSaving(capacity) if capacity is not None else SpaceSaving.from_error(epsilon)
+    for chunk in chunks:
+        texts = chunk[text_col].dropna().tolist()
+        if texts:
+            sketch.update(filter_tokens(clean_texts(texts).split(), stopwords))
+    return sketch
+
+
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    from netflix_data import read_netflix_csv
+    from word_frequency import analyze_word_frequency_stream
+
+    CSV_FILE = 'netflix_preprocessed.csv'
+    TOP_N = 20
+    CAPACITY = 500    # 예시 코퍼스의 어휘(약 1.8만 개)보다 훨씬 작게 잡아 근사 동작을 확인
+
+    try:
+        df = read_netflix_csv(CSV_FILE, usecols=['description'])
+    except FileNotFoundError:
+        print(f"🚨 {CSV_FILE} 파일을 찾을 수 없습니다. 경로를 확인해주세요.")
+    else:
+        chunks = [df.iloc[start:start + 1000] for start in range(0, len(df), 1000)]
+        exact, _ = analyze_word_frequency_stream(chunks, 'description', set())
+        exact_freq = dict(zip(exact['word'], exact['freq']))
+
+        # 💡 워커 4개가 나눠 센 요약을 병합하는 상황 재현
+        parts = [sketch_word_frequency(chunks[i::4], 'description', set(), capacity=CAPACITY) for i in range(4)]
+        sketch = parts[0]
+        for part in parts[1:]:
+            sketch.merge(part)
+
+        approx = sketch.top(TOP_N)
+        max_error = max(freq - exact_freq[word] for word, freq in zip(approx['word'], approx['freq']))
+        overlap = len(set(approx['word']) & set(exact['word'].head(TOP_N)))
+        print(f"✅ 정확한 어휘 {len(exact):,}개 → 요약 {len(sketch):,}개 보관 (토큰 {sketch.n_tokens:,}개)")
+        print(f"✅ 상위 {TOP_N}개 일치: {overlap}/{TOP_N}, 최대 과대 추정 {max_error} (보장 한계 {sketch.error_bound:.1f})")
+        print(approx.head(10).to_string(index=False))
@@ -0,0 +1,247 @@
+import hashlib
+import heapq
+import json
+import os
+from collections import Counter
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from fast_tokenizer import count_tokens
+from keyword_index import is_indexable
+from netflix_data import read_netflix_csv
+
+# --- 상수 정의 ---
+STATE_DIR = '.frequency_state'
+ID_COLUMN = 'show_id'
+TEXT_COLUMN = 'description'
+DEFAULT_COLS_TO_CHECK = ['description', 'title', 'listed_in']
+STATE_VERSION = 1
+
+
+def _text_digest(text: str) -> str:
+    """텍스트 변경 여부 판단용 짧은 해시 (토큰화보다 훨씬 저렴)"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class SegmentFrequencyState:
+    """
+    세그먼트 하나의 누적 단어 빈도와, 이미 반영한 show_id별 (텍스트 해시, 단어 빈도)를 보관합니다.
+    새 행/수정된 행만 토큰화해 더하고, 수정·삭제되었거나 세그먼트에서 빠진 작품은 기존 빈도를 빼서 반영합니다.
+    빈도 계산 규칙은 analyze_word_frequency(영문 + 사용자 불용어, 두 글자 이상)와 같습니다.
+    """
+
+    def __init__(self, segment: dict, custom_stopwords: Iterable[str], text_col: str = TEXT_COLUMN):
+        self.segment = {
+            'name': segment.get('name', segment['keyword']),
+            'keyword': segment['keyword'],
+            'cols_to_check': list(segment.get('cols_to_check', DEFAULT_COLS_TO_CHECK)),
+        }
+        self.stopwords = frozenset(custom_stopwords)
+        self.text_col = text_col
+        self.counts: Counter = Counter()
+        self.shows: dict[str, tuple[str, dict[str, int]]] = {}    # show_id → (텍스트 해시, 단어 빈도)
+
+    def __len__(self) -> int:
+        return len(self.shows)
+
+    def config(self) -> dict:
+        """상태 파일의 유효성 판단에 쓰이는 설정 (세그먼트 정의, 불용어, 텍스트 컬럼)"""
+        return {
+            'version': STATE_VERSION,
+            'segment': self.segment,
+            'stopwords': sorted(self.stopwords),
+            'text_col': self.text_col,
+        }
+
+    def _in_segment(self, rows: pd.DataFrame) -> np.ndarray:
+        """행마다 세그먼트 키워드가 검사 컬럼 중 하나에 포함되는지 (load_and_filter_data와 같은 규칙)"""
+        keyword = self.segment['keyword']
+        mask = np.zeros(len(rows), dtype=bool)
+        for col in self.segment['cols_to_check']:
+            mask |= rows[col].fillna('').str.contains(
+                keyword, case=False, na=False, regex=not is_indexable(keyword)
+            ).to_numpy()
+        return mask
+
+    def _subtract(self, show_id: str) -> None:
+        _, old_counts = self.shows.pop(show_id)
+        self.counts.subtract(old_counts)
+        for word in old_counts:
+            if self.counts[word] <= 0:
+                del self.counts[word]
+
+    def update(self, rows: pd.DataFrame) -> dict[str, int]:
+        """
+        새로 들어왔거나 수정된 행들(show_id, 텍스트, 검사 컬럼 포함)을 반영합니다.
+        텍스트 해시가 같은 작품은 다시 토큰화하지 않으며, 세그먼트 조건에서 빠진 작품은 빈도를 뺍니다.
+        반환: {'added', 'changed', 'removed', 'unchanged'} 작품 수
+        """
+        # 💡 검사 컬럼이 하나라도 빠지면 그 컬럼으로만 일치하던 작품이 '세그먼트에서 빠짐'으로 잘못 처리됨
+        #    (상태에는 검사 컬럼 값을 저장하지 않으므로, 변경분도 전체 행으로 넘겨야 함)
+        missing = [col for col in [ID_COLUMN, self.text_col, *self.segment['cols_to_check']] if col not in rows.columns]
+        if missing:
+            raise KeyError(f"변경 행에 필요한 컬럼이 없습니다: {missing} (변경된 작품의 전체 행을 넘겨주세요)")
+
+        stats = {'added': 0, 'changed': 0, 'removed': 0, 'unchanged': 0}
+        rows = rows.dropna(subset=[ID_COLUMN])
+        in_segment = self._in_segment(rows)
+        texts = rows[self.text_col].fillna('').astype(str).tolist()
+
+        for show_id, text, member in zip(rows[ID_COLUMN].astype(str).tolist(), texts, in_segment.tolist()):
+            known = show_id in self.shows
+            if not member:
+                if known:
+                    self._subtract(show_id)
+                    stats['removed'] += 1
+                continue
+
+            digest = _text_digest(text)
+            if known:
+                if self.shows[show_id][0] == digest:
+                    stats['unchanged'] += 1
+                    continue
+                self._subtract(show_id)
+                stats['changed'] += 1
+            else:
+                stats['added'] += 1
+
+            show_counts = dict(count_tokens([text], self.stopwords))
+            self.counts.update(show_counts)
+            self.shows[show_id] = (digest, show_counts)
+        return stats
+
+    def remove(self, show_ids: Iterable[str]) -> int:
+        """삭제된 작품들의 빈도를 뺍니다. 반환: 실제로 제거된 작품 수"""
+        removed = 0
+        for show_id in show_ids:
+            if str(show_id) in self.shows:
+                self._subtract(str(show_id))
+                removed += 1
+        return removed
+
+    def sync(self, df: pd.DataFrame) -> dict[str, int]:
+        """
+        카탈로그 전체 스냅샷과 맞춥니다. 변경된 행만 토큰화하고, 스냅샷에서 사라진 show_id는 삭제로 처리합니다.
+        """
+        stats = self.update(df)
+        current_ids = set(df[ID_COLUMN].dropna().astype(str))
+        stats['removed'] += self.remove([show_id for show_id in self.shows if show_id not in current_ids])
+        return stats
+
+    def frequencies(self) -> dict[str, int]:
+        """WordCloud.generate_from_frequencies에 넘길 {단어: 빈도} 딕셔너리"""
+        return dict(self.counts)
+
+    def to_frame(self) -> pd.DataFrame:
+        """analyze_word_frequency와 같은 형태(word, freq 내림차순, 동률은 단어순)의 전체 빈도표"""
+        from word_frequency import counts_to_word_df
+        return counts_to_word_df(self.counts)
+
+    def top(self, n: int) -> pd.DataFrame:
+        """상위 n개 단어만 (전체 정렬 없이 heapq로) 반환합니다. to_frame().head(n)과 같은 순서."""
+        items = heapq.nsmallest(n, self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return pd.DataFrame(items, columns=['word', 'freq'])
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'config': self.config(), 'shows': self.shows}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)    # 💡 저장 도중 중단되어도 이전 상태 파일이 깨지지 않도록 교체
+
+    @classmethod
+    def load(
+        cls, path: str, segment: dict, custom_stopwords: Iterable[str], text_col: str = TEXT_COLUMN
+    ) -> 'SegmentFrequencyState | None':
+        """상태 파일을 읽습니다. 파일이 없거나 설정(세그먼트·불용어·텍스트 컬럼)이 다르면 None."""
+        state = cls(segment, custom_stopwords, text_col)
+        try:
+            with open(path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if saved.get('config') != state.config():
+            return None
+        for show_id, (digest, show_counts) in saved['shows'].items():
+            state.shows[show_id] = (digest, show_counts)
+            state.counts.update(show_counts)
+        return state
+
+
+def segment_state_path(
+    segment: dict, custom_stopwords: Iterable[str], text_col: str = TEXT_COLUMN, state_dir: str = STATE_DIR
+) -> str:
+    """세그먼트 정의 + 불용어 + 텍스트 컬럼 조합별 상태 파일 경로"""
+    config = SegmentFrequencyState(segment, custom_stopwords, text_col).config()
+    digest = hashlib.sha1(json.dumps(config, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(state_dir, f'{digest}.json')
+
+
+def load_segment_state(
+    segment: dict, custom_stopwords: Iterable[str], text_col: str = TEXT_COLUMN, state_dir: str = STATE_DIR
+) -> SegmentFrequencyState:
+    """저장된 세그먼트 상태를 읽고, 없으면 빈 상태를 만듭니다."""
+    path = segment_state_path(segment, custom_stopwords, text_col, state_dir)
+    state = SegmentFrequencyState.load(path, segment, custom_stopwords, text_col)
+    return state if state is not None else SegmentFrequencyState(segment, custom_stopwords, text_col)
+
+
+def update_segment_states(
+    segments: list[dict],
+    custom_stopwords: Iterable[str],
+    file_path: str | None = None,
+    new_rows: pd.DataFrame | None = None,
+    deleted_ids: Iterable[str] = (),
+    text_col: str = TEXT_COLUMN,
+    state_dir: str = STATE_DIR
+) -> dict[str, SegmentFrequencyState]:
+    """
+    세그먼트별 빈도 상태를 갱신하고 저장합니다.
+    - new_rows를 주면: 그 행들(신규/수정)과 deleted_ids만 반영 (작업량 ∝ 변경분)
+    - file_path만 주면: CSV 전체 스냅샷과 동기화 (해시 비교로 변경된 행만 토큰화, 사라진 행은 삭제 처리)
+    반환: {세그먼트 이름: 상태}
+    """
+    if new_rows is None and file_path is None:
+        raise ValueError("file_path 또는 new_rows 중 하나는 지정해야 합니다.")
+    custom_stopwords = frozenset(custom_stopwords)
+    deleted_ids = list(deleted_ids)
+
+    if new_rows is None:
+        cols = {col for seg in segments for col in seg.get('cols_to_check', DEFAULT_COLS_TO_CHECK)}
+        snapshot = read_netflix_csv(file_path, usecols=list(dict.fromkeys([ID_COLUMN, text_col, *sorted(cols)])))
+
+    states = {}
+    for segment in segments:
+        state = load_segment_state(segment, custom_stopwords, text_col, state_dir)
+        if new_rows is None:
+            stats = state.sync(snapshot)
+        else:
+            stats = state.update(new_rows)
+            stats['removed'] += state.remove(deleted_ids)
+        state.save(segment_state_path(segment, custom_stopwords, text_col, state_dir))
+        print(f"✅ 세그먼트 '{state.segment['name']}': 작품 {len(state)}개, 단어 {len(state.counts)}개 {stats}")
+        states[state.segment['name']] = state
+    return states
+
+
+# --- 실행 예시 ---
+if __name__ == "__main__":
+    CSV_FILE = 'netflix_preprocessed.csv'
+    CUSTOM_STOP_WORDS = {'series', 'film', 'movie', 'show', 'story', 'life', 'new', 'world', 'us', 'korean', 'korea', 'drama', 'kdrama'}
+    SEGMENTS = [{'name': 'Korea', 'keyword': 'Korea'}]
+
+    print("--- 1) 전체 스냅샷 동기화 (처음에는 전체 토큰화, 이후에는 변경분만) ---")
+    states = update_segment_states(SEGMENTS, CUSTOM_STOP_WORDS, file_path=CSV_FILE)
+    print(states['Korea'].top(10))
+
+    print("--- 2) 신규/수정 행과 삭제된 show_id만 반영 ---")
+    new_rows = pd.DataFrame({
+        ID_COLUMN: ['s_new_1'],
+        'title': ['Seoul Nights'],
+        'listed_in': ['Korean TV Shows'],
+        'description': ['A young chef in Seoul falls in love with a rival chef.'],
+    })
+    states = update_segment_states(SEGMENTS, CUSTOM_STOP_WORDS, new_rows=new_rows, deleted_ids=['s_new_1'])
+    print(states['Korea'].top(10))
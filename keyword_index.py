@@ -0,0 +1,202 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from cache_utils import file_fingerprint
+from netflix_data import read_netflix_csv
+
+# --- 상수 정의 ---
+INDEX_COLUMNS = ['description', 'title', 'listed_in', 'country']    # 색인 대상 컬럼
+INDEX_SUFFIX = '.kwindex.npz'
+TOKEN_PATTERN = re.compile(r'\w+')
+REGEX_SPECIAL_CHARS = set('.^$*+?{}[]\\|()')
+
+# 💡 같은 프로세스에서 여러 번 호출해도 색인 파일은 한 번만 읽도록 메모리에 보관
+_INDEX_MEMO: dict[str, 'KeywordIndex'] = {}
+
+
+def is_indexable(keyword: str) -> bool:
+    """
+    정규표현식 특수문자가 없고, 단어 문자(\w)를 하나 이상 포함한 일반 키워드인지 확인합니다. (색인은 리터럴 검색만 지원)
+    '&'처럼 토큰이 하나도 나오지 않는 키워드는 색인으로 찾을 수 없으므로 문자열 스캔으로 처리해야 합니다.
+    """
+    return not (set(keyword) & REGEX_SPECIAL_CHARS) and bool(TOKEN_PATTERN.findall(keyword.lower()))
+
+
+class KeywordIndex:
+    """
+    컬럼별 '토큰 → 행 번호' 역색인(inverted index).
+    포스팅 리스트는 CSR 형태(vocab, indptr, indices)로 저장합니다.
+    """
+
+    def __init__(self, postings: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]], n_rows: int):
+        self.postings = postings    # 컬럼명 → (vocab, indptr, indices)
+        self.n_rows = n_rows
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, columns: list[str]) -> 'KeywordIndex':
+        """DataFrame의 각 컬럼을 소문자 토큰으로 분해하여 역색인을 생성합니다."""
+        postings = {}
+        for col in columns:
+            if col not in df.columns:
+                continue
+            token_rows: dict[str, list[int]] = {}
+            for row, text in enumerate(df[col].fillna('').astype(str).str.lower()):
+                for token in set(TOKEN_PATTERN.findall(text)):
+                    token_rows.setdefault(token, []).append(row)
+
+            vocab = np.array(sorted(token_rows), dtype=str)
+            lengths = [len(token_rows[token]) for token in vocab]
+            indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+            indices = np.fromiter(
+                (row for token in vocab for row in token_rows[token]), dtype=np.int32, count=indptr[-1]
+            )
+            postings[col] = (vocab, indptr, indices)
+        return cls(postings, len(df))
+
+    def has_column(self, col: str) -> bool:
+        return col in self.postings
+
+    def _matching_tokens(self, col: str, parts: list[str]) -> dict[str, np.ndarray]:
+        """키워드 조각별로, 해당 조각을 부분 문자열로 포함하는 토큰 번호 배열을 반환합니다."""
+        vocab = self.postings[col][0]
+        return {part: np.flatnonzero(np.char.find(vocab, part) >= 0) for part in parts}
+
+    def _rows_for_tokens(self, col: str, token_ids: np.ndarray) -> np.ndarray:
+        """토큰 번호 배열에 해당하는 포스팅 리스트들의 합집합(행 번호)을 반환합니다."""
+        _, indptr, indices = self.postings[col]
+        if len(token_ids) == 0:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate([indices[indptr[t]:indptr[t + 1]] for t in token_ids]))
+
+    def lookup_many(
+        self,
+        keywords: list[str],
+        columns: list[str],
+        frame: pd.DataFrame | None = None
+    ) -> dict[str, np.ndarray]:
+        """
+        여러 키워드의 행 번호 집합을 한 번에 계산합니다. (대소문자 무시, 부분 문자열 일치)
+        키워드에 공백·구두점이 있으면 토큰 교집합으로 후보를 구하고, frame이 주어지면 원문으로 재확인합니다.
+        """
+        keyword_parts = {kw: TOKEN_PATTERN.findall(kw.lower()) for kw in keywords}
+        all_parts = sorted({part for parts in keyword_parts.values() for part in parts})
+        results = {kw: [] for kw in keywords}
+
+        for col in columns:
+            # 💡 컬럼당 어휘 목록을 한 번만 훑어서 모든 키워드 조각을 동시에 처리
+            part_tokens = self._matching_tokens(col, all_parts)
+            part_rows = {part: self._rows_for_tokens(col, ids) for part, ids in part_tokens.items()}
+
+            for kw, parts in keyword_parts.items():
+                if not parts:
+                    continue
+                rows = part_rows[parts[0]]
+                for part in parts[1:]:
+                    rows = np.intersect1d(rows, part_rows[part], assume_unique=True)
+
+                # 단일 토큰 키워드는 색인 결과가 곧 정답, 그 외는 후보 행만 원문 검증
+                if frame is not None and kw.lower() != parts[0]:
+                    texts = frame[col].iloc[rows].fillna('').astype(str)
+                    rows = rows[texts.str.contains(kw, case=False, regex=False).to_numpy()]
+                results[kw].append(rows)
+
+        return {
+            kw: np.unique(np.concatenate(rows_list)) if rows_list else np.empty(0, dtype=np.int32)
+            for kw, rows_list in results.items()
+        }
+
+    def lookup(self, keyword: str, columns: list[str], frame: pd.DataFrame | None = None) -> np.ndarray:
+        """단일 키워드에 대해 columns 중 하나라도 포함하는 행 번호(정렬됨)를 반환합니다."""
+        return self.lookup_many([keyword], columns, frame)[keyword]
+
+    def save(self, path: str, fingerprint: dict[str, int]) -> None:
+        """색인과 CSV 캐시 키를 npz 파일 하나로 저장합니다."""
+        arrays = {
+            'n_rows': np.array(self.n_rows),
+            'mtime_ns': np.array(fingerprint['mtime_ns']),
+            'size': np.array(fingerprint['size']),
+        }
+        for col, (vocab, indptr, indices) in self.postings.items():
+            arrays[f'{col}__vocab'] = vocab
+            arrays[f'{col}__indptr'] = indptr
+            arrays[f'{col}__indices'] = indices
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str, fingerprint: dict[str, int]) -> 'KeywordIndex | None':
+        """저장된 색인을 읽습니다. CSV 캐시 키가 다르면(=CSV 변경) None을 반환합니다."""
+        with np.load(path) as data:
+            if int(data['mtime_ns']) != fingerprint['mtime_ns'] or int(data['size']) != fingerprint['size']:
+                return None
+            columns = [key[:-len('__vocab')] for key in data.files if key.endswith('__vocab')]
+            postings = {
+                col: (data[f'{col}__vocab'], data[f'{col}__indptr'], data[f'{col}__indices'])
+                for col in columns
+            }
+            return cls(postings, int(data['n_rows']))
+
+
+def load_keyword_index(file_path: str, columns: list[str] = INDEX_COLUMNS) -> KeywordIndex:
+    """
+    CSV 옆에 저장된 키워드 색인을 반환합니다. 없거나 CSV가 바뀌었다면 새로 만들어 저장합니다.
+    """
+    fingerprint = file_fingerprint(file_path)
+    memo_key = f"{os.path.abspath(file_path)}:{fingerprint['mtime_ns']}:{fingerprint['size']}"
+    if memo_key in _INDEX_MEMO:
+        return _INDEX_MEMO[memo_key]
+
+    index_path = file_path + INDEX_SUFFIX
+    index = None
+    if os.path.exists(index_path):
+        try:
+            index = KeywordIndex.load(index_path, fingerprint)
+        except (OSError, ValueError, KeyError):
+            index = None
+
+    if index is None:
+        df = read_netflix_csv(file_path, usecols=columns)
+        index = KeywordIndex.build(df, columns)
+        try:
+            index.save(index_path, fingerprint)
+        except OSError as e:
+            print(f"🚨 경고: 키워드 색인을 저장하지 못했습니다 ({e}).")
+
+    _INDEX_MEMO[memo_key] = index
+    return index
+
+
+def filter_rows_by_keywords(
+    file_path: str,
+    keywords: list[str],
+    cols_to_check: list[str],
+    frame: pd.DataFrame | None = None
+) -> dict[str, np.ndarray]:
+    """
+    여러 키워드(예: 'Korea', 'Japan', 'India')의 행 번호 집합을 한 번에 반환하는 배치 API.
+    반환된 행 번호는 read_netflix_csv(file_path)로 읽은 DataFrame의 위치(iloc)와 일치합니다.
+    이미 로드한 DataFrame이 있으면 frame으로 넘겨 원문 재확인에 사용합니다.
+    """
+    invalid = [kw for kw in keywords if not is_indexable(kw)]
+    if invalid:
+        raise ValueError(f"색인 검색은 일반 키워드만 지원합니다 (정규표현식 불가): {invalid}")
+
+    index = load_keyword_index(file_path)
+    indexed_cols = [col for col in cols_to_check if index.has_column(col)]
+    scan_cols = [col for col in cols_to_check if not index.has_column(col)]
+
+    # 💡 원문이 필요한 경우(여러 토큰 키워드 검증, 색인 밖 컬럼)에만 DataFrame을 읽음
+    needs_frame = any(TOKEN_PATTERN.findall(kw.lower()) != [kw.lower()] for kw in keywords)
+    if frame is None and (needs_frame or scan_cols):
+        frame = read_netflix_csv(file_path, usecols=indexed_cols + scan_cols)
+        scan_cols = [col for col in scan_cols if col in frame.columns]
+
+    results = index.lookup_many(keywords, indexed_cols, frame)
+    for col in scan_cols:
+        texts = frame[col].fillna('').astype(str)
+        for kw in keywords:
+            scanned = np.flatnonzero(texts.str.contains(kw, case=False, regex=False).to_numpy())
+            results[kw] = np.union1d(results[kw], scanned)
+    return results
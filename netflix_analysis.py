@@ -0,0 +1,280 @@
+"""
+넷플릭스 콘텐츠 분석 모듈 + 명령줄(CLI) 진입점.
+
+    python netflix_analysis.py filter    --keyword Korea
+    python netflix_analysis.py freq      --keyword Korea --top-n 20
+    python netflix_analysis.py freq      --keyword Korea --top-n 20 --approx 1e-4   (고정 메모리 근사 빈도)
+    python netflix_analysis.py genres    --keyword Korea
+    python netflix_analysis.py wordcloud --keyword Korea --output korean_netflix_wordcloud.png
+    python netflix_analysis.py barplot   --keyword Korea --output top_words.png
+
+💡 필터링·빈도 계산만 하는 작업이 matplotlib/seaborn/wordcloud/PIL을 불러오지 않도록,
+   무거운 의존성은 해당 기능(함수·서브커맨드)이 실제로 실행될 때만 import 합니다.
+"""
+import argparse
+import sys
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from keyword_index import filter_rows_by_keywords, is_indexable    # 💡 키워드 역색인
+from netflix_data import read_netflix_csv    # 💡 Parquet 캐시 기반 CSV 로더
+from stage_trace import stage    # 💡 단계별 계측 (NETFLIX_TRACE 미설정 시 비용 없음)
+
+if TYPE_CHECKING:
+    from word_frequency import DocumentTermMatrix
+
+# --- 0. 상수 정의 ---
+CSV_FILE = 'netflix_preprocessed.csv'
+MASK_FILE = 'netflix_logo.jpg'
+COUNTRY_COLUMN = 'country'
+GENRE_COLUMN = 'listed_in'
+TITLE_COLUMN = 'title'
+DESCRIPTION_COLUMN = 'description'
+RANDOM_SEED = 42
+APPROX_CHUNK_ROWS = 10_000    # --approx 모드에서 한 번에 토큰화하는 행 수
+CUSTOM_STOP_WORDS = {'series', 'film', 'movie', 'show', 'story', 'life', 'new', 'world', 'us', 'korean', 'korea', 'drama', 'kdrama'} # 사용자 정의 불용어
+
+
+# --- 1. 데이터 로드 및 필터링 함수 ---
+def load_and_filter_data(
+    file_path: str,
+    filter_keyword: str,
+    cols_to_check: list[str],
+    usecols: list[str] | None = None,
+    use_index: bool = True
+) -> pd.DataFrame | None:
+    """
+    CSV 파일을 로드하고 지정된 컬럼들에서 키워드를 포함하는 행을 필터링합니다.
+    usecols를 지정하면 해당 컬럼(+ 필터링 컬럼)만 로드합니다.
+    use_index=True이고 키워드가 일반 문자열이면 키워드 역색인으로 필터링합니다.
+    """
+    try:
+        # 💡 CSV 대신 최신 Parquet 사이드카를 읽음 (필터링 컬럼은 항상 포함)
+        if usecols is not None:
+            usecols = list(dict.fromkeys([*usecols, *cols_to_check]))
+        with stage('load') as s:
+            df = read_netflix_csv(file_path, usecols=usecols)
+            s.set(rows=len(df))
+
+        present_cols = []
+        for col in cols_to_check:
+            if col in df.columns:
+                present_cols.append(col)
+            else:
+                print(f"🚨 경고: 컬럼 '{col}'을 찾을 수 없습니다. 이 컬럼은 필터링에서 제외됩니다.")
+
+        with stage('filter', rows_in=len(df)) as s:
+            if use_index and is_indexable(filter_keyword):
+                # 💡 역색인 조회: 컬럼마다 문자열 스캔 대신 포스팅 리스트의 합집합으로 행 번호를 구함
+                rows = filter_rows_by_keywords(file_path, [filter_keyword], present_cols, frame=df)[filter_keyword]
+                filtered_df = df.iloc[rows].copy()
+            else:
+                # 필터링 조건 조합: 여러 컬럼에 대해 OR 조건을 적용 (정규표현식 키워드)
+                filter_condition = False
+                for col in present_cols:
+                    filter_condition = filter_condition | df[col].fillna('').str.contains(filter_keyword, case=False, na=False)
+                filtered_df = df[filter_condition].copy()
+            s.set(rows=len(filtered_df))
+
+        if filtered_df.empty:
+            print(f"🚨 경고: '{filter_keyword}' 관련 콘텐츠를 찾을 수 없습니다.")
+            return None
+
+        return filtered_df
+
+    except FileNotFoundError:
+        print(f"🚨 오류: {file_path} 파일을 찾을 수 없습니다.")
+        return None
+
+
+# --- 2. 텍스트 전처리 및 단어 빈도 분석 함수 ---
+def analyze_word_frequency(
+    df: pd.DataFrame,
+    text_col: str,
+    custom_stopwords: set[str],
+    dtm: 'DocumentTermMatrix | None' = None
+) -> tuple[pd.DataFrame, str | None]:
+    """
+    텍스트 컬럼을 전처리하고 단일 순회 토크나이저(fast_tokenizer)로 단어 빈도를 추출.
+    dtm(문서-단어 행렬)을 넘기면 재토큰화 없이 df 행들의 희소 행 합으로 빈도를 구합니다. (text_clean은 None)
+    """
+    if dtm is not None:
+        return dtm.frequencies(df.index, custom_stopwords).to_frame(), None
+
+    from collections import Counter
+    from fast_tokenizer import clean_texts, filter_tokens
+    from text_resources import get_stopwords
+    from word_frequency import counts_to_word_df
+
+    # 데이터 프레임에서 텍스트 컬럼을 추출하여 특수문자 제거·소문자 정제 후 하나의 긴 문자열로 결합
+    # 💡 정규식 치환 + lower() 대신 (ASCII 텍스트는) str.translate 한 번, CountVectorizer 재토큰화 대신 split() + Counter
+    # (결과는 CountVectorizer(stop_words=영문+사용자 불용어, token_pattern=TOKEN_PATTERN)와 동일)
+    text_clean = clean_texts(df[text_col].dropna().tolist())
+    word_df = counts_to_word_df(Counter(filter_tokens(text_clean.split(), get_stopwords(custom_stopwords))))
+
+    return word_df, text_clean
+
+
+# --- 3. 피처 엔지니어링 ---
+def engineer_korea_features(df: pd.DataFrame, text_col: str, genre_col: str) -> tuple[pd.DataFrame, pd.Series]:
+    """KOREA 콘텐츠 데이터프레임에 새로운 피처를 엔지니어링하고, 장르 빈도 데이터를 추출합니다."""
+    from netflix_features import GenreMatrix, k_drama_flag
+
+    # 💡 explode() 대신 장르 멀티-핫 희소 행렬의 열 합으로 상위 10개 장르 계산
+    k_genre_counts = GenreMatrix.build(df, genre_col).top(n=10)
+    # 💡 행별 apply(lambda) 대신 컴파일된 정규식 한 번으로 대소문자 무시 검색
+    df['K_Drama_Flag'] = k_drama_flag(df[text_col])
+    return df, k_genre_counts
+
+
+# --- 4. 명령줄(CLI) ---
+def _load_from_args(args: argparse.Namespace) -> pd.DataFrame | None:
+    return load_and_filter_data(args.csv, args.keyword, args.cols, use_index=not args.no_index)
+
+
+def _word_frequency_from_args(args: argparse.Namespace) -> pd.DataFrame | None:
+    df = _load_from_args(args)
+    if df is None:
+        return None
+    stopwords = CUSTOM_STOP_WORDS | set(args.stopwords)
+    if args.approx is not None:
+        # 💡 근사 모드: 전체 어휘 대신 Space-Saving 요약(ceil(1/ε)개 단어)만 유지
+        from heavy_hitters import sketch_word_frequency
+        chunks = (df.iloc[start:start + APPROX_CHUNK_ROWS] for start in range(0, len(df), APPROX_CHUNK_ROWS))
+        return sketch_word_frequency(chunks, args.text_col, stopwords, epsilon=args.approx).top()
+    word_df, _ = analyze_word_frequency(df, args.text_col, stopwords)
+    return word_df
+
+
+def _write_or_print(df: pd.DataFrame, output: str | None) -> None:
+    if output:
+        df.to_csv(output, index=False)
+        print(f"✅ 결과가 '{output}' 파일로 저장되었습니다.")
+    else:
+        print(df.to_string(index=False))
+
+
+def _cmd_filter(args: argparse.Namespace) -> int:
+    df = _load_from_args(args)
+    if df is None:
+        return 1
+    print(f"✅ '{args.keyword}' 관련 콘텐츠 총 {len(df)}개 발견.")
+    if args.output:
+        _write_or_print(df, args.output)
+    return 0
+
+
+def _cmd_freq(args: argparse.Namespace) -> int:
+    word_df = _word_frequency_from_args(args)
+    if word_df is None:
+        return 1
+    _write_or_print(word_df.head(args.top_n), args.output)
+    return 0
+
+
+def _cmd_genres(args: argparse.Namespace) -> int:
+    df = _load_from_args(args)
+    if df is None:
+        return 1
+    _, genre_counts = engineer_korea_features(df, args.text_col, GENRE_COLUMN)
+    _write_or_print(genre_counts.reset_index(), args.output)
+    return 0
+
+
+def _cmd_wordcloud(args: argparse.Namespace) -> int:
+    word_df = _word_frequency_from_args(args)
+    if word_df is None:
+        return 1
+
+    # 💡 렌더링 서브커맨드에서만 wordcloud/PIL(/matplotlib)을 불러옴
+    from wordcloud import WordCloud
+    from wordcloud_render import (
+        export_wordcloud_image, generate_from_frequencies_cached, prepare_mask, render_wordcloud_figure
+    )
+
+    mask = prepare_mask(args.mask) if args.mask else None
+    wordcloud = generate_from_frequencies_cached(
+        WordCloud(background_color='white', width=1400, height=1400, max_words=170,
+                  mask=mask, collocations=False, random_state=RANDOM_SEED),
+        dict(zip(word_df['word'], word_df['freq']))
+    )
+    title = f"Keywords in {args.keyword} Netflix Content Descriptions"
+    if args.direct:
+        export_wordcloud_image(wordcloud, title, args.output)
+    else:
+        render_wordcloud_figure(wordcloud, title, args.output)
+    print(f"✅ 워드 클라우드 이미지가 '{args.output}' 파일로 저장되었습니다.")
+    return 0
+
+
+def _cmd_barplot(args: argparse.Namespace) -> int:
+    word_df = _word_frequency_from_args(args)
+    if word_df is None:
+        return 1
+
+    # 💡 렌더링 서브커맨드에서만 matplotlib/seaborn을 불러옴 (화면 없이 Agg로 저장)
+    import seaborn as sns
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    sns.barplot(data=word_df.head(args.top_n), x='freq', y='word', hue='word',
+                palette='viridis', legend=False, ax=ax)
+    ax.set_title(f'{args.keyword} Top {args.top_n} Words in Descriptions', fontsize=16)
+    ax.set_xlabel('Frequency')
+    ax.set_ylabel('Word')
+    fig.savefig(args.output, dpi=150, bbox_inches='tight')
+    print(f"✅ 막대 그래프가 '{args.output}' 파일로 저장되었습니다.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """서브커맨드(filter, freq, genres, wordcloud, barplot)를 가진 명령줄 파서를 만듭니다."""
+    parser = argparse.ArgumentParser(description='넷플릭스 키워드 기반 콘텐츠 분석')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--csv', default=CSV_FILE, help='입력 CSV 파일 경로')
+    common.add_argument('--keyword', default='Korea', help='필터링 키워드')
+    common.add_argument('--cols', nargs='+', default=[DESCRIPTION_COLUMN, TITLE_COLUMN, GENRE_COLUMN],
+                        help='키워드를 검사할 컬럼')
+    common.add_argument('--text-col', default=DESCRIPTION_COLUMN, help='단어 빈도를 분석할 텍스트 컬럼')
+    common.add_argument('--stopwords', nargs='*', default=[], help='추가 불용어')
+    common.add_argument('--no-index', action='store_true', help='키워드 역색인 대신 문자열 스캔 사용')
+
+    commands = [
+        ('filter', _cmd_filter, '키워드로 콘텐츠 필터링'),
+        ('freq', _cmd_freq, '단어 빈도 표 출력/저장'),
+        ('genres', _cmd_genres, '상위 10개 장르 출력/저장'),
+        ('wordcloud', _cmd_wordcloud, '워드 클라우드 PNG 저장'),
+        ('barplot', _cmd_barplot, '상위 단어 막대 그래프 PNG 저장'),
+    ]
+    for name, handler, help_text in commands:
+        sub = subparsers.add_parser(name, parents=[common], help=help_text)
+        sub.set_defaults(handler=handler)
+        if name in ('freq', 'barplot'):
+            sub.add_argument('--top-n', type=int, default=10, help='상위 단어 개수')
+        if name in ('freq', 'wordcloud', 'barplot'):
+            sub.add_argument('--approx', type=float, default=None, metavar='EPS',
+                             help='근사 빈도(Space-Saving) 사용: 과대 추정 오차 ≤ EPS × 전체 토큰 수 (예: 1e-4)')
+        if name in ('wordcloud', 'barplot'):
+            sub.add_argument('--output', required=True, help='저장할 이미지 파일 경로')
+        else:
+            sub.add_argument('--output', default=None, help='결과를 저장할 CSV 경로 (생략 시 화면 출력)')
+        if name == 'wordcloud':
+            sub.add_argument('--mask', default=None, help=f'마스크 이미지 경로 (예: {MASK_FILE})')
+            sub.add_argument('--direct', action='store_true', help='matplotlib 없이 PNG/WebP로 바로 저장')
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """명령줄 진입점. 종료 코드(0: 성공, 1: 데이터 없음)를 반환합니다."""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+import json
+import os
+
+import pandas as pd
+
+from cache_utils import file_fingerprint
+
+# 💡 Parquet 사이드카는 pyarrow가 있을 때만 사용 (없으면 기존처럼 CSV를 그대로 읽음)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# --- 상수 정의 ---
+CATEGORY_COLUMNS = ['type', 'rating', 'age_group']    # 카테고리형으로 저장할 컬럼
+SIDECAR_SUFFIX = '.parquet'
+META_SUFFIX = '.meta.json'
+
+
+def _sidecar_paths(file_path: str) -> tuple[str, str]:
+    """CSV 파일 옆에 저장될 Parquet 사이드카와 메타데이터 파일 경로를 반환합니다."""
+    return file_path + SIDECAR_SUFFIX, file_path + META_SUFFIX
+
+
+def _is_sidecar_fresh(file_path: str, fingerprint: dict[str, int]) -> bool:
+    """사이드카가 존재하고, 저장 당시의 CSV 키가 현재 CSV와 동일한지 확인합니다."""
+    sidecar_path, meta_path = _sidecar_paths(file_path)
+    if not (os.path.exists(sidecar_path) and os.path.exists(meta_path)):
+        return False
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            return json.load(f) == fingerprint
+    except (OSError, ValueError):
+        return False
+
+
+def _write_sidecar(df: pd.DataFrame, file_path: str, fingerprint: dict[str, int]) -> None:
+    """타입이 지정된 DataFrame을 Parquet로 저장하고, 캐시 키를 메타 파일에 기록합니다."""
+    sidecar_path, meta_path = _sidecar_paths(file_path)
+    try:
+        df.to_parquet(sidecar_path, index=False)
+        # 💡 메타 파일은 Parquet 저장이 끝난 뒤에 기록 → 중간에 실패하면 다음 실행에서 다시 생성
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(fingerprint, f)
+    except (OSError, ValueError, pa.ArrowException) as e:
+        # 💡 혼합 타입 object 컬럼 등 Parquet로 변환할 수 없는 경우(ArrowInvalid/ArrowTypeError)도 CSV 결과로 진행
+        print(f"🚨 경고: 캐시 파일을 저장하지 못했습니다 ({e}). CSV로만 진행합니다.")
+
+
+def read_netflix_csv(file_path: str, usecols: list[str] | None = None) -> pd.DataFrame:
+    """
+    CSV 파일을 로드하되, 최신 Parquet 사이드카가 있으면 그것을 대신 읽습니다.
+    사이드카는 CSV의 mtime과 크기로 유효성을 판단하며, usecols에 지정한 컬럼만 읽습니다.
+    (usecols 중 파일에 없는 컬럼은 건너뛰며, 경고는 호출하는 쪽에서 처리합니다.)
+    """
+    fingerprint = file_fingerprint(file_path)
+
+    if HAS_PYARROW and _is_sidecar_fresh(file_path, fingerprint):
+        sidecar_path, _ = _sidecar_paths(file_path)
+        if usecols is not None:
+            available = pq.read_schema(sidecar_path).names
+            usecols = [col for col in usecols if col in available]
+        return pd.read_parquet(sidecar_path, columns=usecols)
+
+    df = pd.read_csv(file_path)
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    if HAS_PYARROW:
+        _write_sidecar(df, file_path, fingerprint)
+
+    if usecols is not None:
+        df = df[[col for col in usecols if col in df.columns]]
+    return df
@@ -0,0 +1,81 @@
+import re
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+# --- 상수 정의 ---
+GENRE_SEPARATOR = ', '
+K_DRAMA_REGEX = re.compile(r'kdrama|drama', re.IGNORECASE)    # 'kdrama'도 'drama'를 포함하지만 의도를 명시
+
+
+def k_drama_flag(texts: pd.Series) -> pd.Series:
+    """텍스트에 'drama' 또는 'kdrama'가 (대소문자 무시) 포함되면 1, 아니면 0. 한 번의 벡터화 검색으로 계산합니다."""
+    return texts.fillna('').str.contains(K_DRAMA_REGEX, na=False).astype(int)
+
+
+def _split_genres(text: str) -> list[str]:
+    """'Dramas, Romantic TV Shows' → ['Dramas', 'Romantic TV Shows'] (빈 문자열은 장르 없음)"""
+    return text.split(GENRE_SEPARATOR) if text else []
+
+
+class GenreMatrix:
+    """
+    장르 컬럼(listed_in)의 멀티-핫 희소 행렬 (행 = DataFrame 인덱스 순서, 열 = 장르).
+    임의의 부분집합에 대한 장르 빈도는 해당 행들의 열 합(column sum)으로 구합니다.
+    """
+
+    def __init__(self, matrix: sparse.csr_matrix, genres: np.ndarray, index: pd.Index, name: str):
+        self.matrix = matrix
+        self.genres = genres
+        self.index = index
+        self.name = name
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, genre_col: str) -> 'GenreMatrix':
+        """explode() 없이 CountVectorizer(binary=True)로 장르 멀티-핫 행렬을 생성합니다."""
+        vectorizer = CountVectorizer(
+            tokenizer=_split_genres, token_pattern=None, lowercase=False, binary=True
+        )
+        try:
+            matrix = vectorizer.fit_transform(df[genre_col].fillna('').astype(str).tolist()).tocsr()
+        except ValueError:
+            # 💡 장르 컬럼이 비었거나 모두 결측이면 CountVectorizer가 'empty vocabulary' 오류를 냄 → 장르 0개 행렬
+            return cls(sparse.csr_matrix((len(df), 0), dtype=np.int64), np.array([], dtype=object), df.index, genre_col)
+        return cls(matrix, vectorizer.get_feature_names_out(), df.index, genre_col)
+
+    def _positions(self, rows: pd.Series | pd.Index | np.ndarray | list | None) -> np.ndarray | None:
+        """불리언 마스크(Series/배열/리스트) 또는 인덱스 라벨 목록을 행렬의 행 번호로 변환합니다."""
+        if rows is None:
+            return None
+        if isinstance(rows, pd.Series) and rows.dtype == bool:
+            # 💡 df[col] == x 같은 마스크는 위치가 아니라 인덱스 기준으로 맞춤
+            return np.flatnonzero(rows.reindex(self.index, fill_value=False).to_numpy())
+        mask = np.asarray(rows)
+        if mask.dtype == bool:
+            if len(mask) != len(self.index):
+                raise ValueError(f"불리언 마스크 길이({len(mask)})가 행 수({len(self.index)})와 다릅니다.")
+            return np.flatnonzero(mask)
+        positions = self.index.get_indexer(pd.Index(rows))
+        if (positions < 0).any():
+            raise KeyError("장르 행렬에 없는 인덱스가 포함되어 있습니다.")
+        return positions
+
+    def counts(self, rows: pd.Series | pd.Index | np.ndarray | None = None) -> pd.Series:
+        """
+        선택한 행(인덱스 라벨 또는 불리언 마스크, None이면 전체)의 장르별 작품 수를 내림차순 Series로 반환합니다.
+        (value_counts()와 같은 형태: 이름 'count', 인덱스 이름은 장르 컬럼명)
+        """
+        positions = self._positions(rows)
+        subset = self.matrix if positions is None else self.matrix[positions]
+        totals = np.asarray(subset.sum(axis=0)).ravel()
+        order = np.argsort(-totals, kind='stable')
+        order = order[totals[order] > 0]
+        return pd.Series(
+            totals[order], index=pd.Index(self.genres[order], name=self.name), name='count'
+        )
+
+    def top(self, rows: pd.Series | pd.Index | np.ndarray | None = None, n: int = 10) -> pd.Series:
+        """선택한 행의 상위 n개 장르 빈도 (engineer_korea_features의 k_genre_counts와 같은 형태)."""
+        return self.counts(rows).head(n)
@@ -3,10 +3,16 @@ import seaborn as sns
 import pandas as pd
 import numpy as np
 from wordcloud import WordCloud
-from PIL import Image
-import random
-from typing import Optional, Dict, Any, Set, List, Tuple
-import re # 정규표현식 사용
+from typing import Optional, Set, List, Tuple
+
+from netflix_data import read_netflix_csv    # 💡 Parquet 캐시 기반 CSV 로더
+from fast_tokenizer import tokenize    # 💡 translate 기반 단일 순회 토크나이저
+from netflix_analysis import engineer_korea_features    # 💡 벡터화된 피처 엔지니어링 (공용 분석 모듈)
+from wordcloud_render import (    # 💡 워드 클라우드 배치(layout)·마스크 캐시, 헤드리스 렌더링
+    assign_layout_colors, export_wordcloud_image, generate_from_frequencies_cached, placeholder_color_func,
+    prepare_mask, render_wordcloud_figure
+)
+from stage_trace import stage    # 💡 단계별 계측: NETFLIX_TRACE=trace.jsonl(또는 .json)으로 켬, 미설정 시 비용 없음
 
 # --- 상수 정의 (유지보수 용이성 확보) ---
 CSV_FILE = 'netflix_preprocessed.csv'
@@ -17,20 +23,28 @@ TEXT_COLUMN = 'description'
 COUNTRY_COLUMN = 'country'
 GENRE_COLUMN = 'listed_in'
 RANDOM_SEED = 42
+NETFLIX_COLORS = ['#221F1F', '#B20710']    # 넷플릭스 테마 (블랙, 레드)
 
 # 💡 U+00A0 오류 방지: 한 줄로 정의함
 DEFAULT_STOPWORDS = {'series', 'film', 'movie', 'show', 'story', 'life', 'new', 'world', 'us', 'based', 'one', 'two', 'young', 'old', 'about', 'from', 'with', 'who', 'when', 'what', 'where', 'their', 'they', 'them', 'this', 'that', 'these', 'those', 'also', 'after', 'before', 'just', 'much', 'many', 'more', 'most', 'very', 'get', 'got', 'make', 'made', 'take', 'takes', 'find', 'found', 'come', 'comes', 'go', 'goes', 'see', 'saw', 'said', 'say', 'into', 'through', 'while', 'upon', 'among', 'across', 'always', 'ever', 'never', 'might', 'must', 'should', 'could', 'would', 'can', 'will', 'may', 'way', 'time', 'years', 'first', 'their', 'all', 'its', 'her', 'his', 'which', 'had', 'etc', 'korean', 'korea', 'drama', 'kdrama', 'a', 'an', 'to', 'of', 'for', 'in', 'on', 'at', 'and', 'the', 'is', 'but', 'as', 'by', 'he', 'she', 'out', 'up'}
 
 # --- 1. 데이터 로드 및 필터링 ---
 
-def load_and_filter_data(file_path: str, country_col: str, genre_col: str) -> Optional[pd.DataFrame]:
-    """지정된 CSV 파일을 로드하고 'Korea' 관련 콘텐츠를 필터링합니다."""
+def load_and_filter_data(file_path: str, country_col: str, genre_col: str,
+                         usecols: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """지정된 CSV 파일을 로드하고 'Korea' 관련 콘텐츠를 필터링합니다. (usecols 지정 시 해당 컬럼만 로드)"""
     try:
-        df = pd.read_csv(file_path)
-        korea_df = df[
-            df[country_col].fillna('').str.contains('Korea', case=False, na=False) |
-            df[genre_col].fillna('').str.contains('Korean', case=False, na=False)
-        ].copy()
+        if usecols is not None:
+            usecols = list(dict.fromkeys([*usecols, country_col, genre_col]))
+        with stage('load') as s:
+            df = read_netflix_csv(file_path, usecols=usecols)
+            s.set(rows=len(df))
+        with stage('filter', rows_in=len(df)) as s:
+            korea_df = df[
+                df[country_col].fillna('').str.contains('Korea', case=False, na=False) |
+                df[genre_col].fillna('').str.contains('Korean', case=False, na=False)
+            ].copy()
+            s.set(rows=len(korea_df))
         
         if korea_df.empty:
             print("🚨 경고: 'Korea' 관련 콘텐츠를 찾을 수 없습니다.")
@@ -45,58 +59,53 @@ def load_and_filter_data(file_path: str, country_col: str, genre_col: str) -> Op
 
 # --- 2. 피처 엔지니어링 ---
 
-def engineer_korea_features(df: pd.DataFrame, text_col: str, genre_col: str) -> Tuple[pd.DataFrame, pd.Series]:
-    """KOREA 콘텐츠 데이터프레임에 새로운 피처를 엔지니어링하고, 장르 빈도 데이터를 추출합니다."""
-    all_k_genres = df[genre_col].str.split(', ').explode().dropna()
-    k_genre_counts = all_k_genres.value_counts().head(10)
-    df['K_Drama_Flag'] = df[text_col].fillna('').apply(
-        lambda x: 1 if 'drama' in x.lower() or 'kdrama' in x.lower() else 0
-    )
-    return df, k_genre_counts
+# 💡 engineer_korea_features는 netflix_analysis 모듈의 구현(장르 멀티-핫 행렬 + 정규식 플래그)을 그대로 사용
 
 # --- 3. 텍스트 전처리 ---
 
 def preprocess_text_for_wordcloud(df: pd.DataFrame, text_col: str, stopwords: Set[str]) -> str:
     """워드 클라우드용으로 텍스트를 추출하고 전처리합니다."""
     clean_descriptions = df[text_col].fillna('')
-    combined_text = clean_descriptions.str.cat(sep=' ')
-    combined_text = re.sub(r'[^가-힣a-zA-Z\s]', '', combined_text) 
-    combined_text = combined_text.lower()
-    
-    words = combined_text.split()
-    filtered_words = [word for word in words if word not in stopwords and len(word) > 1] 
-    
+    # 💡 정규식 삭제 + lower() + split() + 불용어 필터를 translate 한 번과 리스트 한 번으로 처리
+    filtered_words = tokenize(clean_descriptions.tolist(), stopwords, delete=True)
+
     return ' '.join(filtered_words)
 
 # --- 4. 워드 클라우드 관련 유틸리티 ---
 
-def load_mask(mask_path: str) -> Optional[np.ndarray]:
-    """마스크 이미지를 로드하고 NumPy 배열로 변환합니다."""
+def load_mask(mask_path: str, canvas_size: Optional[Tuple[int, int]] = None) -> Optional[np.ndarray]:
+    """
+    마스크 이미지를 로드하여 이진화된 uint8 배열(흰색=255, 나머지=0)로 반환합니다.
+    canvas_size=(width, height)를 주면 크기를 맞추며, 결과는 .npy 캐시로 재사용됩니다.
+    """
     try:
-        return np.array(Image.open(mask_path))
+        # 💡 디코딩·임계값 처리는 처음 한 번만: 이후에는 .npy 캐시를 메모리 매핑으로 읽음
+        return prepare_mask(mask_path, canvas_size)
     except FileNotFoundError:
         print(f"🚨 경고: {mask_path} 파일을 찾을 수 없어 마스크 없이 진행합니다.")
         return None
 
-def netflix_color_func(word: str, font_size: int, position: tuple, orientation: int, 
-                       random_state: Optional[int] = None, **kwargs: Dict[str, Any]) -> str:
-    """WordCloud 객체를 위한 넷플릭스 테마(레드, 블랙) 무작위 색상 선택 함수."""
-    colors = ['#221F1F', '#B20710'] 
-    return random.choice(colors)
-
 def generate_wordcloud_object(text: str, mask: Optional[np.ndarray], stopwords: Set[str]) -> WordCloud:
-    """결합된 텍스트와 마스크를 사용하여 WordCloud 객체를 생성합니다."""
-    return WordCloud(
+    """결합된 텍스트와 마스크를 사용하여 WordCloud 객체를 생성합니다. (같은 입력이면 캐시된 배치 사용)"""
+    wordcloud = WordCloud(
         background_color='white',
         width=1400,
         height=1400,
         max_words=170,
         mask=mask,
-        color_func=netflix_color_func,
+        color_func=placeholder_color_func,    # 💡 단어별 색상 콜백 대신 배치 후 assign_layout_colors로 한 번에
         collocations=False, 
         stopwords=stopwords, 
         random_state=RANDOM_SEED
-    ).generate(text)
+    )
+    # 💡 토큰화·빈도 계산(vectorize)과 단어 배치(layout)를 나눠서 계측 (generate_cached와 같은 동작)
+    with stage('vectorize') as s:
+        frequencies = wordcloud.process_text(text)
+        s.set(vocab_size=len(frequencies))
+    with stage('layout', max_words=wordcloud.max_words):
+        generate_from_frequencies_cached(wordcloud, frequencies)
+    # 💡 색상은 배치 전체에 한 번에 지정 (캐시 적중 여부와 관계없이 RANDOM_SEED로 항상 같은 색)
+    return assign_layout_colors(wordcloud, NETFLIX_COLORS, RANDOM_SEED)
 
 # --- 5. 시각화 함수 ---
 
@@ -118,26 +127,32 @@ def plot_genre_distribution(genre_counts: pd.Series, title: str) -> None:
     plt.tight_layout()
     plt.show()
 
-def save_wordcloud_image_final(wordcloud: WordCloud, title: str, filename: str = "korean_netflix_wordcloud.png") -> None:
+def save_wordcloud_image_final(wordcloud: WordCloud, title: str, filename: str = "korean_netflix_wordcloud.png",
+                               show: bool = True, direct: bool = False, compress_level: int = 6) -> None:
     """
     워드 클라우드 결과물을 파일로 직접 저장하며, bbox_inches='tight'로 제목 잘림을 방지하고 화면에 출력합니다.
+    저장은 pyplot 전역 상태 없이 Agg 캔버스로 하므로, show=False이면 화면(GUI) 없이 동작합니다.
+    direct=True이면 matplotlib 없이 비트맵을 바로 PNG/WebP로 저장합니다. (제목은 PIL로 그림)
     """
-    plt.figure(figsize=(15, 6)) 
-    
-    # suptitle 설정 (y 값을 수동으로 조정할 필요 없이 기본값 사용)
-    plt.suptitle(title, fontweight='bold', fontfamily='serif', fontsize=18) 
-    plt.imshow(wordcloud, interpolation='bilinear')
-    plt.axis('off')
-
     # ⭐ Critical Path Solution: bbox_inches='tight'로 모든 요소가 포함되도록 저장합니다.
     try:
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
+        if direct:
+            export_wordcloud_image(wordcloud, title, filename, compress_level=compress_level)
+        else:
+            render_wordcloud_figure(wordcloud, title, filename, dpi=300)
         print(f"✅ 워드 클라우드 이미지가 '{filename}' 파일로 성공적으로 저장되었습니다.")
         print("파일이 스크립트 실행 폴더에 저장되었는지 확인해주세요.")
     except Exception as e:
         print(f"🚨 파일 저장 중 오류가 발생했습니다: {e}")
     
-    # 💡 화면 출력 추가: 이 때 화면상에서는 제목이 잘려 보일 수 있으나, 파일은 완벽합니다.
+    if not show:
+        return
+
+    # 💡 화면 출력: 이 때 화면상에서는 제목이 잘려 보일 수 있으나, 파일은 완벽합니다.
+    plt.figure(figsize=(15, 6)) 
+    plt.suptitle(title, fontweight='bold', fontfamily='serif', fontsize=18) 
+    plt.imshow(wordcloud, interpolation='bilinear')
+    plt.axis('off')
     plt.show() 
     plt.close()
 
@@ -146,26 +161,32 @@ if __name__ == "__main__":
     print("--- 넷플릭스 KOREA 콘텐츠 분석 시작 ---")
 
     # 1. 데이터 로드 및 필터링
-    korea_df_filtered = load_and_filter_data(CSV_FILE, COUNTRY_COLUMN, GENRE_COLUMN)
+    korea_df_filtered = load_and_filter_data(
+        CSV_FILE, COUNTRY_COLUMN, GENRE_COLUMN, usecols=[TEXT_COLUMN]
+    )
     if korea_df_filtered is None:
         exit()
 
     # 2. 피처 엔지니어링
-    korea_df_processed, k_top_genres = engineer_korea_features(
-        korea_df_filtered, TEXT_COLUMN, GENRE_COLUMN
-    )
+    with stage('features', rows=len(korea_df_filtered)):
+        korea_df_processed, k_top_genres = engineer_korea_features(
+            korea_df_filtered, TEXT_COLUMN, GENRE_COLUMN
+        )
     print(f"\nKOREA 콘텐츠 총 {len(korea_df_processed)}개 발견.")
     
     # 3. 텍스트 전처리
-    wordcloud_text = preprocess_text_for_wordcloud(
-        korea_df_processed, TEXT_COLUMN, DEFAULT_STOPWORDS
-    )
+    with stage('preprocess', rows=len(korea_df_processed)) as s:
+        wordcloud_text = preprocess_text_for_wordcloud(
+            korea_df_processed, TEXT_COLUMN, DEFAULT_STOPWORDS
+        )
+        s.set(chars=len(wordcloud_text))
     if not wordcloud_text: 
         print("🚨 오류: 워드 클라우드를 생성할 텍스트가 충분하지 않습니다. 프로그램 종료.")
         exit()
 
     # 4. 마스크 로드
-    mask_array = load_mask(MASK_FILE)
+    with stage('mask'):
+        mask_array = load_mask(MASK_FILE)
 
     # 5. 워드 클라우드 객체 생성
     wordcloud_obj = generate_wordcloud_object(
@@ -176,9 +197,11 @@ if __name__ == "__main__":
     print("\n--- 분석 결과 시각화 ---")
     
     # 6.1. 장르 분포 그래프 (화면 표시)
-    plot_genre_distribution(k_top_genres, PLOT_TITLE_GENRE)
+    with stage('render', plot='genre_distribution'):
+        plot_genre_distribution(k_top_genres, PLOT_TITLE_GENRE)
     
     # 6.2. 워드 클라우드 (파일 저장 및 화면 출력)
-    save_wordcloud_image_final(wordcloud_obj, PLOT_TITLE_WC)
+    with stage('save', plot='wordcloud'):
+        save_wordcloud_image_final(wordcloud_obj, PLOT_TITLE_WC)
 
     print("--- 넷플릭스 KOREA 콘텐츠 분석 완료 ---")
\ No newline at end of file
@@ -6,6 +6,8 @@ from wordcloud import WordCloud
 from sklearn.feature_extraction.text import CountVectorizer
 import re # 💡 오류 2: 데이터 필터링 정확도를 위한 re 모듈 임포트 추가
 
+from word_frequency import WordFrequency # 💡 희소 행렬 기반 단어 빈도 (toarray() 대체)
+
 # 1. 데이터 로드
 file_path = 'netflix_preprocessed.csv'
 # 🚨 주의: 파일 경로와 파일 이름이 정확한지 확인하세요.
@@ -38,19 +40,11 @@ text = ' '.join(korea_data['description'].dropna().tolist())
 vectorizer = CountVectorizer(stop_words='english') # , token_pattern=r'(?u)\b\w\w+\b') # 두 글자 이상 단어만 추출
 word_matrix = vectorizer.fit_transform([text])
 # 💡 오류 4: wors_freq -> word_freq (변수명 오타 수정)
-word_freq = word_matrix.toarray().flatten() 
-
-# 단어와 빈도수를 데이터프레임으로 생성
-word_df = pd.DataFrame({
-    'word': vectorizer.get_feature_names_out(), 
-    'freq': word_freq
-})
+# 💡 toarray().flatten() 대신 희소 행렬에서 직접 빈도 추출 (전체 정렬 없이 상위 10개만 선택)
+word_freq = WordFrequency.from_matrix(word_matrix, vectorizer.get_feature_names_out())
 
-# 💡 오류 5: sort_valuse -> sort_values로 수정
-# 💡 오류 6: by='frequency' -> by='freq'로 컬럼명 일치 수정
 # 💡 오류 7: top_wird_df -> top_words_df (변수명 오타 수정)
-word_df_sorted = word_df.sort_values(by='freq', ascending=False)
-top_words_df = word_df_sorted.head(10)
+top_words_df = word_freq.top(10)
 print(top_words_df)
 
 # 5. 시각화: 상위 단어를 seaborn을 사용하여 시각화
@@ -64,7 +58,7 @@ plt.show()
 
 # 6. 시각화: 워드클라우드 생성
 wordcloud = WordCloud(width=800, height=400, background_color='white').generate_from_frequencies(
-    dict(zip(word_df_sorted['word'], word_df_sorted['freq'])) # 💡 수정: 정렬된 word_df_sorted 사용
+    word_freq.to_dict() # 💡 수정: 빈도 딕셔너리는 정렬이 필요 없음
 )
 
 # 워드클라우드 시각화
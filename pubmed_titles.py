@@ -0,0 +1,121 @@
+import re
+from collections import Counter
+from operator import itemgetter
+from typing import Iterable, Iterator
+
+import pandas as pd
+from wordcloud import STOPWORDS
+
+# --- 상수 정의 ---
+PUBMED_FILE = 'pubmed_title.csv'
+TITLE_COLUMN = 'Title'
+YEAR_COLUMN = 'Publication Year'
+JOURNAL_COLUMN = 'Journal/Book'
+PUBMED_COLUMNS = [TITLE_COLUMN, YEAR_COLUMN, JOURNAL_COLUMN]
+WORD_REGEX = re.compile(r"\w[\w']*")    # WordCloud.process_text와 같은 단어 정규식
+PUBMED_STOPWORDS = frozenset(word.lower() for word in STOPWORDS)
+
+
+def read_pubmed_chunks(file_path: str = PUBMED_FILE, chunksize: int = 50_000) -> Iterator[pd.DataFrame]:
+    """PubMed 내보내기 CSV에서 제목/연도/저널 컬럼만 청크 단위로 읽습니다. (BOM 포함 파일 대응)"""
+    return pd.read_csv(
+        file_path,
+        usecols=PUBMED_COLUMNS,
+        dtype={TITLE_COLUMN: 'string', YEAR_COLUMN: 'string', JOURNAL_COLUMN: 'string'},
+        encoding='utf-8-sig',
+        chunksize=chunksize,
+    )
+
+
+def tokenize_title(title: str, stopwords: frozenset[str] = PUBMED_STOPWORDS) -> list[str]:
+    """
+    제목 하나를 단어 목록으로 분해합니다. (대소문자는 유지, 정리는 fuse_word_counts에서)
+    WordCloud.process_text 기본 설정과 같이 "'s"를 떼고, 숫자만으로 된 단어와 불용어(대소문자 무시)를 제외합니다.
+    """
+    tokens = []
+    for word in WORD_REGEX.findall(title):
+        if word.lower().endswith("'s"):
+            word = word[:-2]
+        if not word.isdigit() and word.lower() not in stopwords:
+            tokens.append(word)
+    return tokens
+
+
+def fuse_word_counts(counts: Counter, normalize_plurals: bool = True) -> dict[str, int]:
+    """
+    대소문자를 유지한 단어 빈도에 WordCloud.process_text의 후처리(wordcloud.tokenization.process_tokens)를 적용합니다.
+    - 복수형 병합: 단수형('s'를 뗀 단어)이 있으면 'ss'로 끝나지 않는 '…s' 단어를 단수형에 합침
+    - 대소문자 병합: 소문자가 같은 단어의 빈도를 합치고, 가장 많이 쓰인 표기(동점이면 먼저 나온 표기)를 사용
+    토큰 목록 대신 빈도 딕셔너리에서 계산하므로 어휘 수에만 비례합니다. (Counter의 삽입 순서 = 처음 등장 순서)
+    """
+    cases: dict[str, dict[str, int]] = {}
+    for word, count in counts.items():
+        cases.setdefault(word.lower(), {})[word] = count
+
+    if normalize_plurals:
+        for key in list(cases):
+            if key.endswith('s') and not key.endswith('ss') and key[:-1] in cases:
+                singular = cases[key[:-1]]
+                for word, count in cases.pop(key).items():
+                    singular[word[:-1]] = singular.get(word[:-1], 0) + count
+
+    return {
+        max(case_counts.items(), key=itemgetter(1))[0]: sum(case_counts.values())
+        for case_counts in cases.values()
+    }
+
+
+class TitleTokenCounts:
+    """전체 단어 빈도와, 그룹(연도·저널 등)별 단어 빈도를 함께 보관합니다. (대소문자를 유지한 원래 표기 기준)"""
+
+    def __init__(self, group_cols: list[str]):
+        self.total: Counter = Counter()
+        self.by_group: dict[str, dict[str, Counter]] = {col: {} for col in group_cols}
+        self.n_titles = 0
+
+    def frequencies(self, group_col: str | None = None, value: str | None = None) -> dict[str, int]:
+        """
+        WordCloud.generate_from_frequencies에 넘길 {단어: 빈도} 딕셔너리 (group_col 생략 시 전체).
+        복수형·대소문자 병합까지 적용되어 WordCloud.process_text(제목 전체)의 결과와 같습니다.
+        """
+        if group_col is None:
+            return fuse_word_counts(self.total)
+        return fuse_word_counts(self.by_group[group_col].get(value, Counter()))
+
+    def groups(self, group_col: str) -> list[str]:
+        """그룹 컬럼의 값 목록을 제목 수가 아닌 총 단어 수 내림차순으로 반환합니다."""
+        counters = self.by_group[group_col]
+        return sorted(counters, key=lambda value: sum(counters[value].values()), reverse=True)
+
+
+def count_title_tokens(
+    chunks: Iterable[pd.DataFrame],
+    group_cols: list[str] | None = None,
+    stopwords: frozenset[str] = PUBMED_STOPWORDS
+) -> TitleTokenCounts:
+    """
+    제목을 한 번만 토큰화하면서 전체 빈도와 그룹별(예: 연도, 저널) 빈도를 동시에 누적합니다.
+    청크 단위로 처리하므로 전체 CSV를 메모리에 올리지 않습니다.
+    """
+    group_cols = group_cols or []
+    counts = TitleTokenCounts(group_cols)
+
+    for chunk in chunks:
+        chunk = chunk.dropna(subset=[TITLE_COLUMN])
+        group_values = [chunk[col].fillna('Unknown').tolist() for col in group_cols]
+        for row, title in enumerate(chunk[TITLE_COLUMN].tolist()):
+            tokens = tokenize_title(title, stopwords)
+            counts.total.update(tokens)
+            for col, values in zip(group_cols, group_values):
+                counts.by_group[col].setdefault(values[row], Counter()).update(tokens)
+        counts.n_titles += len(chunk)
+    return counts
+
+
+# --- 실행 예시 ---
+if __name__ == "__main__":
+    counts = count_title_tokens(read_pubmed_chunks(), group_cols=[YEAR_COLUMN, JOURNAL_COLUMN])
+    print(f"✅ 제목 {counts.n_titles}개 토큰화 완료, 고유 단어 {len(counts.total)}개")
+    print(Counter(counts.frequencies()).most_common(10))
+    for year in sorted(counts.by_group[YEAR_COLUMN], reverse=True)[:3]:
+        print(year, Counter(counts.frequencies(YEAR_COLUMN, year)).most_common(5))
@@ -0,0 +1,138 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from keyword_index import filter_rows_by_keywords, is_indexable
+from netflix_data import read_netflix_csv
+from netflix_features import GenreMatrix
+from word_frequency import DocumentTermMatrix, load_document_term_matrix
+
+# --- 상수 정의 ---
+TEXT_COLUMN = 'description'
+GENRE_COLUMN = 'listed_in'
+DEFAULT_COLS_TO_CHECK = ['description', 'title', 'listed_in']
+
+# 💡 워커 프로세스 전역 상태: 단어/장르 행렬은 워커 시작 시 한 번만 전달받음 (작업마다 피클링하지 않음)
+_WORKER_STATE: dict = {}
+
+
+def _init_worker(dtm: DocumentTermMatrix, genres: GenreMatrix, custom_stopwords: frozenset[str]) -> None:
+    _WORKER_STATE['dtm'] = dtm
+    _WORKER_STATE['genres'] = genres
+    _WORKER_STATE['stopwords'] = custom_stopwords
+
+
+def _aggregate_segment(
+    name: str,
+    positions: np.ndarray,
+    top_n_words: int | None,
+    top_n_genres: int
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """한 세그먼트의 단어 빈도와 상위 장르를 계산합니다. (워커 프로세스에서 실행)"""
+    dtm = _WORKER_STATE['dtm']
+    genres = _WORKER_STATE['genres']
+
+    freq = dtm.frequencies(dtm.index[positions], _WORKER_STATE['stopwords'])
+    word_df = freq.to_frame() if top_n_words is None else freq.top(top_n_words)
+    word_df = word_df.reset_index(drop=True)
+    word_df.insert(0, 'segment', name)
+
+    genre_counts = genres.top(genres.index[positions], n=top_n_genres)
+    genre_df = pd.DataFrame({'segment': name, 'genre': genre_counts.index, 'count': genre_counts.to_numpy()})
+    return word_df, genre_df
+
+
+def _segment_rows(file_path: str, df: pd.DataFrame, segments: list[dict]) -> dict[str, np.ndarray]:
+    """세그먼트별 행 번호를 구합니다. 같은 컬럼 조합의 일반 키워드는 색인 배치 조회로 한 번에 처리합니다."""
+    rows: dict[str, np.ndarray] = {}
+    groups: dict[tuple[str, ...], list[dict]] = {}
+    for seg in segments:
+        cols = tuple(col for col in seg.get('cols_to_check', DEFAULT_COLS_TO_CHECK) if col in df.columns)
+        if is_indexable(seg['keyword']):
+            groups.setdefault(cols, []).append(seg)
+        else:
+            # 정규표현식 키워드는 기존 방식(str.contains) 그대로 스캔
+            mask = np.zeros(len(df), dtype=bool)
+            for col in cols:
+                mask |= df[col].fillna('').str.contains(seg['keyword'], case=False, na=False).to_numpy()
+            rows[seg['name']] = np.flatnonzero(mask)
+
+    for cols, group in groups.items():
+        found = filter_rows_by_keywords(file_path, [seg['keyword'] for seg in group], list(cols), frame=df)
+        for seg in group:
+            rows[seg['name']] = found[seg['keyword']]
+    return rows
+
+
+def analyze_segments(
+    file_path: str,
+    segments: list[dict],
+    custom_stopwords: set[str],
+    text_col: str = TEXT_COLUMN,
+    genre_col: str = GENRE_COLUMN,
+    top_n_words: int | None = None,
+    top_n_genres: int = 10,
+    max_workers: int | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    여러 세그먼트(키워드 + 검사할 컬럼)를 한 번에 분석합니다.
+    CSV 로드와 토큰화(문서-단어 행렬)는 한 번만 하고, 세그먼트별 집계는 프로세스 풀에서 병렬로 실행합니다.
+
+    segments: [{'name': 'KR', 'keyword': 'Korea', 'cols_to_check': [...]}, ...]
+              (name 생략 시 keyword 사용, cols_to_check 생략 시 DEFAULT_COLS_TO_CHECK)
+    반환: (segment, word, freq) 긴 형식 단어 빈도표, (segment, genre, count) 상위 장르표
+    max_workers=1이면 프로세스 풀 없이 현재 프로세스에서 실행합니다.
+    """
+    if not segments:
+        raise ValueError("분석할 세그먼트가 없습니다.")
+    segments = [{**seg, 'name': seg.get('name', seg['keyword'])} for seg in segments]
+    names = [seg['name'] for seg in segments]
+    if len(set(names)) != len(names):
+        raise ValueError(f"세그먼트 이름이 중복되었습니다: {names}")
+
+    all_cols = {col for seg in segments for col in seg.get('cols_to_check', DEFAULT_COLS_TO_CHECK)}
+    df = read_netflix_csv(file_path, usecols=list(dict.fromkeys([*sorted(all_cols), genre_col])))
+    dtm = load_document_term_matrix(file_path, text_col)
+    rows = _segment_rows(file_path, df, segments)
+
+    for name in names:
+        if len(rows[name]) == 0:
+            print(f"🚨 경고: 세그먼트 '{name}' 관련 콘텐츠를 찾을 수 없습니다.")
+
+    genres = GenreMatrix.build(df, genre_col)
+    stopwords = frozenset(custom_stopwords)
+    tasks = [(name, rows[name], top_n_words, top_n_genres) for name in names]
+
+    if max_workers == 1:
+        _init_worker(dtm, genres, stopwords)
+        results = [_aggregate_segment(*task) for task in tasks]
+    else:
+        max_workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(dtm, genres, stopwords)
+        ) as executor:
+            results = list(executor.map(_aggregate_segment, *zip(*tasks)))
+
+    word_freq_df = pd.concat([word_df for word_df, _ in results], ignore_index=True)
+    genre_df = pd.concat([genre_df for _, genre_df in results], ignore_index=True)
+    return word_freq_df, genre_df
+
+
+# --- 실행 예시 ---
+if __name__ == "__main__":
+    CSV_FILE = 'netflix_preprocessed.csv'
+    CUSTOM_STOP_WORDS = {'series', 'film', 'movie', 'show', 'story', 'life', 'new', 'world', 'us'}
+    SEGMENTS = [
+        {'name': 'Korea', 'keyword': 'Korea', 'cols_to_check': ['description', 'title', 'listed_in', 'country']},
+        {'name': 'Japan', 'keyword': 'Japan', 'cols_to_check': ['description', 'title', 'listed_in', 'country']},
+        {'name': 'India', 'keyword': 'India', 'cols_to_check': ['country']},
+        {'name': 'Anime', 'keyword': 'Anime', 'cols_to_check': ['listed_in']},
+    ]
+
+    print(f"--- {len(SEGMENTS)}개 세그먼트 일괄 분석 시작 ---")
+    words, top_genres = analyze_segments(CSV_FILE, SEGMENTS, CUSTOM_STOP_WORDS, top_n_words=10)
+    print(words)
+    print(top_genres)
+    print("--- 분석 완료 ---")
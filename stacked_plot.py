@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from setup_korean_font import setup_korean_font
+
+# --- 상수 정의 ---
+FIGSIZE = (10, 6)
+BAR_WIDTH = 0.7
+MIN_LABEL_PERCENT = 5.0    # 이보다 작은 칸에는 비율 텍스트를 쓰지 않음
+PALETTE = 'viridis'
+
+# 💡 (그룹 수, 범주 수, 백분율 여부) 조합별로 한 번 만든 차트 템플릿을 재사용
+_CHART_TEMPLATES: dict[tuple[int, int, bool], 'StackedProportionChart'] = {}
+_FONT_READY = False
+
+
+def _ensure_korean_font() -> None:
+    """한글 폰트 설정은 프로세스당 한 번만 (하드코딩된 폰트 경로 대신 시스템 폰트 검색 + 캐시)"""
+    global _FONT_READY
+    if not _FONT_READY:
+        setup_korean_font()
+        _FONT_READY = True
+
+
+class StackedProportionChart:
+    """
+    그룹 내 비율표(행: x축 그룹, 열: 누적 범주)를 100% 누적 막대로 그리는 재사용 차트.
+    Figure/Axes/막대/범례/제목은 처음 한 번만 만들고, update()에서는 막대 높이·위치와 라벨 텍스트만 바꿉니다.
+    칸별 비율 텍스트는 ax.text 이중 루프 대신 컨테이너 단위 bar_label로 붙입니다.
+    percent=False이면 0~1 비율표(CountCube.proportions(..., percent=False))용으로 y축을 0~1로 둡니다. (라벨은 % 표기)
+    """
+
+    def __init__(
+        self,
+        n_groups: int,
+        n_segments: int,
+        figure: Figure | None = None,
+        figsize: tuple[float, float] = FIGSIZE,
+        width: float = BAR_WIDTH,
+        percent: bool = True
+    ):
+        _ensure_korean_font()
+        if figure is None:
+            # 💡 pyplot 전역 상태 없이 Agg 캔버스에 직접 그림 (화면 없이 대량 저장)
+            figure = Figure(figsize=figsize)
+            FigureCanvasAgg(figure)
+        self.fig = figure
+        self.ax = figure.add_subplot()
+        self.n_groups, self.n_segments = n_groups, n_segments
+        self.percent = percent
+        self.total = 100.0 if percent else 1.0    # 막대 하나의 높이 (y축 상한)
+        self.x = np.arange(n_groups)
+
+        zeros = np.zeros(n_groups)
+        colors = sns.color_palette(PALETTE, n_colors=n_segments)
+        self.containers = [self.ax.bar(self.x, zeros, width=width, color=color) for color in colors]
+        self.labels: list = []
+
+        self.ax.set_xticks(self.x)
+        self.ax.set_ylim(0, self.total)
+        self.ax.set_yticks(np.linspace(0, self.total, 6))
+        self.suptitle = self.fig.suptitle('', fontsize=16, fontweight='bold', color='darkslategray')
+
+    def update(
+        self,
+        table: pd.DataFrame,
+        title: str = '',
+        xlabel: str = '',
+        ylabel: str | None = None,
+        legend_title: str | None = None,
+        xticklabels: list[str] | None = None,
+        min_label: float = MIN_LABEL_PERCENT
+    ) -> Figure:
+        """
+        비율표 하나로 차트 내용을 바꿉니다. table의 모양은 (n_groups, n_segments)여야 합니다.
+        min_label은 백분율 기준입니다. (percent=False 차트에서도 5.0 = 5%)
+        """
+        values = np.nan_to_num(table.to_numpy(dtype=np.float64))
+        if values.shape != (self.n_groups, self.n_segments):
+            raise ValueError(f"표 모양 {values.shape}이 차트 템플릿 {(self.n_groups, self.n_segments)}과 다릅니다.")
+        bottoms = np.cumsum(values, axis=1) - values
+
+        for label in self.labels:
+            label.remove()
+        self.labels = []
+        for j, container in enumerate(self.containers):
+            for rect, height, bottom in zip(container.patches, values[:, j], bottoms[:, j]):
+                rect.set_height(height)
+                rect.set_y(bottom)
+            percents = values[:, j] * (100 / self.total)
+            texts = [f'{value:.1f}%' if value > min_label else '' for value in percents]
+            self.labels.extend(self.ax.bar_label(
+                container, labels=texts, label_type='center',
+                fontsize=9, color='white', fontweight='bold'
+            ))
+
+        self.ax.set_xticklabels(xticklabels or [str(label) for label in table.index], rotation=0, fontsize=11)
+        self.ax.set_xlabel(xlabel, fontsize=13)
+        self.ax.set_ylabel(ylabel if ylabel is not None else ('비율 (%)' if self.percent else '비율'), fontsize=13)
+        self.ax.legend(
+            self.containers, [str(col) for col in table.columns],
+            title=legend_title, loc='upper right', fontsize=9, title_fontsize=10
+        )
+        self.suptitle.set_text(title)
+        return self.fig
+
+    def save(self, filename: str, dpi: int = 150) -> None:
+        self.fig.savefig(filename, dpi=dpi)
+
+
+def get_stacked_chart(n_groups: int, n_segments: int, percent: bool = True) -> StackedProportionChart:
+    """같은 모양의 차트 템플릿을 재사용합니다. (처음 요청될 때만 Figure를 만듦)"""
+    key = (n_groups, n_segments, percent)
+    if key not in _CHART_TEMPLATES:
+        _CHART_TEMPLATES[key] = StackedProportionChart(n_groups, n_segments, percent=percent)
+    return _CHART_TEMPLATES[key]
+
+
+def is_percent_table(table: pd.DataFrame) -> bool:
+    """행 합계가 1을 넘으면 백분율(0~100) 표, 아니면 0~1 비율표로 판단합니다. (관측이 없는 NaN 행은 무시)"""
+    totals = np.nansum(table.to_numpy(dtype=np.float64), axis=1)
+    return bool(totals.size) and float(totals.max()) > 1.0 + 1e-9
+
+
+def plot_stacked_proportions(
+    table: pd.DataFrame,
+    filename: str,
+    dpi: int = 150,
+    percent: bool | None = None,
+    **labels
+) -> None:
+    """
+    비율표를 100% 누적 막대 그래프 PNG로 저장합니다. labels는 StackedProportionChart.update에 전달됩니다.
+    (title, xlabel, ylabel, legend_title, xticklabels, min_label)
+    percent를 생략하면 표의 값(행 합계 100 또는 1)으로 y축 범위를 정합니다.
+    """
+    if percent is None:
+        percent = is_percent_table(table)
+    chart = get_stacked_chart(*table.shape, percent=percent)
+    chart.update(table, **labels)
+    chart.save(filename, dpi=dpi)
+
+
+# --- 실행 예시 ---
+if __name__ == "__main__":
+    from count_cube import TARGET_COLUMN, load_count_cube
+
+    cube = load_count_cube()
+    for dim, table in cube.pairwise(TARGET_COLUMN).items():
+        filename = f'stacked_{TARGET_COLUMN}_{dim}.png'
+        plot_stacked_proportions(
+            table, filename,
+            title=f'심장병 유무에 따른 {dim} 비율', xlabel='심장병 유무', legend_title=dim,
+            xticklabels=['정상 (0)', '심장병 (1)']
+        )
+        print(f"✅ '{filename}' 저장 완료")
@@ -0,0 +1,192 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:    # Windows에는 resource 모듈이 없음 (psutil이 있으면 그것으로 대신 측정)
+    resource = None
+
+# --- 상수 정의 ---
+# 💡 환경 변수에 출력 경로를 지정하면 계측이 켜짐 (예: NETFLIX_TRACE=trace.jsonl 또는 trace.json)
+#    .json → Chrome trace (chrome://tracing, Perfetto에서 열기), 그 외 확장자 → 단계당 한 줄 JSON lines
+TRACE_ENV = 'NETFLIX_TRACE'
+CHROME_TRACE_SUFFIX = '.json'
+
+
+def peak_rss_mb() -> float | None:
+    """프로세스 시작 이후 최대 상주 메모리(MB). 측정할 수 없으면 None."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss 단위: macOS는 바이트, Linux는 KB
+        return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    info = psutil.Process().memory_info()
+    return getattr(info, 'peak_wset', info.rss) / 1024 ** 2
+
+
+class _NullStage:
+    """계측이 꺼져 있을 때 쓰는 공용 빈 컨텍스트 (객체 생성·시계 호출 없음)"""
+    enabled = False
+
+    def __enter__(self) -> '_NullStage':
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def set(self, **fields) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """한 단계의 벽시계 시간·CPU 시간·최대 RSS와, set()으로 붙인 값(rows, vocab_size 등)을 기록합니다."""
+    enabled = True
+
+    def __init__(self, tracer: 'StageTracer', name: str, fields: dict):
+        self.tracer = tracer
+        self.name = name
+        self.fields = fields
+
+    def set(self, **fields) -> None:
+        self.fields.update(fields)
+
+    def __enter__(self) -> '_Stage':
+        stack = self.tracer._stack()
+        self.parent = stack[-1].name if stack else None
+        self.depth = len(stack)
+        stack.append(self)
+        self.rss_start = peak_rss_mb()
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        wall_end = time.perf_counter()
+        cpu_end = time.process_time()
+        rss_end = peak_rss_mb()
+        self.tracer._stack().pop()
+
+        record = {
+            'stage': self.name,
+            'parent': self.parent,
+            'depth': self.depth,
+            'start_s': round(self.wall_start - self.tracer.origin, 6),
+            'wall_s': round(wall_end - self.wall_start, 6),
+            'cpu_s': round(cpu_end - self.cpu_start, 6),
+            'peak_rss_mb': None if rss_end is None else round(rss_end, 2),
+            # 💡 최대 RSS는 단조 증가하므로, 이 단계에서 새 최고치를 얼마나 올렸는지를 함께 기록
+            'peak_rss_growth_mb': None if rss_end is None else round(rss_end - self.rss_start, 2),
+            **self.fields,
+        }
+        if exc_type is not None:
+            record['error'] = exc_type.__name__
+        self.tracer.emit(record)
+        return False
+
+
+class StageTracer:
+    """
+    단계 기록을 JSON lines(단계가 끝날 때마다 한 줄) 또는 Chrome trace(close() 때 한 번에)로 저장합니다.
+    """
+
+    def __init__(self, path: str, fmt: str | None = None):
+        self.path = path
+        self.fmt = fmt or ('chrome' if path.endswith(CHROME_TRACE_SUFFIX) else 'jsonl')
+        self.origin = time.perf_counter()
+        self.records: list[dict] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8') if self.fmt == 'jsonl' else None
+
+    def _stack(self) -> list[_Stage]:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def stage(self, name: str, **fields) -> _Stage:
+        return _Stage(self, name, fields)
+
+    def emit(self, record: dict) -> None:
+        record = {'pid': os.getpid(), 'tid': threading.get_ident(), **record}
+        with self._lock:
+            self.records.append(record)
+            if self._file is not None:
+                self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+                self._file.flush()
+
+    def to_chrome_trace(self) -> dict:
+        """완전 이벤트('X') 목록: 중첩 단계는 시간 구간으로 자동으로 겹쳐 표시됩니다."""
+        events = []
+        for record in self.records:
+            args = {key: value for key, value in record.items()
+                    if key not in ('stage', 'pid', 'tid', 'start_s', 'wall_s')}
+            events.append({
+                'name': record['stage'], 'cat': 'stage', 'ph': 'X',
+                'ts': record['start_s'] * 1e6, 'dur': record['wall_s'] * 1e6,
+                'pid': record['pid'], 'tid': record['tid'], 'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        elif self.fmt == 'chrome':
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        else:
+            return
+        print(f"✅ 단계 계측 결과 저장: {self.path} ({len(self.records)}개 단계)")
+
+
+# 💡 계측이 꺼져 있으면 None: stage()는 None 확인 한 번 후 공용 빈 컨텍스트를 돌려줌
+_TRACER: StageTracer | None = None
+
+
+def stage(name: str, **fields) -> _Stage | _NullStage:
+    """
+    파이프라인 단계를 감싸는 컨텍스트 매니저. 계측이 꺼져 있으면 아무것도 측정하지 않습니다.
+        with stage('load') as s:
+            df = ...
+            s.set(rows=len(df))
+    비용이 큰 값은 s.enabled가 True일 때만 계산해서 넘기세요.
+    """
+    if _TRACER is None:
+        return _NULL_STAGE
+    return _TRACER.stage(name, **fields)
+
+
+def tracing_enabled() -> bool:
+    return _TRACER is not None
+
+
+def enable_tracing(path: str, fmt: str | None = None) -> StageTracer:
+    """계측을 켭니다. fmt: 'jsonl' 또는 'chrome' (생략하면 확장자로 결정). 프로세스 종료 시 자동 저장됩니다."""
+    global _TRACER
+    disable_tracing()
+    _TRACER = StageTracer(path, fmt)
+    atexit.register(_TRACER.close)
+    return _TRACER
+
+
+def disable_tracing() -> None:
+    """계측을 끄고 지금까지의 기록을 저장합니다."""
+    global _TRACER
+    if _TRACER is not None:
+        atexit.unregister(_TRACER.close)
+        _TRACER.close()
+        _TRACER = None
+
+
+if os.environ.get(TRACE_ENV):
+    enable_tracing(os.environ[TRACE_ENV])
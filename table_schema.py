@@ -0,0 +1,135 @@
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+# --- 스키마 정의 ---
+# 💡 읽기 전에 dtype을 선언: 문자열 범주 → category(정수 코드), 작은 정수 → int8/int16, 0/1 → boolean, 날짜 → datetime
+#    결측이 있을 수 있는 정수 컬럼은 NumPy int 대신 pandas nullable 정수(Int8/Int16)를 사용
+HEART_FILE = 'heart.csv'
+HEART_SCHEMA = {
+    'dtype': {
+        'Age': 'int8',
+        'Sex': CategoricalDtype(['F', 'M']),
+        'ChestPainType': CategoricalDtype(['ASY', 'NAP', 'ATA', 'TA']),    # 그래프 표시 순서와 같은 코드 순서
+        'RestingBP': 'Int16',
+        'Cholesterol': 'int16',
+        'FastingBS': 'boolean',
+        'RestingECG': CategoricalDtype(['Normal', 'ST', 'LVH']),
+        'MaxHR': 'int16',
+        'ExerciseAngina': CategoricalDtype(['N', 'Y']),
+        'HeartDisease': 'Int8',    # 0/1 라벨을 그대로 유지 (그래프의 '정상 (0)', '심장병 (1)')
+    },
+    'parse_dates': [],
+}
+
+MARKETING_FILE = 'marketing_campaign_data.csv'
+MARKETING_SCHEMA = {
+    'dtype': {
+        'CustomerID': 'int32',
+        'Name': 'string',
+        'Age': 'int8',
+        'TotalSpend': 'float64',    # 금액은 float32로 줄이면 소수점 표시가 틀어지므로 유지
+        'Churn': 'boolean',    # 이탈 여부 (0: 유지, 1: 이탈)
+    },
+    'parse_dates': ['EnrollmentDate'],
+}
+
+
+def memory_footprint(df: pd.DataFrame) -> int:
+    """DataFrame이 실제로 차지하는 메모리(바이트, 문자열 내용 포함)"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _print_memory_report(before: int, after: int, label: str) -> None:
+    saved = (1 - after / before) * 100 if before else 0.0
+    print(f"✅ {label} 메모리: 기본 dtype {before / 1024:,.1f} KB → 스키마 적용 {after / 1024:,.1f} KB ({saved:.1f}% 절감)")
+
+
+def _split_categoricals(dtype: dict) -> tuple[dict, dict[str, list]]:
+    """
+    CategoricalDtype 선언을 'category'로 바꿔 읽고, 선언된 범주 순서는 따로 돌려줍니다.
+    💡 고정 범주로 바로 읽으면 목록에 없는 값이 경고 없이 NaN이 되므로, 범주는 읽은 뒤에 정렬함
+    """
+    read_dtype, categories = {}, {}
+    for col, value in dtype.items():
+        if isinstance(value, CategoricalDtype) and value.categories is not None:
+            read_dtype[col] = 'category'
+            categories[col] = list(value.categories)
+        else:
+            read_dtype[col] = value
+    return read_dtype, categories
+
+
+def _order_categories(df: pd.DataFrame, categories: dict[str, list]) -> pd.DataFrame:
+    """선언된 범주를 그래프 표시 순서대로 앞에 두고, 선언에 없는 값은 버리지 않고 뒤에 붙입니다."""
+    for col, declared in categories.items():
+        extra = sorted(set(df[col].cat.categories) - set(declared), key=str)
+        if extra:
+            print(f"🚨 경고: 컬럼 '{col}'에 스키마에 없는 값 {extra}이(가) 있습니다. 범주 끝에 추가합니다.")
+        df[col] = df[col].cat.set_categories(declared + extra)
+    return df
+
+
+def read_csv_with_schema(
+    file_path: str,
+    schema: dict,
+    usecols: list[str] | None = None,
+    report: bool = False,
+    **read_csv_kwargs
+) -> pd.DataFrame:
+    """
+    스키마의 dtype/parse_dates를 pd.read_csv에 바로 넘겨, 읽은 뒤 변환하지 않고 처음부터 작은 타입으로 읽습니다.
+    report=True이면 기본 dtype으로도 한 번 더 읽어 메모리 사용량 전/후를 출력합니다.
+    (파일이 없으면 FileNotFoundError를 그대로 전달합니다)
+    """
+    dtype = schema['dtype']
+    parse_dates = schema.get('parse_dates', [])
+    if usecols is not None:
+        dtype = {col: value for col, value in dtype.items() if col in usecols}
+        parse_dates = [col for col in parse_dates if col in usecols]
+
+    dtype, categories = _split_categoricals(dtype)
+    df = _order_categories(
+        pd.read_csv(file_path, usecols=usecols, dtype=dtype, parse_dates=parse_dates, **read_csv_kwargs), categories
+    )
+    if report:
+        baseline = pd.read_csv(file_path, usecols=usecols, **read_csv_kwargs)
+        _print_memory_report(memory_footprint(baseline), memory_footprint(df), file_path)
+    return df
+
+
+def apply_schema(df: pd.DataFrame, schema: dict, report: bool = False) -> pd.DataFrame:
+    """
+    이미 메모리에 있는 DataFrame(예: 가상 데이터)에 같은 스키마를 적용합니다. 없는 컬럼은 건너뜁니다.
+    """
+    dtype, categories = _split_categoricals(
+        {col: value for col, value in schema['dtype'].items() if col in df.columns}
+    )
+    typed = _order_categories(df.astype(dtype), categories)
+    for col in schema.get('parse_dates', []):
+        if col in typed.columns:
+            typed[col] = pd.to_datetime(typed[col])
+    if report:
+        _print_memory_report(memory_footprint(df), memory_footprint(typed), 'DataFrame')
+    return typed
+
+
+def load_heart(file_path: str = HEART_FILE, usecols: list[str] | None = None, report: bool = False) -> pd.DataFrame:
+    """heart.csv를 HEART_SCHEMA로 읽습니다. 범주형 컬럼은 category(정수 코드)로 저장됩니다."""
+    return read_csv_with_schema(file_path, HEART_SCHEMA, usecols=usecols, report=report)
+
+
+def load_marketing(file_path: str = MARKETING_FILE, report: bool = False) -> pd.DataFrame:
+    """marketing_campaign_data.csv를 MARKETING_SCHEMA로 읽습니다. (EnrollmentDate는 datetime으로 파싱)"""
+    return read_csv_with_schema(file_path, MARKETING_SCHEMA, encoding='utf-8', report=report)
+
+
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        heart = load_heart(report=True)
+    except FileNotFoundError:
+        print(f"🚨 {HEART_FILE} 파일을 찾을 수 없습니다. 경로를 확인해주세요.")
+    else:
+        print(heart.dtypes.to_string())
+        # 💡 category 컬럼 groupby는 문자열 비교 대신 정수 코드로 그룹을 나눔
+        print(pd.crosstab(heart['HeartDisease'], heart['ChestPainType']))
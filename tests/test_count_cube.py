@@ -0,0 +1,76 @@
+import itertools
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from count_cube import HEART_CUBE_DIMS, CountCube
+from table_schema import HEART_FILE, HEART_SCHEMA, apply_schema, load_heart
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEART_PATH = os.path.join(ROOT_DIR, HEART_FILE)
+DIMS = [*HEART_CUBE_DIMS, 'RestingBP']
+
+
+def _small_heart() -> pd.DataFrame:
+    """HeartDisease·RestingBP 결측과, 선언됐지만 행이 없는 범주(ChestPainType 'TA')를 포함한 표본"""
+    rng = np.random.default_rng(0)
+    n = 200
+    df = pd.DataFrame({
+        'Sex': rng.choice(['F', 'M'], n),
+        'ChestPainType': rng.choice(['ASY', 'NAP', 'ATA'], n),
+        'RestingBP': rng.choice([120, 130, 140, None], n),
+        'FastingBS': rng.choice([0, 1], n),
+        'RestingECG': rng.choice(['Normal', 'ST', 'LVH'], n),
+        'ExerciseAngina': rng.choice(['N', 'Y'], n),
+        'HeartDisease': rng.choice([0, 1, None], n, p=[0.45, 0.45, 0.1]),
+    })
+    return apply_schema(df, HEART_SCHEMA)
+
+
+def _frames() -> list[pd.DataFrame]:
+    frames = [_small_heart()]
+    if os.path.exists(HEART_PATH):
+        frames.append(load_heart(HEART_PATH))
+    return frames
+
+
+@pytest.mark.parametrize('df', _frames(), ids=lambda df: f'{len(df)}rows')
+def test_counts_match_groupby_for_every_pair(df):
+    cube = CountCube.build(df, DIMS)
+    for row, col in itertools.permutations(DIMS, 2):
+        expected = df.groupby([row, col], observed=True).size()
+        table = cube.counts_table(row, col)
+        stacked = table.stack()
+        assert stacked.sum() == expected.sum(), (row, col)
+        nonzero = stacked[stacked > 0]
+        assert sorted(zip(nonzero.index, nonzero.tolist())) == sorted(zip(expected.index, expected.tolist())), (row, col)
+
+
+@pytest.mark.parametrize('df', _frames(), ids=lambda df: f'{len(df)}rows')
+def test_proportions_match_groupby_apply(df):
+    cube = CountCube.build(df, DIMS)
+    for row, col in itertools.permutations(DIMS, 2):
+        expected = (
+            df.groupby([row, col], observed=True).size()
+            .groupby(level=0).apply(lambda x: x / x.sum() * 100)
+            .droplevel(0)
+        )
+        table = cube.proportions(row, col)
+        for (row_value, col_value), value in expected.items():
+            assert table.loc[row_value, col_value] == pytest.approx(value), (row, col)
+        observed_rows = table.index.isin(expected.index.get_level_values(0))
+        np.testing.assert_allclose(table[observed_rows].sum(axis=1), 100)
+        assert table[~observed_rows].isna().all().all(), (row, col)
+
+
+def test_declared_category_without_rows():
+    df = _small_heart()
+    cube = CountCube.build(df, DIMS)
+    assert cube.counts_table('ChestPainType')['TA'] == 0
+    assert cube.counts_table('ChestPainType').sum() == df['ChestPainType'].notna().sum()
+    assert cube.proportions('ChestPainType', 'HeartDisease').loc['TA'].isna().all()
+    assert (cube.proportions('HeartDisease', 'ChestPainType')['TA'] == 0).all()
+    # 결측 HeartDisease 행은 어떤 칸에도 세지 않음 (groupby dropna=True와 동일)
+    assert cube.counts_table('HeartDisease').sum() == df['HeartDisease'].notna().sum()
@@ -0,0 +1,47 @@
+import os
+
+import pandas as pd
+import pytest
+
+from benchmarks.bench_tokenizer import old_analyze_counts, old_wordcloud_words    # 💡 기존 정규식 경로 (기준 구현)
+from fast_tokenizer import clean_text, count_tokens, tokenize
+from text_resources import CLEAN_REGEX
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CSV_FILE = os.path.join(ROOT_DIR, 'netflix_preprocessed.csv')
+CUSTOM_STOP_WORDS = {'series', 'film', 'movie', 'show', 'story', 'life', 'new', 'world', 'us', 'korean', 'korea', 'drama', 'kdrama'}
+
+# 💡 정규식/translate 차이가 드러나기 쉬운 경계 사례 (하이픈, 아포스트로피, 숫자, 유니코드 공백·대문자·합자 등)
+EDGE_CASES = [
+    "K-drama fans don't sleep: Crash Landing on You (2019)!",
+    "한국드라마 좋아요 — 한국Drama MIXED 케이팝K-pop",
+    "İstanbul ÉCOLE straße ﬁnal ǅemal Ωmega",
+    "tabs\tand\nnewlines\r\x0bvertical\x0cfeed　ideographic nbsp line\x1cfs\x85nel",
+    "zero​width abc123def 3rd 1 a b cc ㄱㄴ ㅏ 힣힣 가",
+    "   ",
+    "",
+]
+
+
+def check_equivalence(texts: list[str]) -> None:
+    """기존 파이프라인과 fast_tokenizer 결과가 같은지 확인합니다. (다르면 AssertionError)"""
+    for text in texts:
+        assert clean_text(text) == CLEAN_REGEX.sub(' ', text).lower(), repr(text)
+        assert clean_text(text, delete=True) == CLEAN_REGEX.sub('', text).lower(), repr(text)
+    assert count_tokens(texts, CUSTOM_STOP_WORDS) == old_analyze_counts(texts, CUSTOM_STOP_WORDS)
+    assert count_tokens(texts) == old_analyze_counts(texts, set())
+    assert tokenize(texts, CUSTOM_STOP_WORDS, delete=True) == old_wordcloud_words(texts, CUSTOM_STOP_WORDS)
+
+
+@pytest.mark.parametrize('text', EDGE_CASES)
+def test_edge_case_matches_regex_path(text):
+    check_equivalence([text])
+
+
+def test_edge_cases_combined_match_regex_path():
+    check_equivalence(EDGE_CASES)
+
+
+@pytest.mark.skipif(not os.path.exists(CSV_FILE), reason='netflix_preprocessed.csv 없음')
+def test_netflix_descriptions_match_regex_path():
+    check_equivalence(pd.read_csv(CSV_FILE, usecols=['description'])['description'].dropna().tolist())
@@ -0,0 +1,65 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from heavy_hitters import SpaceSaving
+
+
+def _zipf_chunks(n_chunks: int, chunk_size: int, vocab_size: int, seed: int) -> list[list[str]]:
+    rng = np.random.default_rng(seed)
+    return [
+        [f'w{i}' for i in np.minimum(rng.zipf(1.3, chunk_size), vocab_size)]
+        for _ in range(n_chunks)
+    ]
+
+
+def _assert_bounds(sketch: SpaceSaving, true_counts: Counter) -> None:
+    assert sketch.n_tokens == sum(true_counts.values())
+    for word, count in sketch.counts.items():
+        error = sketch.errors[word]
+        assert count - error <= true_counts[word] <= count
+        assert error <= sketch.error_bound
+    # 요약에 없는 단어의 실제 빈도는 min_count 이하
+    missing = [true_counts[word] for word in true_counts if word not in sketch.counts]
+    assert max(missing, default=0) <= sketch.min_count
+
+
+@pytest.mark.parametrize('capacity', [5, 50, 10_000])
+def test_update_keeps_bounds(capacity):
+    sketch, true_counts = SpaceSaving(capacity), Counter()
+    for tokens in _zipf_chunks(20, 500, 2_000, seed=0):
+        sketch.update(tokens)
+        true_counts.update(tokens)
+        _assert_bounds(sketch, true_counts)
+
+
+def test_truncated_chunk_words_have_zero_error():
+    sketch = SpaceSaving(2).update(['a'] * 5 + ['b'] * 3 + ['c'])
+    assert sketch.counts == {'a': 5, 'b': 3}
+    assert sketch.errors == {'a': 0, 'b': 0}
+
+
+@pytest.mark.parametrize('capacities', [(50, 50, 50, 50), (200, 20, 500, 5)])
+def test_merge_keeps_bounds(capacities):
+    chunks = _zipf_chunks(len(capacities) * 5, 400, 1_000, seed=1)
+    parts, true_counts = [], Counter()
+    for i, capacity in enumerate(capacities):
+        part = SpaceSaving(capacity)
+        for tokens in chunks[i::len(capacities)]:
+            part.update(tokens)
+            true_counts.update(tokens)
+        parts.append(part)
+
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    _assert_bounds(merged, true_counts)
+
+
+def test_merge_into_smaller_capacity_does_not_inflate_unseen_words():
+    # 한 번도 가득 찬 적 없는 요약은 병합 전 min_count가 0이어야 함
+    small = SpaceSaving(10).update(['a', 'b'])
+    small.merge(SpaceSaving(2).update(['c', 'c']))
+    assert small.counts == {'c': 2, 'a': 1}
+    assert small.errors == {'c': 0, 'a': 0}
@@ -0,0 +1,110 @@
+import pandas as pd
+import pytest
+
+from incremental_frequency import ID_COLUMN, SegmentFrequencyState, update_segment_states
+from netflix_analysis import analyze_word_frequency
+
+STOPWORDS = {'series', 'korea'}
+SEGMENT = {'name': 'Korea', 'keyword': 'Korea'}
+COLS = ['description', 'title', 'listed_in']
+
+
+def _catalog() -> pd.DataFrame:
+    return pd.DataFrame({
+        ID_COLUMN: ['s1', 's2', 's3', 's4', 's5'],
+        'title': ['Seoul Nights', 'Korea Bound', 'Paris', 'Busan Express', None],
+        'listed_in': ['Korean TV Shows', 'Documentaries', 'Dramas', 'Action', 'Korean Movies'],
+        'description': [
+            'A young chef in Seoul falls in love with a rival chef.',
+            'A travel series following chefs across the country.',
+            'A painter in Paris searches for love.',
+            'Zombies attack a train leaving Seoul for Busan in Korea.',
+            None,
+        ],
+    })
+
+
+def _expected(df: pd.DataFrame) -> dict[str, int]:
+    mask = False
+    for col in COLS:
+        mask = mask | df[col].fillna('').str.contains('Korea', case=False, na=False)
+    word_df, _ = analyze_word_frequency(df[mask], 'description', STOPWORDS)
+    return dict(zip(word_df['word'], word_df['freq']))
+
+
+def _assert_matches(state: SegmentFrequencyState, df: pd.DataFrame) -> None:
+    assert state.frequencies() == _expected(df)
+    expected_df, _ = analyze_word_frequency(
+        df[df[ID_COLUMN].isin(state.shows)], 'description', STOPWORDS
+    )
+    assert state.to_frame().reset_index(drop=True).equals(expected_df.reset_index(drop=True))
+
+
+def test_add_edit_delete_matches_full_recount():
+    df = _catalog()
+    state = SegmentFrequencyState(SEGMENT, STOPWORDS)
+    assert state.update(df) == {'added': 4, 'changed': 0, 'removed': 0, 'unchanged': 0}
+    _assert_matches(state, df)
+
+    # 추가
+    new_row = pd.DataFrame({
+        ID_COLUMN: ['s6'], 'title': ['Hanok'], 'listed_in': ['Korean TV Shows'],
+        'description': ['A carpenter restores an old house in Jeonju.'],
+    })
+    df = pd.concat([df, new_row], ignore_index=True)
+    assert state.update(new_row)['added'] == 1
+    _assert_matches(state, df)
+
+    # 수정: 설명만 바뀌어도 title/listed_in 일치로 세그먼트에 남아야 함
+    df.loc[df[ID_COLUMN] == 's1', 'description'] = 'Two chefs open a restaurant together.'
+    assert state.update(df[df[ID_COLUMN] == 's1'])['changed'] == 1
+    _assert_matches(state, df)
+
+    # 수정으로 세그먼트에서 빠짐
+    df.loc[df[ID_COLUMN] == 's4', ['title', 'description']] = ['Express', 'A train leaves the station.']
+    assert state.update(df[df[ID_COLUMN] == 's4'])['removed'] == 1
+    _assert_matches(state, df)
+
+    # 삭제
+    assert state.remove(['s2', 'unknown']) == 1
+    df = df[df[ID_COLUMN] != 's2']
+    _assert_matches(state, df)
+
+
+def test_sync_matches_full_recount():
+    df = _catalog()
+    state = SegmentFrequencyState(SEGMENT, STOPWORDS)
+    state.sync(df)
+
+    changed = df[df[ID_COLUMN] != 's2'].copy()
+    changed.loc[changed[ID_COLUMN] == 's3', 'title'] = 'Paris to Korea'
+    stats = state.sync(changed)
+    assert stats['added'] == 1 and stats['removed'] == 1
+    _assert_matches(state, changed)
+
+
+def test_update_requires_all_checked_columns():
+    df = _catalog()
+    state = SegmentFrequencyState(SEGMENT, STOPWORDS)
+    state.update(df)
+    before = state.frequencies()
+    with pytest.raises(KeyError):
+        state.update(df.loc[df[ID_COLUMN] == 's1', [ID_COLUMN, 'description']])
+    assert state.frequencies() == before
+
+
+def test_saved_state_is_reused(tmp_path):
+    csv_path = tmp_path / 'catalog.csv'
+    df = _catalog()
+    df.to_csv(csv_path, index=False)
+    update_segment_states([SEGMENT], STOPWORDS, file_path=str(csv_path), state_dir=str(tmp_path / 'state'))
+
+    new_row = pd.DataFrame({
+        ID_COLUMN: ['s6'], 'title': ['Hanok'], 'listed_in': ['Korean TV Shows'],
+        'description': ['A carpenter restores an old house in Jeonju.'],
+    })
+    states = update_segment_states(
+        [SEGMENT], STOPWORDS, new_rows=new_row, deleted_ids=['s1'], state_dir=str(tmp_path / 'state')
+    )
+    expected = pd.concat([df[df[ID_COLUMN] != 's1'], new_row], ignore_index=True)
+    assert states['Korea'].frequencies() == _expected(expected)
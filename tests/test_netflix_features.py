@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from netflix_features import GenreMatrix
+
+
+@pytest.fixture
+def genre_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {'g': ['A', 'B', 'C', 'A, C'], 'listed_in': ['A', 'B', 'C', 'A, C']},
+        index=[10, 20, 30, 40],
+    )
+
+
+def test_counts_with_boolean_series(genre_df):
+    matrix = GenreMatrix.build(genre_df, 'listed_in')
+    assert matrix.counts(genre_df['g'] == 'B').to_dict() == {'B': 1}
+    assert matrix.top(genre_df['g'].str.contains('A')).to_dict() == {'A': 2, 'C': 1}
+
+
+def test_counts_with_boolean_list_and_array(genre_df):
+    matrix = GenreMatrix.build(genre_df, 'listed_in')
+    assert matrix.counts([False, True, False, False]).to_dict() == {'B': 1}
+    assert matrix.counts(np.array([True, False, False, False])).to_dict() == {'A': 1}
+
+
+def test_counts_with_labels(genre_df):
+    matrix = GenreMatrix.build(genre_df, 'listed_in')
+    assert matrix.counts(pd.Index([30, 40])).to_dict() == {'C': 2, 'A': 1}
+    assert matrix.counts().to_dict() == {'A': 2, 'C': 2, 'B': 1}
+
+
+def test_unknown_labels_raise(genre_df):
+    matrix = GenreMatrix.build(genre_df, 'listed_in')
+    with pytest.raises(KeyError):
+        matrix.counts([999])
+    with pytest.raises(KeyError):
+        matrix.top([10, 999])
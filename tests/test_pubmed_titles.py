@@ -0,0 +1,47 @@
+import os
+
+import pandas as pd
+import pytest
+from wordcloud import WordCloud
+
+from pubmed_titles import PUBMED_FILE, TITLE_COLUMN, YEAR_COLUMN, count_title_tokens, read_pubmed_chunks
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PUBMED_PATH = os.path.join(ROOT_DIR, PUBMED_FILE)
+
+SAMPLE_TITLES = [
+    "Heart failure and Heart Failures in elderly patients' outcomes",
+    "Patients with HEART failure: a 2019 review of Trials",
+    "The patient's trial of SGLT2 inhibitors vs. glass and glasses",
+    "Class classes pass passes e g 1 2 3 a b",
+]
+
+
+def _process_text(titles: list[str]) -> dict[str, int]:
+    """기존 방식: 제목을 이어 붙여 WordCloud.process_text (바이그램 연어 제외)"""
+    return WordCloud(collocations=False).process_text('\n'.join(titles))
+
+
+def _frame(titles: list[str], years: list[str] | None = None) -> pd.DataFrame:
+    return pd.DataFrame({TITLE_COLUMN: titles, YEAR_COLUMN: years or ['2020'] * len(titles)})
+
+
+def test_frequencies_match_wordcloud_process_text():
+    counts = count_title_tokens([_frame(SAMPLE_TITLES)])
+    assert counts.frequencies() == _process_text(SAMPLE_TITLES)
+
+
+def test_group_frequencies_match_per_group_process_text():
+    years = ['2020', '2021', '2020', '2021']
+    counts = count_title_tokens([_frame(SAMPLE_TITLES[:2], years[:2]), _frame(SAMPLE_TITLES[2:], years[2:])],
+                                group_cols=[YEAR_COLUMN])
+    for year in ('2020', '2021'):
+        titles = [title for title, y in zip(SAMPLE_TITLES, years) if y == year]
+        assert counts.frequencies(YEAR_COLUMN, year) == _process_text(titles)
+
+
+@pytest.mark.skipif(not os.path.exists(PUBMED_PATH), reason='pubmed_title.csv 없음')
+def test_pubmed_file_matches_wordcloud_process_text():
+    titles = pd.read_csv(PUBMED_PATH, usecols=[TITLE_COLUMN], encoding='utf-8-sig')[TITLE_COLUMN].dropna().tolist()
+    counts = count_title_tokens(read_pubmed_chunks(PUBMED_PATH, chunksize=1000))
+    assert counts.frequencies() == _process_text(titles)
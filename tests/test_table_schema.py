@@ -0,0 +1,35 @@
+import pandas as pd
+
+from table_schema import HEART_SCHEMA, apply_schema, read_csv_with_schema
+
+HEART_ROWS = pd.DataFrame({
+    'Age': [40, 49, 37, 48],
+    'Sex': ['M', 'F', 'm', None],
+    'ChestPainType': ['ATA', 'XYZ', 'NAP', 'ASY'],
+    'RestingBP': [140, None, 130, 138],
+    'Cholesterol': [289, 180, 283, 214],
+    'FastingBS': [0, 0, 1, 0],
+    'RestingECG': ['Normal', 'ST', 'Normal', 'LVH'],
+    'MaxHR': [172, 156, 98, 108],
+    'ExerciseAngina': ['N', 'N', 'Y', 'Y'],
+    'HeartDisease': [0, 1, 0, 1],
+})
+
+
+def _assert_no_values_lost(typed: pd.DataFrame) -> None:
+    for col in ['Sex', 'ChestPainType']:
+        assert typed[col].isna().sum() == HEART_ROWS[col].isna().sum()
+        assert typed[col].dropna().astype(str).tolist() == HEART_ROWS[col].dropna().tolist()
+    # 선언된 범주는 그래프 표시 순서대로 앞에, 선언에 없는 값은 뒤에
+    assert typed['ChestPainType'].cat.categories.tolist() == ['ASY', 'NAP', 'ATA', 'TA', 'XYZ']
+    assert typed['Sex'].cat.categories.tolist() == ['F', 'M', 'm']
+
+
+def test_read_csv_keeps_undeclared_categories(tmp_path):
+    path = tmp_path / 'heart.csv'
+    HEART_ROWS.to_csv(path, index=False)
+    _assert_no_values_lost(read_csv_with_schema(str(path), HEART_SCHEMA))
+
+
+def test_apply_schema_keeps_undeclared_categories():
+    _assert_no_values_lost(apply_schema(HEART_ROWS, HEART_SCHEMA))
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+from text_resources import CLEAN_REGEX, TOKEN_PATTERN
+from word_frequency import DocumentTermMatrix, WordFrequency
+
+VOCAB = np.array(['apple', 'banana', 'cherry', 'date', 'elder'], dtype=object)
+
+
+def _matrix() -> sparse.csr_matrix:
+    # 'date'(3번 열)는 어느 문서에도 없음, 'cherry'는 명시적 0 포함
+    rows = [0, 0, 1, 1, 2, 2, 2]
+    cols = [0, 2, 0, 4, 1, 2, 4]
+    data = [2, 0, 1, 3, 5, 0, 1]
+    return sparse.csr_matrix((data, (rows, cols)), shape=(3, 5))
+
+
+def test_from_matrix_matches_dense_column_sums():
+    matrix = _matrix()
+    freq = WordFrequency.from_matrix(matrix, VOCAB)
+    dense = matrix.toarray().sum(axis=0)
+    assert freq.vocab_ids.tolist() == np.flatnonzero(dense).tolist()
+    assert dict(zip(freq.words, freq.freqs)) == {'apple': 3, 'banana': 5, 'elder': 4}
+
+
+def test_top_matches_sorted_frame():
+    freq = WordFrequency.from_matrix(_matrix(), VOCAB)
+    full = freq.to_frame()
+    for n in range(1, len(freq) + 2):
+        assert freq.top(n).equals(full.head(n))
+
+
+def test_returned_frames_do_not_share_cache():
+    freq = WordFrequency.from_matrix(_matrix(), VOCAB)
+    frame = freq.to_frame()
+    frame.loc[:, 'freq'] = 0
+    top = freq.top(10)
+    top['word'] = 'x'
+    assert freq.to_frame()['freq'].tolist() == [5, 4, 3]
+    assert freq.to_frame()['word'].tolist() == ['banana', 'elder', 'apple']
+
+
+def test_document_term_matrix_matches_token_pattern_vectorizer():
+    texts = ["K-drama fans don't sleep (2019)!", "Seoul SEOUL seoul a an", "", None, "ÉCOLE straße"]
+    df = pd.DataFrame({'description': texts}, index=[5, 3, 9, 1, 7])
+    dtm = DocumentTermMatrix.build(df, 'description')
+
+    cleaned = df['description'].fillna('').astype(str).str.replace(CLEAN_REGEX, ' ', regex=True).str.lower()
+    vectorizer = CountVectorizer(token_pattern=TOKEN_PATTERN)
+    expected = vectorizer.fit_transform(cleaned.tolist())
+    assert dtm.vocab.tolist() == vectorizer.get_feature_names_out().tolist()
+    assert (dtm.matrix != expected).nnz == 0
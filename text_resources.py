@@ -0,0 +1,48 @@
+import re
+from functools import lru_cache
+from typing import Iterable
+
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+# --- 상수 정의 ---
+CLEAN_PATTERN = r'[^가-힣a-zA-Z\s]'    # 한글/영문/공백 외 문자 제거
+TOKEN_PATTERN = r'(?u)\b\w\w+\b'       # CountVectorizer 기본값: 두 글자 이상 단어
+
+# 💡 기본 불용어 목록 레지스트리 (CountVectorizer(stop_words='english')와 같은 목록)
+BASE_STOPWORDS: dict[str | None, frozenset[str]] = {
+    'english': frozenset(ENGLISH_STOP_WORDS),
+    None: frozenset(),
+}
+
+
+@lru_cache(maxsize=128)
+def _cached_stopwords(base: str | None, custom: frozenset[str]) -> frozenset[str]:
+    return BASE_STOPWORDS[base] | custom
+
+
+@lru_cache(maxsize=128)
+def _cached_stopword_tuple(base: str | None, custom: frozenset[str]) -> tuple[str, ...]:
+    return tuple(sorted(_cached_stopwords(base, custom)))
+
+
+def get_stopwords(custom: Iterable[str] = (), base: str | None = 'english') -> frozenset[str]:
+    """
+    기본 불용어(base) + 사용자 정의 불용어(custom)의 합집합을 frozenset으로 반환합니다.
+    (base, custom) 조합별로 LRU 캐시되므로 반복 호출 시 다시 만들지 않습니다.
+    """
+    return _cached_stopwords(base, frozenset(custom))
+
+
+def get_stopword_list(custom: Iterable[str] = (), base: str | None = 'english') -> list[str]:
+    """CountVectorizer(stop_words=...)에 넘길 정렬된 불용어 리스트를 반환합니다. (캐시된 튜플의 복사본)"""
+    return list(_cached_stopword_tuple(base, frozenset(custom)))
+
+
+@lru_cache(maxsize=64)
+def get_regex(pattern: str, flags: int = 0) -> re.Pattern:
+    """정규표현식을 한 번만 컴파일하여 재사용합니다."""
+    return re.compile(pattern, flags)
+
+
+CLEAN_REGEX = get_regex(CLEAN_PATTERN)
+TOKEN_REGEX = get_regex(TOKEN_PATTERN)
@@ -0,0 +1,232 @@
+import os
+from collections import Counter
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+from cache_utils import file_fingerprint
+from fast_tokenizer import clean_texts, filter_tokens
+from netflix_data import read_netflix_csv
+from text_resources import CLEAN_REGEX, TOKEN_REGEX, get_stopwords
+
+# --- 상수 정의 ---
+DTM_SUFFIX = '.dtm.npz'
+
+# 💡 같은 프로세스에서는 문서-단어 행렬을 한 번만 읽도록 메모리에 보관
+_DTM_MEMO: dict[str, 'DocumentTermMatrix'] = {}
+
+
+def counts_to_word_df(counts: Counter) -> pd.DataFrame:
+    """단어 빈도 Counter를 analyze_word_frequency와 같은 형태(word, freq 내림차순)로 변환합니다."""
+    words = sorted(counts)
+    return pd.DataFrame({
+        'word': words,
+        'freq': [counts[word] for word in words]
+    }).sort_values(by='freq', ascending=False, kind='stable')
+
+
+def analyze_word_frequency_stream(
+    chunks: Iterable[pd.DataFrame],
+    text_col: str,
+    custom_stopwords: set[str],
+    keep_text: bool = False
+) -> tuple[pd.DataFrame, str | None]:
+    """
+    DataFrame 청크 반복자(예: pd.read_csv(..., chunksize=...))를 받아 단어 빈도를 누적 계산합니다.
+    한 번에 한 청크만 메모리에 올리므로, 전체 코퍼스가 메모리보다 커도 처리할 수 있습니다.
+    keep_text=True일 때만 정제된 전체 텍스트(text_clean)를 함께 반환합니다. (아니면 None)
+    """
+    # 💡 토큰화 + 불용어 제거 규칙은 analyze_word_frequency의 CountVectorizer와 동일 (translate + split 단일 순회)
+    stopwords = get_stopwords(custom_stopwords)
+    counts: Counter = Counter()
+    clean_parts: list[str] = []
+
+    for chunk in chunks:
+        texts = chunk[text_col].dropna().tolist()
+        if not texts:
+            continue
+        chunk_clean = clean_texts(texts)
+        counts.update(filter_tokens(chunk_clean.split(), stopwords))
+        if keep_text:
+            clean_parts.append(chunk_clean)
+
+    text_clean = ' '.join(clean_parts) if keep_text else None
+    return counts_to_word_df(counts), text_clean
+
+
+class WordFrequency:
+    """
+    CountVectorizer 결과(희소 행렬)에서 0이 아닌 단어 빈도만 보관하는 객체.
+    상위 N개는 부분 선택(partition)으로 구하고, 전체 정렬 표는 요청할 때 한 번만 만듭니다.
+    """
+
+    def __init__(self, words: np.ndarray, freqs: np.ndarray, vocab_ids: np.ndarray):
+        self.words = words            # 0이 아닌 빈도를 가진 단어 (어휘 순서)
+        self.freqs = freqs
+        self.vocab_ids = vocab_ids    # 원래 어휘 번호 (DataFrame 인덱스로 사용)
+        self._sorted_df: pd.DataFrame | None = None
+
+    @classmethod
+    def from_matrix(cls, word_matrix: sparse.spmatrix, feature_names: np.ndarray) -> 'WordFrequency':
+        """문서-단어 희소 행렬의 data/indices 배열만으로 단어별 총 빈도를 계산합니다. (toarray() 없음)"""
+        csr = sparse.csr_matrix(word_matrix)
+        # 💡 열 번호별 합계를 bincount 한 번으로 계산 (indices 정렬 없이 O(nnz + V))
+        totals = np.bincount(csr.indices, weights=csr.data, minlength=csr.shape[1]).astype(np.int64)
+        vocab_ids = np.flatnonzero(totals)
+        return cls(np.asarray(feature_names)[vocab_ids], totals[vocab_ids], vocab_ids)
+
+    def __len__(self) -> int:
+        return len(self.freqs)
+
+    def _frame(self, positions: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(
+            {'word': self.words[positions], 'freq': self.freqs[positions]},
+            index=self.vocab_ids[positions]
+        )
+
+    def top(self, n: int) -> pd.DataFrame:
+        """
+        빈도 상위 n개 단어를 내림차순 DataFrame으로 반환합니다.
+        전체 정렬 대신 n번째 빈도(임계값)만 부분 선택으로 찾으므로 O(V)에 가깝습니다.
+        동점은 어휘 순서로 정렬하여 to_frame().head(n)과 같은 결과를 냅니다.
+        """
+        if n >= len(self):
+            return self.to_frame()
+        if n <= 0:
+            return self._frame(np.empty(0, dtype=np.int64))
+
+        kth = len(self) - n
+        threshold = np.partition(self.freqs, kth)[kth]
+        above = np.flatnonzero(self.freqs > threshold)
+        ties = np.flatnonzero(self.freqs == threshold)[: n - len(above)]
+        positions = np.concatenate([above, ties])
+        positions = positions[np.lexsort((positions, -self.freqs[positions]))]
+        return self._frame(positions)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        전체 단어 빈도 표(freq 내림차순)를 반환합니다. 정렬은 처음 호출할 때만 하고,
+        호출자가 결과를 수정해도 이후 결과가 바뀌지 않도록 매번 복사본을 돌려줍니다.
+        """
+        if self._sorted_df is None:
+            positions = np.argsort(-self.freqs, kind='stable')
+            self._sorted_df = self._frame(positions)
+        return self._sorted_df.copy()
+
+    def to_dict(self) -> dict[str, int]:
+        """WordCloud.generate_from_frequencies에 바로 넘길 수 있는 {단어: 빈도} 딕셔너리 (정렬 불필요)."""
+        return dict(zip(self.words.tolist(), self.freqs.tolist()))
+
+
+class DocumentTermMatrix:
+    """
+    텍스트 컬럼의 각 행을 한 번만 벡터화한 N×V 희소 행렬 (행 = DataFrame 인덱스 순서).
+    불용어는 조회할 때 열(단어) 마스크로 제외하므로, 하나의 행렬로 여러 불용어 조합을 처리합니다.
+    국가·장르·연도 등 임의의 부분집합 빈도는 해당 행들의 희소 행 합(row-sum)으로 구합니다.
+    """
+
+    def __init__(self, matrix: sparse.csr_matrix, vocab: np.ndarray, index: pd.Index):
+        self.matrix = matrix
+        self.vocab = vocab
+        self.index = index
+        self._keep_masks: dict[frozenset[str], np.ndarray] = {}
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, text_col: str) -> 'DocumentTermMatrix':
+        """analyze_word_frequency와 같은 정제(특수문자 제거, 소문자) 후 행 단위로 벡터화합니다."""
+        texts = df[text_col].fillna('').astype(str).str.replace(CLEAN_REGEX, ' ', regex=True).str.lower()
+        # 💡 token_pattern 문자열 대신 캐시된 정규식의 findall을 넘겨 같은 패턴을 다시 컴파일하지 않음
+        vectorizer = CountVectorizer(tokenizer=TOKEN_REGEX.findall, token_pattern=None)
+        matrix = vectorizer.fit_transform(texts.tolist()).tocsr()
+        return cls(matrix, vectorizer.get_feature_names_out(), df.index)
+
+    def _positions(self, rows: pd.Series | pd.Index | np.ndarray | None) -> np.ndarray | None:
+        """불리언 마스크(Series/배열) 또는 인덱스 라벨 목록을 행렬의 행 번호로 변환합니다."""
+        if rows is None:
+            return None
+        if isinstance(rows, pd.Series) and rows.dtype == bool:
+            return np.flatnonzero(rows.reindex(self.index, fill_value=False).to_numpy())
+        if isinstance(rows, np.ndarray) and rows.dtype == bool:
+            return np.flatnonzero(rows)
+        positions = self.index.get_indexer(pd.Index(rows))
+        if (positions < 0).any():
+            raise KeyError("문서-단어 행렬에 없는 인덱스가 포함되어 있습니다.")
+        return positions
+
+    def _keep_mask(self, custom_stopwords: Iterable[str], base: str | None) -> np.ndarray:
+        """불용어가 아닌 단어(열)만 True인 마스크. 불용어 조합별로 한 번만 계산합니다."""
+        stopwords = get_stopwords(custom_stopwords, base)
+        if stopwords not in self._keep_masks:
+            self._keep_masks[stopwords] = np.fromiter(
+                (word not in stopwords for word in self.vocab.tolist()), dtype=bool, count=len(self.vocab)
+            )
+        return self._keep_masks[stopwords]
+
+    def frequencies(
+        self,
+        rows: pd.Series | pd.Index | np.ndarray | None = None,
+        custom_stopwords: Iterable[str] = (),
+        base: str | None = 'english'
+    ) -> WordFrequency:
+        """
+        선택한 행(rows)의 단어 빈도를 재토큰화 없이 희소 행 합으로 계산합니다.
+        rows: load_and_filter_data 결과의 .index, 불리언 마스크, 또는 None(전체).
+        """
+        positions = self._positions(rows)
+        subset = self.matrix if positions is None else self.matrix[positions]
+        freq = WordFrequency.from_matrix(subset, self.vocab)
+        keep = self._keep_mask(custom_stopwords, base)[freq.vocab_ids]
+        return WordFrequency(freq.words[keep], freq.freqs[keep], freq.vocab_ids[keep])
+
+    def save(self, path: str, fingerprint: dict[str, int]) -> None:
+        """행렬·어휘·행 인덱스와 CSV 캐시 키를 npz 파일 하나로 저장합니다."""
+        np.savez(
+            path,
+            data=self.matrix.data, indices=self.matrix.indices, indptr=self.matrix.indptr,
+            shape=np.array(self.matrix.shape), vocab=self.vocab.astype(str),
+            index=self.index.to_numpy(),
+            mtime_ns=np.array(fingerprint['mtime_ns']), size=np.array(fingerprint['size'])
+        )
+
+    @classmethod
+    def load(cls, path: str, fingerprint: dict[str, int]) -> 'DocumentTermMatrix | None':
+        """저장된 행렬을 읽습니다. CSV 캐시 키가 다르면(=CSV 변경) None을 반환합니다."""
+        with np.load(path) as data:
+            if int(data['mtime_ns']) != fingerprint['mtime_ns'] or int(data['size']) != fingerprint['size']:
+                return None
+            matrix = sparse.csr_matrix(
+                (data['data'], data['indices'], data['indptr']), shape=tuple(data['shape'])
+            )
+            return cls(matrix, data['vocab'], pd.Index(data['index']))
+
+
+def load_document_term_matrix(file_path: str, text_col: str) -> DocumentTermMatrix:
+    """
+    CSV 파일 전체의 문서-단어 행렬을 반환합니다. CSV 옆의 npz 캐시가 최신이면 그것을 읽고,
+    아니면 새로 벡터화하여 저장합니다. (행 인덱스는 read_netflix_csv 결과와 일치)
+    """
+    fingerprint = file_fingerprint(file_path)
+    memo_key = f"{os.path.abspath(file_path)}:{text_col}:{fingerprint['mtime_ns']}:{fingerprint['size']}"
+    if memo_key in _DTM_MEMO:
+        return _DTM_MEMO[memo_key]
+
+    dtm_path = f'{file_path}.{text_col}{DTM_SUFFIX}'
+    dtm = None
+    if os.path.exists(dtm_path):
+        try:
+            dtm = DocumentTermMatrix.load(dtm_path, fingerprint)
+        except (OSError, ValueError, KeyError):
+            dtm = None
+
+    if dtm is None:
+        dtm = DocumentTermMatrix.build(read_netflix_csv(file_path, usecols=[text_col]), text_col)
+        try:
+            dtm.save(dtm_path, fingerprint)
+        except OSError as e:
+            print(f"🚨 경고: 문서-단어 행렬 캐시를 저장하지 못했습니다 ({e}).")
+
+    _DTM_MEMO[memo_key] = dtm
+    return dtm
@@ -0,0 +1,331 @@
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from random import Random
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+from wordcloud import WordCloud
+from wordcloud.wordcloud import FONT_PATH
+
+from cache_utils import file_fingerprint
+
+# --- 상수 정의 ---
+LAYOUT_CACHE_DIR = '.wordcloud_cache'
+# 💡 배치 결과(layout_)에 영향을 주는 WordCloud 설정값 (캐시 키에 포함)
+LAYOUT_PARAMS = [
+    'width', 'height', 'max_words', 'margin', 'prefer_horizontal', 'scale', 'min_font_size',
+    'max_font_size', 'font_step', 'relative_scaling', 'repeat', 'font_path', 'contour_width',
+]
+# 💡 layout_에는 단어별 색상도 들어 있으므로 색상 관련 설정도 캐시 키에 포함
+COLOR_PARAMS = ['color_func', 'colormap', 'mode']
+MASK_CACHE_SUFFIX = '.mask.npy'
+MASK_META_SUFFIX = '.mask.meta.json'
+
+# 💡 같은 프로세스에서 같은 마스크를 여러 워드 클라우드가 공유하도록 메모리에 보관
+_MASK_MEMO: dict[str, np.ndarray] = {}
+
+
+def _json_default(value):
+    """NumPy 스칼라(np.int64, np.float32 등)는 파이썬 숫자로, 그 외는 문자열로 직렬화합니다."""
+    return value.item() if isinstance(value, np.generic) else str(value)
+
+
+def _color_param_key(value) -> object:
+    """
+    색상 함수·컬러맵을 프로세스가 달라도 같은 문자열로 표현합니다. (repr의 메모리 주소를 쓰지 않음)
+    함수는 모듈·이름과 클로저 값(get_single_color_func의 RGB 등)으로, 호출 가능 객체는 클래스와 속성값으로 구분합니다.
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if hasattr(value, '__qualname__'):
+        closure = [getattr(cell.cell_contents, 'name', cell.cell_contents) for cell in value.__closure__ or ()]
+        return json.dumps([value.__module__, value.__qualname__, closure], default=_json_default)
+    if hasattr(value, 'name'):    # matplotlib Colormap
+        return value.name
+    state = {name: _color_param_key(attr) for name, attr in sorted(vars(value).items())}
+    return json.dumps([type(value).__module__, type(value).__qualname__, state], default=_json_default)
+
+
+def layout_cache_key(wordcloud: WordCloud, frequencies: dict[str, float]) -> str | None:
+    """
+    (빈도 딕셔너리, 마스크 바이트, 캔버스 크기, max_words, 시드, 색상 설정 등)의 해시를 캐시 키로 반환합니다.
+    random_state(시드)가 없으면 배치가 재현되지 않으므로 None(캐시 사용 안 함)을 반환합니다.
+    """
+    # 💡 WordCloud는 정수 시드를 random.Random 객체로 바꿔 보관하므로, 그 내부 상태를 키로 사용
+    random_state = wordcloud.random_state
+    if isinstance(random_state, Random):
+        seed_key = hashlib.sha256(repr(random_state.getstate()).encode('utf-8')).hexdigest()
+    elif isinstance(random_state, int):
+        seed_key = str(random_state)
+    else:
+        return None
+
+    digest = hashlib.sha256()
+    params = {name: getattr(wordcloud, name, None) for name in LAYOUT_PARAMS}
+    params.update({name: _color_param_key(getattr(wordcloud, name, None)) for name in COLOR_PARAMS})
+    params['random_state'] = seed_key
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8'))
+    digest.update(json.dumps(sorted(frequencies.items()), ensure_ascii=False, default=_json_default).encode('utf-8'))
+
+    mask = wordcloud.mask
+    if mask is not None:
+        mask = np.ascontiguousarray(mask)
+        digest.update(f'{mask.shape}{mask.dtype}'.encode('utf-8'))
+        digest.update(mask.tobytes())
+    return digest.hexdigest()
+
+
+def _load_layout(path: str) -> tuple[list, dict[str, float]] | None:
+    """JSON으로 저장된 layout_과 words_를 WordCloud가 쓰는 형태(튜플)로 복원합니다."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    layout = [
+        ((word, freq), font_size, tuple(position), orientation, color)
+        for (word, freq), font_size, position, orientation, color in cached['layout']
+    ]
+    return layout, cached['words']
+
+
+def _save_layout(path: str, wordcloud: WordCloud) -> None:
+    """배치 결과를 JSON으로 저장합니다. (NumPy 정수는 파이썬 int로 변환)"""
+    layout = [
+        [[word, float(freq)], int(font_size), [int(position[0]), int(position[1])],
+         None if orientation is None else int(orientation), color]
+        for (word, freq), font_size, position, orientation, color in wordcloud.layout_
+    ]
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'layout': layout, 'words': wordcloud.words_}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"🚨 경고: 워드 클라우드 배치 캐시를 저장하지 못했습니다 ({e}).")
+
+
+def generate_from_frequencies_cached(
+    wordcloud: WordCloud,
+    frequencies: dict[str, float],
+    cache_dir: str = LAYOUT_CACHE_DIR
+) -> WordCloud:
+    """
+    WordCloud.generate_from_frequencies와 같지만, 같은 입력의 배치(layout_)가 디스크에 있으면
+    비싼 배치 탐색을 건너뛰고 저장된 배치를 그대로 사용합니다. (이후 recolor/to_image 가능)
+    """
+    key = layout_cache_key(wordcloud, frequencies)
+    if key is None:
+        return wordcloud.generate_from_frequencies(frequencies)
+
+    path = os.path.join(cache_dir, f'{key}.json')
+    cached = _load_layout(path) if os.path.exists(path) else None
+    if cached is not None:
+        wordcloud.layout_, wordcloud.words_ = cached
+        return wordcloud
+
+    wordcloud.generate_from_frequencies(frequencies)
+    _save_layout(path, wordcloud)
+    return wordcloud
+
+
+def generate_cached(wordcloud: WordCloud, text: str, cache_dir: str = LAYOUT_CACHE_DIR) -> WordCloud:
+    """WordCloud.generate(text)의 캐시 버전. 텍스트 → 빈도 변환은 그대로 하고 배치만 캐시합니다."""
+    return generate_from_frequencies_cached(wordcloud, wordcloud.process_text(text), cache_dir)
+
+
+def binarize_mask(image: np.ndarray, canvas_size: tuple[int, int] | None = None) -> np.ndarray:
+    """
+    RGB(또는 흑백) 마스크 이미지를 WordCloud 규칙대로 이진화합니다: 모든 채널이 255(흰색)이면 255, 아니면 0.
+    canvas_size=(width, height)를 주면 최근접 보간으로 크기를 맞춥니다. 결과는 2차원 uint8 배열입니다.
+    """
+    if image.ndim == 3:
+        masked_out = np.all(image[:, :, :3] == 255, axis=-1)
+    else:
+        masked_out = image == 255
+    binary = np.where(masked_out, 255, 0).astype(np.uint8)
+
+    if canvas_size is not None and (binary.shape[1], binary.shape[0]) != tuple(canvas_size):
+        binary = np.array(Image.fromarray(binary).resize(tuple(canvas_size), Image.NEAREST))
+    return binary
+
+
+def prepare_mask(
+    mask_path: str,
+    canvas_size: tuple[int, int] | None = None,
+    use_cache: bool = True
+) -> np.ndarray:
+    """
+    마스크 이미지를 이진화된 uint8 배열로 반환합니다. 결과는 이미지 옆의 .npy 파일에 캐시되며,
+    캐시가 최신이면 디코딩·임계값 처리 없이 메모리 매핑(mmap)으로 읽습니다.
+    (이미지 파일이 없으면 FileNotFoundError)
+    """
+    cache_key = {
+        **file_fingerprint(mask_path),
+        'canvas_size': list(canvas_size) if canvas_size is not None else None,
+    }
+    memo_key = json.dumps([os.path.abspath(mask_path), cache_key])
+    if memo_key in _MASK_MEMO:
+        return _MASK_MEMO[memo_key]
+
+    cache_path, meta_path = mask_path + MASK_CACHE_SUFFIX, mask_path + MASK_META_SUFFIX
+    mask = None
+    if use_cache and os.path.exists(cache_path) and os.path.exists(meta_path):
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                if json.load(f) == cache_key:
+                    mask = np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            mask = None
+
+    if mask is None:
+        with Image.open(mask_path) as image:
+            mask = binarize_mask(np.array(image), canvas_size)
+        if use_cache:
+            try:
+                np.save(cache_path, mask)
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(cache_key, f)
+            except OSError as e:
+                print(f"🚨 경고: 마스크 캐시를 저장하지 못했습니다 ({e}).")
+
+    _MASK_MEMO[memo_key] = mask
+    return mask
+
+
+def render_wordcloud_figure(
+    wordcloud: WordCloud,
+    title: str,
+    filename: str,
+    dpi: int = 300,
+    figsize: tuple[float, float] = (15, 6)
+) -> None:
+    """
+    save_wordcloud_image_final과 같은 모양(굵은 serif 제목, 축 없음, bbox_inches='tight')으로 PNG를 저장합니다.
+    pyplot 전역 상태 대신 Figure + Agg 캔버스를 직접 사용하므로, 화면 없이 여러 프로세스에서 동시에 실행할 수 있습니다.
+    """
+    # 💡 렌더링할 때만 matplotlib을 불러옴 (Agg 백엔드 객체 API, plt.show 없음)
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    fig.suptitle(title, fontweight='bold', fontfamily='serif', fontsize=18)
+    ax = fig.add_subplot()
+    ax.imshow(wordcloud, interpolation='bilinear')
+    ax.axis('off')
+    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+
+
+def _render_job(wordcloud: WordCloud, title: str, filename: str, dpi: int) -> dict:
+    """워커 프로세스에서 한 장을 렌더링하고 소요 시간을 기록합니다."""
+    start = time.perf_counter()
+    render_wordcloud_figure(wordcloud, title, filename, dpi=dpi)
+    return {'filename': filename, 'seconds': time.perf_counter() - start, 'error': None}
+
+
+def render_wordclouds_parallel(
+    jobs: list[tuple[WordCloud, str, str]],
+    max_workers: int | None = None,
+    dpi: int = 300
+) -> list[dict]:
+    """
+    (WordCloud, 제목, 파일명) 작업 목록을 워커 프로세스 풀에서 병렬로 렌더링합니다.
+    동시 실행 수는 max_workers(기본: CPU 수와 작업 수 중 작은 값)로 제한됩니다.
+    반환: 작업 순서대로 {'filename', 'seconds', 'error'} 딕셔너리 목록 (실패한 작업은 error에 메시지)
+    """
+    if not jobs:
+        return []
+    max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    results: list[dict | None] = [None] * len(jobs)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_render_job, wordcloud, title, filename, dpi): i
+            for i, (wordcloud, title, filename) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+                print(f"✅ '{results[i]['filename']}' 저장 완료 ({results[i]['seconds']:.2f}초)")
+            except Exception as e:
+                results[i] = {'filename': jobs[i][2], 'seconds': None, 'error': str(e)}
+                print(f"🚨 '{jobs[i][2]}' 렌더링 중 오류가 발생했습니다: {e}")
+    return results
+
+
+@lru_cache(maxsize=1)
+def _default_title_font_path() -> str:
+    """제목용 굵은 serif 폰트 경로 (matplotlib의 DejaVu Serif Bold, 없으면 WordCloud 기본 폰트)."""
+    try:
+        from matplotlib import font_manager
+        return font_manager.findfont(
+            font_manager.FontProperties(family='serif', weight='bold'), fallback_to_default=True
+        )
+    except ImportError:
+        return FONT_PATH
+
+
+def export_wordcloud_image(
+    wordcloud: WordCloud,
+    title: str | None,
+    filename: str,
+    compress_level: int = 6,
+    title_size: int | None = None,
+    title_font_path: str | None = None,
+    background_color: str = 'white'
+) -> None:
+    """
+    matplotlib을 거치지 않고 wordcloud.to_array() 비트맵을 그대로 PNG/WebP로 저장합니다.
+    제목은 PIL로 이미지 위쪽 여백에 그립니다. (리샘플링 없이 원본 해상도 그대로)
+    compress_level: PNG는 zlib 압축 수준(0~9), WebP는 무손실 압축 method(0~6)로 사용합니다.
+    """
+    image = Image.fromarray(wordcloud.to_array())
+
+    if title:
+        title_size = title_size or max(18, image.width // 40)
+        font = ImageFont.truetype(title_font_path or _default_title_font_path(), title_size)
+        left, top, right, bottom = font.getbbox(title)
+        padding = title_size // 2
+        band_height = (bottom - top) + padding * 2
+
+        canvas = Image.new(image.mode, (image.width, image.height + band_height), background_color)
+        canvas.paste(image, (0, band_height))
+        draw = ImageDraw.Draw(canvas)
+        draw.text(((image.width - (right - left)) // 2 - left, padding - top), title, fill='black', font=font)
+        image = canvas
+
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.webp':
+        image.save(filename, format='WEBP', lossless=True, method=min(max(compress_level, 0), 6))
+    else:
+        image.save(filename, format='PNG', compress_level=min(max(compress_level, 0), 9))
+
+
+def placeholder_color_func(*args, **kwargs) -> str:
+    """
+    assign_layout_colors로 색을 한꺼번에 칠할 WordCloud에 넘기는 고정 색상 함수.
+    WordCloud는 배치 중 단어마다 color_func를 호출하므로, 난수·색상 계산이 없는 가장 가벼운 콜백을 사용합니다.
+    """
+    return 'black'
+
+
+def assign_layout_colors(wordcloud: WordCloud, colors: list[str], seed: int | None = None) -> WordCloud:
+    """
+    배치가 끝난(또는 캐시에서 복원한) 레이아웃 전체에 색상을 한 번에 지정합니다.
+    단어마다 color_func를 호출하는 대신 NumPy 난수 생성기(seed)로 색상 번호를 한꺼번에 뽑으므로,
+    같은 seed면 어느 프로세스에서 렌더링해도 같은 이미지가 나옵니다.
+    """
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(len(colors), size=len(wordcloud.layout_))
+    wordcloud.layout_ = [
+        (word_freq, font_size, position, orientation, colors[pick])
+        for (word_freq, font_size, position, orientation, _), pick in zip(wordcloud.layout_, picks.tolist())
+    ]
+    return wordcloud
@@ -2,6 +2,8 @@ from sklearn.feature_extraction.text import CountVectorizer
 import pandas as pd
 import numpy as np
 
+from word_frequency import WordFrequency
+
 def extract_word_frequency(text: str) -> pd.DataFrame:
     """
     단일 텍스트에서 단어 빈도를 추출하여 DataFrame으로 반환합니다.
@@ -13,15 +15,12 @@ def extract_word_frequency(text: str) -> pd.DataFrame:
     # 2. 텍스트 변환: 희소 행렬 생성
     word_matrix = vectorizer.fit_transform([text])
     
-    # 3. 데이터 변환: 희소 행렬을 1차원 배열로 변환 (핵심: toarray().flatten())
-    # word_freq는 모든 단어의 빈도수를 순서대로 담은 1차원 배열입니다.
-    word_freq = word_matrix.toarray().flatten()
+    # 3. 데이터 변환: 희소 행렬의 data/indices 배열에서 바로 빈도 추출 (toarray() 불필요)
+    # word_freq는 빈도가 0이 아닌 단어와 빈도수만 담고 있습니다.
+    word_freq = WordFrequency.from_matrix(word_matrix, vectorizer.get_feature_names_out())
     
-    # 4. 결과 DataFrame 생성
-    word_df = pd.DataFrame({
-        'word': vectorizer.get_feature_names_out(),
-        'freq': word_freq
-    }).sort_values(by='freq', ascending=False)
+    # 4. 결과 DataFrame 생성 (freq 내림차순)
+    word_df = word_freq.to_frame()
     
     return word_df
 
@@ -1,38 +1,28 @@
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
-import matplotlib.font_manager as fm
 import sys  # 🔧 exit() 대신 sys.exit() 사용 (더 안전함)
 
+from count_cube import load_count_cube    # 💡 HeartDisease × 범주형 컬럼 빈도 큐브
+from stacked_plot import StackedProportionChart    # 💡 재사용 누적 비율 막대 차트
+
 # ==============================================================================
 # 1. 환경 설정: Matplotlib 한글 폰트 설정
 # ------------------------------------------------------------------------------
-font_path = 'C:/Windows/Fonts/malgun.ttf'  # Windows 기본 폰트 경로
-try:
-    font_name = fm.FontProperties(fname=font_path).get_name()
-    plt.rc('font', family=font_name)
-    plt.rcParams['axes.unicode_minus'] = False
-except FileNotFoundError:
-    print("⚠️ 경고: 'Malgun Gothic' 폰트를 찾을 수 없습니다. 그래프에 한글이 깨질 수 있습니다.")
+# 💡 'C:/Windows/Fonts/malgun.ttf' 하드코딩 대신, StackedProportionChart가 setup_korean_font()로
+#    OS별 한글 폰트를 찾아 설정 (선택 결과는 캐시되어 다음 실행부터는 폰트를 다시 검색하지 않음)
 # ==============================================================================
 
 
 # 2. 데이터 로드 및 비율 계산
+# 💡 groupby().apply(lambda) 대신: 범주 코드 + np.bincount 한 번으로 만든 빈도 큐브에서 비율표를 잘라냄
 try:
-    heart = pd.read_csv('heart.csv')
+    cube = load_count_cube('heart.csv')
 except FileNotFoundError:
     print("🚨 heart.csv 파일을 찾을 수 없습니다. 경로를 확인해 주세요.")
     sys.exit(1)  # 🔧 exit() 대신 sys.exit 사용
 
 
-# a. HeartDisease와 ChestPainType 별 빈도 계산
-cp_counts = heart.groupby(['HeartDisease', 'ChestPainType']).size()
-
-# b. HeartDisease 그룹 내부 비율 계산
-cp_proportions = cp_counts.groupby(level=0).apply(lambda x: x / x.sum() * 100)
-
-# c. ChestPainType을 컬럼으로 변환
-cp_ratio_for_plot = cp_proportions.unstack(level=1)
+# a~c. HeartDisease 그룹 내부 ChestPainType 비율 (행: HeartDisease, 열: ChestPainType)
+cp_ratio_for_plot = cube.proportions('HeartDisease', 'ChestPainType')
 
 # 3. 데이터 순서 정리 (KeyError 방지)
 order = ["ASY", "NAP", "ATA", "TA"]
@@ -41,50 +31,20 @@ cp_ratio_for_plot.columns.name = None
 
 
 # ==============================================================================
-# 4. 시각화 (Stacked Bar Plot)
-# ------------------------------------------------------------------------------
-fig, ax = plt.subplots(figsize=(10, 6))
-
-cp_ratio_for_plot.plot(
-    kind='bar',
-    stacked=True,
-    ax=ax,
-    color=sns.color_palette('viridis', n_colors=len(order)),
-    width=0.7
-)
-
-# 🔧 Critical Path Fix: X축 눈금 수동 지정
-ax.set_xticks([0, 1])
-ax.set_xticklabels(['정상 (0)', '심장병 (1)'], rotation=0, fontsize=11)
-
-ax.set_ylabel('흉통 유형 비율 (%)', fontsize=13)
-ax.set_xlabel('심장병 유무', fontsize=13)
-ax.set_yticks(range(0, 101, 20))
-
-
-# ==============================================================================
-# 5. 비율 텍스트 추가
-# ------------------------------------------------------------------------------
-for i, col in enumerate(cp_ratio_for_plot.columns):
-    y_offset = 0
-    for j, val in enumerate(cp_ratio_for_plot[col]):
-        if val > 5:
-            ax.text(j,
-                    y_offset + val / 2,
-                    f'{val:.1f}%',
-                    ha='center', va='center',
-                    fontsize=9, color='white', fontweight='bold')
-        y_offset += val
-
-
-# ==============================================================================
-# 6. 제목 및 범례
+# 4~6. 시각화 (Stacked Bar Plot) + 비율 텍스트 + 제목 및 범례
 # ------------------------------------------------------------------------------
-plt.suptitle(
-    '심장병 유무에 따른 흉통 유형별 비율 분석',
-    fontsize=16, fontweight='bold', color='darkslategray'
+# 💡 막대·범례·제목을 가진 차트 템플릿에 비율표만 넘겨 갱신하고,
+#    칸별 ax.text 이중 루프 대신 컨테이너 단위 bar_label로 비율 텍스트를 붙임 (5% 이하 칸은 생략)
+fig = plt.figure(figsize=(10, 6))
+chart = StackedProportionChart(*cp_ratio_for_plot.shape, figure=fig)
+chart.update(
+    cp_ratio_for_plot,
+    title='심장병 유무에 따른 흉통 유형별 비율 분석',
+    xlabel='심장병 유무',
+    ylabel='흉통 유형 비율 (%)',
+    legend_title='흉통 유형',
+    xticklabels=['정상 (0)', '심장병 (1)']
 )
-plt.legend(title='흉통 유형', loc='upper right', fontsize=9, title_fontsize=10)
 
 
 # ==============================================================================
@@ -1,50 +1,136 @@
+import json
+import os
+
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib import font_manager, rc
 import platform
 
+# 💡 선택된 폰트 경로를 저장하는 캐시 파일 (matplotlib 캐시 폴더에 저장)
+FONT_CACHE_FILE = os.path.join(matplotlib.get_cachedir(), 'korean_font_cache.json')
+
+
+def _font_directories() -> list[str]:
+    """플랫폼별 시스템/사용자 폰트 폴더 목록 (findSystemFonts가 검색하는 위치)."""
+    if platform.system() == 'Windows':
+        return [
+            os.path.join(os.environ.get('WINDIR', 'C:/Windows'), 'Fonts'),
+            os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts'),
+        ]
+    return [*font_manager.X11FontDirectories, *font_manager.OSXFontDirectories]
+
+
+def _font_dirs_signature() -> list[list]:
+    """
+    폰트 폴더와 그 아래 모든 하위 폴더의 수정 시각 목록. 폴더의 mtime은 바로 안의 파일이 추가·삭제될 때 바뀌므로,
+    기존 하위 폴더(예: truetype/nanum/)에 폰트를 설치·삭제해도 값이 바뀌어 캐시가 무효화됩니다.
+    (폰트 파일마다 stat하지 않고 폴더만 확인하므로 검색보다 훨씬 가볍습니다)
+    """
+    signature = []
+    for font_dir in _font_directories():
+        if not os.path.isdir(font_dir):
+            continue
+        for dir_path, _, _ in os.walk(font_dir):
+            try:
+                signature.append([dir_path, os.stat(dir_path).st_mtime_ns])
+            except OSError:
+                continue
+    return sorted(signature)
+
+
+def _build_font_index() -> dict[str, str]:
+    """시스템 폰트를 한 번만 검색하여 '정규화된 경로(소문자, 공백 제거) → 실제 경로' 색인을 만듭니다."""
+    return {
+        font.lower().replace(' ', ''): font
+        for font in font_manager.findSystemFonts(fontpaths=None, fontext='ttf')
+    }
+
+
+def _load_font_cache(signature: list[list]) -> dict | None:
+    """캐시된 폰트 선택 결과를 읽습니다. 폰트 폴더가 바뀌었거나 파일이 사라졌으면 None."""
+    try:
+        with open(FONT_CACHE_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('signature') != signature:
+        return None
+    if cached.get('font_path') and not os.path.exists(cached['font_path']):
+        return None
+    return cached
+
+
+def _save_font_cache(signature: list[list], font_name: str, font_path: str | None) -> None:
+    try:
+        os.makedirs(os.path.dirname(FONT_CACHE_FILE), exist_ok=True)
+        with open(FONT_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'signature': signature, 'font_name': font_name, 'font_path': font_path}, f)
+    except OSError as e:
+        print(f"경고: 폰트 캐시를 저장하지 못했습니다 ({e}).")
+
+
 def setup_korean_font():
     """
     시스템에서 사용 가능한 한글 폰트를 찾아 Matplotlib의 기본 폰트로 설정합니다.
     (Windows: Malgun Gothic, Mac: AppleGothic, 그 외: NanumGothic 등)
+    선택 결과는 디스크에 캐시되어, 폰트 폴더가 바뀌지 않는 한 다음 실행(워커 프로세스 포함)에서는 폰트를 다시 검색하지 않습니다.
     """
-    
+
     # 폰트 우선순위 설정 (시스템에 있을 확률이 높은 순)
     # *HYGothic-Medium, Malgun Gothic은 Windows에 주로 존재
     # *NanumGothic은 Jupyter/Colab/Linux에서 가장 흔함
     # *AppleGothic은 Mac OS에 존재
     font_preferences = ['Malgun Gothic', 'HYGothic-Medium', 'NanumGothic', 'AppleGothic', 'DejaVu Sans']
     selected_font = 'DejaVu Sans'
-    
+
     # 1. Matplotlib 설정 초기화 및 마이너스 부호 설정
     plt.rcParams['axes.unicode_minus'] = False
-    
-    # 2. 시스템 폰트 검색 및 설정
+
+    # 2. 캐시 확인: 폰트 폴더가 그대로라면 이전에 선택한 폰트를 바로 사용
+    signature = _font_dirs_signature()
+    cached = _load_font_cache(signature)
+    if cached is not None and cached.get('font_path'):
+        try:
+            font_manager.fontManager.addfont(cached['font_path'])
+            rc('font', family=cached['font_name'])
+            print(f"✅ Matplotlib 한글 폰트가 '{cached['font_name']}'으로 설정되었습니다. (캐시)")
+            return cached['font_name']
+        except Exception as e:
+            print(f"경고: 캐시된 폰트 '{cached['font_name']}' 로딩 실패 ({e}). 폰트를 다시 검색합니다.")
+            cached = None
+
+    # 3. 시스템 폰트 검색 및 설정 (캐시에 '한글 폰트 없음'이 기록되어 있으면 검색 생략)
+    # 💡 findSystemFonts()는 한 번만 호출하고, 정규화된 경로 색인에서 선호 폰트를 찾음
+    font_index = _build_font_index() if cached is None else {}
     for preferred_font in font_preferences:
         font_path = None
-        # 폰트 파일 경로 검색
-        for font in font_manager.findSystemFonts(fontpaths=None, fontext='ttf'):
-            # 폰트 이름에 선호 폰트 이름이 포함되어 있는지 확인
-            if preferred_font.lower().replace(' ', '') in font.lower().replace(' ', ''):
-                font_path = font
+        # 폰트 이름에 선호 폰트 이름이 포함되어 있는지 확인
+        preferred_key = preferred_font.lower().replace(' ', '')
+        for normalized_path, path in font_index.items():
+            if preferred_key in normalized_path:
+                font_path = path
                 selected_font = preferred_font
                 break
-        
+
         if font_path:
             # 폰트 경로를 Matplotlib에 추가하고 기본 폰트로 설정
             try:
                 font_manager.fontManager.addfont(font_path)
                 rc('font', family=selected_font)
                 print(f"✅ Matplotlib 한글 폰트가 '{selected_font}'으로 설정되었습니다.")
+                _save_font_cache(signature, selected_font, font_path)
                 return selected_font
             except Exception as e:
                 # 폰트 로딩 실패 시 다음 폰트 시도
                 print(f"경고: 폰트 '{selected_font}' 로딩 실패 ({e}). 다음 폰트를 시도합니다.")
                 continue
 
-    # 3. 모든 폰트 검색 실패 시
+    # 4. 모든 폰트 검색 실패 시
+    if cached is None:
+        _save_font_cache(signature, 'DejaVu Sans', None)
     rc('font', family='DejaVu Sans')
     print(f"경고: 한글 폰트({', '.join(font_preferences)})를 찾을 수 없어 기본 폰트(DejaVu Sans)로 설정되었습니다. 한글이 깨질 수 있습니다.")
     return 'DejaVu Sans'
 
 # 함수 사용 예시:
-# setup_korean_font()
\ No newline at end of file
+# setup_korean_font()